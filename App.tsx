@@ -8,7 +8,7 @@ import React, { useEffect, useState } from 'react';
 import { StatusBar } from 'expo-status-bar';
 import { View, ActivityIndicator } from 'react-native';
 import { SafeAreaProvider } from 'react-native-safe-area-context';
-import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
+import { QueryClientProvider } from '@tanstack/react-query';
 import { GestureHandlerRootView } from 'react-native-gesture-handler';
 import { PaperProvider } from 'react-native-paper';
 import * as Font from 'expo-font';
@@ -16,23 +16,12 @@ import RootNavigator from './src/navigation/RootNavigator';
 // TODO: Phase 3에서 재활성화
 // import { paymentService } from './src/services/payment';
 import { initializeI18n } from './src/config/i18n';
+import { queryClient } from './src/config/queryClient';
+import { persistQueryCache, restoreQueryCache } from './src/utils/queryPersistence';
+import { startDonationOutbox } from './src/services/donationOutbox';
 import { theme } from './src/theme';
 import { NetworkStatusBar } from './src/components/common/NetworkStatusBar';
 
-// React Query Client 설정
-const queryClient = new QueryClient({
-  defaultOptions: {
-    queries: {
-      retry: 3, // 3회 재시도
-      staleTime: 1000 * 60 * 5, // 5분
-      gcTime: 1000 * 60 * 10, // 10분 (구 cacheTime)
-    },
-    mutations: {
-      retry: 1, // 1회 재시도
-    },
-  },
-});
-
 export default function App() {
   const [isReady, setIsReady] = useState(false);
 
@@ -42,8 +31,13 @@ export default function App() {
      * 1. Pretendard 폰트 로딩
      * 2. i18n 초기화
      * 3. 결제 서비스 초기화
+     *
+     * 캐시 스냅샷 복원은 폰트/i18n 로딩과 병렬로 진행되어
+     * 첫 화면이 네트워크 응답 없이 마지막 데이터로 렌더링됨
      */
     async function initializeApp() {
+      const cacheRestored = restoreQueryCache(queryClient);
+
       try {
         console.log('[App] Loading Pretendard fonts...');
         await Font.loadAsync({
@@ -63,6 +57,8 @@ export default function App() {
         // await paymentService.initialize();
         // console.log('[App] Payment service initialized');
 
+        await cacheRestored;
+
         setIsReady(true);
       } catch (error) {
         console.error('[App] Failed to initialize app:', error);
@@ -73,10 +69,19 @@ export default function App() {
 
     initializeApp();
 
+    // 리더보드 캐시 변경 시 스냅샷 저장
+    const stopPersisting = persistQueryCache(queryClient);
+
+    // 서버 저장 대기 중인 기부 전송 (연결될 때마다, 지난 실행에서 남은 항목 포함)
+    const stopOutbox = startDonationOutbox();
+
     /**
      * 앱 종료 시 정리
      */
     return () => {
+      stopPersisting();
+      stopOutbox();
+
       // TODO: Phase 3에서 재활성화
       // console.log('[App] Cleaning up payment service...');
       // paymentService.cleanup();
@@ -0,0 +1,169 @@
+/**
+ * i18n 초기화 벤치마크 스크립트
+ *
+ * 모든 로케일을 정적으로 import하던 기존 방식(eager)과
+ * 요청된 로케일만 로딩하는 현재 방식(lazy)의 초기화 시간 / JS 힙 사용량 비교
+ *
+ * 실행 방법: npx tsx scripts/benchmark-i18n.ts [언어코드] [반복횟수]
+ * 예시:      npx tsx scripts/benchmark-i18n.ts en-US 15
+ *
+ * 각 측정은 별도 Node 프로세스에서 수행되어 모듈 캐시/GC 상태가 서로 영향을 주지 않음
+ * (Hermes와 V8의 절대 수치는 다르지만, 두 방식의 상대적인 차이를 비교하는 용도)
+ */
+
+import { spawnSync } from 'child_process';
+
+type Mode = 'eager' | 'lazy';
+
+interface Sample {
+  initMs: number;
+  heapKb: number;
+  loadedLanguages: number;
+}
+
+/**
+ * 기존 방식에서 정적 import 되던 번역 파일 목록
+ */
+const ALL_LOCALE_FILES: Record<string, string> = {
+  'ko-KR': '../src/locales/ko/translation.json',
+  'de-DE': '../src/locales/de-DE/translation.json',
+  'es-US': '../src/locales/es-US/translation.json',
+  'es-ES': '../src/locales/es-ES/translation.json',
+  'en-US': '../src/locales/en-US/translation.json',
+  'en-GB': '../src/locales/en-GB/translation.json',
+  'it-IT': '../src/locales/it-IT/translation.json',
+  'ja-JP': '../src/locales/ja-JP/translation.json',
+  'pt-BR': '../src/locales/pt-BR/translation.json',
+  'pt-PT': '../src/locales/pt-PT/translation.json',
+  'fr-CA': '../src/locales/fr-CA/translation.json',
+  'fr-FR': '../src/locales/fr-FR/translation.json',
+  ko: '../src/locales/ko/translation.json',
+  en: '../src/locales/en/translation.json',
+};
+
+const gc = (): void => {
+  (globalThis as { gc?: () => void }).gc?.();
+};
+
+/**
+ * 자식 프로세스: 한 가지 방식으로 i18next를 초기화하고 결과를 JSON으로 출력
+ */
+async function runChild(mode: Mode, language: string): Promise<void> {
+  const { default: i18next } = await import('i18next');
+  const i18n = i18next.createInstance();
+
+  gc();
+  const heapBefore = process.memoryUsage().heapUsed;
+  const start = process.hrtime.bigint();
+
+  let loadedLanguages: number;
+
+  if (mode === 'eager') {
+    const resources: Record<string, { translation: unknown }> = {};
+    Object.entries(ALL_LOCALE_FILES).forEach(([lng, path]) => {
+      resources[lng] = { translation: require(path) };
+    });
+    loadedLanguages = Object.keys(resources).length;
+
+    await i18n.init({
+      resources,
+      lng: language,
+      fallbackLng: 'ko-KR',
+      interpolation: { escapeValue: false },
+    });
+  } else {
+    const { lazyTranslationBackend, getLoadedLanguages } = await import(
+      '../src/config/i18nResources'
+    );
+
+    await i18n.use(lazyTranslationBackend).init({
+      lng: language,
+      fallbackLng: 'ko-KR',
+      load: 'currentOnly',
+      interpolation: { escapeValue: false },
+    });
+    loadedLanguages = getLoadedLanguages().length;
+  }
+
+  // 실제 사용처처럼 번역 하나 조회
+  i18n.t('main.leaderboard.title');
+
+  const initMs = Number(process.hrtime.bigint() - start) / 1e6;
+  gc();
+  const heapKb = (process.memoryUsage().heapUsed - heapBefore) / 1024;
+
+  const sample: Sample = { initMs, heapKb, loadedLanguages };
+  process.stdout.write(JSON.stringify(sample));
+}
+
+const median = (values: number[]): number => {
+  const sorted = [...values].sort((a, b) => a - b);
+  const mid = Math.floor(sorted.length / 2);
+  return sorted.length % 2 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+};
+
+/**
+ * 부모 프로세스: 방식별로 N번씩 자식 프로세스를 실행하고 중앙값 비교
+ */
+function runParent(language: string, iterations: number): void {
+  console.log(`🌐 i18n 초기화 벤치마크 (언어: ${language}, 반복: ${iterations}회)\n`);
+
+  const results: Record<Mode, Sample[]> = { eager: [], lazy: [] };
+
+  for (let i = 0; i < iterations; i++) {
+    // 실행 순서에 따른 편향을 줄이기 위해 번갈아 실행
+    (['eager', 'lazy'] as Mode[]).forEach(mode => {
+      const child = spawnSync(
+        process.execPath,
+        [...process.execArgv, '--expose-gc', __filename, '--child', mode, language],
+        { encoding: 'utf8' }
+      );
+
+      if (child.status !== 0) {
+        console.error(`❌ ${mode} 실행 실패:\n${child.stderr}`);
+        process.exit(1);
+      }
+
+      results[mode].push(JSON.parse(child.stdout.trim().split('\n').pop() || '{}'));
+    });
+  }
+
+  const summary = (mode: Mode) => ({
+    initMs: median(results[mode].map(s => s.initMs)),
+    heapKb: median(results[mode].map(s => s.heapKb)),
+    loadedLanguages: results[mode][0].loadedLanguages,
+  });
+
+  const eager = summary('eager');
+  const lazy = summary('lazy');
+
+  console.table({
+    'eager (기존: 전체 정적 import)': {
+      '초기화 시간 (ms)': eager.initMs.toFixed(2),
+      'JS 힙 증가 (KB)': eager.heapKb.toFixed(1),
+      '로딩된 로케일 수': eager.loadedLanguages,
+    },
+    'lazy (현재: 요청 로케일만)': {
+      '초기화 시간 (ms)': lazy.initMs.toFixed(2),
+      'JS 힙 증가 (KB)': lazy.heapKb.toFixed(1),
+      '로딩된 로케일 수': lazy.loadedLanguages,
+    },
+  });
+
+  const pct = (before: number, after: number) =>
+    before > 0 ? `${(((before - after) / before) * 100).toFixed(1)}%` : '-';
+
+  console.log(`\n⏱  초기화 시간 감소: ${pct(eager.initMs, lazy.initMs)}`);
+  console.log(`🧠 JS 힙 사용량 감소: ${pct(eager.heapKb, lazy.heapKb)}`);
+}
+
+const args = process.argv.slice(2);
+
+if (args[0] === '--child') {
+  runChild(args[1] as Mode, args[2]).catch(error => {
+    console.error(error);
+    process.exit(1);
+  });
+} else {
+  runParent(args[0] || 'ko-KR', Number(args[1]) || 10);
+}
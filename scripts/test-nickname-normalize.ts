@@ -0,0 +1,92 @@
+/**
+ * 닉네임 정규화 규칙 테스트 스크립트
+ *
+ * 클라이언트 normalizeNickname과 서버 normalize_nickname이 같은 키를 만드는지 확인
+ * (다르면 닉네임 확인 캐시/쿼리 키와 DB 고유 인덱스의 판단이 어긋남)
+ *
+ * 실행 방법: npx tsx scripts/test-nickname-normalize.ts
+ * - 항상: 클라이언트 규칙을 기대값과 비교
+ * - .env에 Supabase 설정이 있으면: 서버 normalize_nickname 결과와도 비교
+ */
+
+import * as dotenv from 'dotenv';
+import { resolve } from 'path';
+import { createClient } from '@supabase/supabase-js';
+import { normalizeNickname } from '../src/utils/nicknameNormalize';
+
+// 환경 변수 로딩
+dotenv.config({ path: resolve(__dirname, '../.env') });
+
+const supabaseUrl = process.env.EXPO_PUBLIC_SUPABASE_URL;
+const supabaseAnonKey = process.env.EXPO_PUBLIC_SUPABASE_ANON_KEY;
+
+// [입력, 기대 정규화 키]
+const cases: [string, string][] = [
+  ['Tester', 'tester'],
+  ['ｔｅｓｔｅｒ', 'tester'], // 전각 영문
+  ['Ｔｅｓｔｅｒ', 'tester'], // 전각 대문자
+  ['\u3000Tester\u3000', 'tester'], // 앞뒤 전각 공백 (NFKC 후 제거)
+  ['  Tester ', 'tester'], // 앞뒤 ASCII 공백
+  ['\u00a0Tester', 'tester'], // NBSP (NFKC → ' ')
+  ['Te\u3000ster', 'te ster'], // 가운데 공백은 유지
+  ['\tTester', '\ttester'], // 탭은 서버 btrim과 같이 유지
+  ['ﾃｽﾀｰ', 'テスター'], // 반각 가나
+  ['천원왕', '천원왕'],
+];
+
+const format = (value: string) => JSON.stringify(value);
+
+async function testNicknameNormalize() {
+  console.log('🔍 닉네임 정규화 규칙 테스트 시작...\n');
+  let failed = 0;
+
+  // 1. 클라이언트 규칙
+  console.log('1️⃣ 클라이언트 normalizeNickname...');
+  for (const [input, expected] of cases) {
+    const actual = normalizeNickname(input);
+    if (actual !== expected) {
+      failed++;
+      console.error(`❌ ${format(input)} → ${format(actual)} (기대값 ${format(expected)})`);
+    }
+  }
+  console.log(failed === 0 ? '✅ 클라이언트 규칙 일치\n' : '');
+
+  // 2. 서버 규칙
+  if (!supabaseUrl || !supabaseAnonKey) {
+    console.log('2️⃣ 서버 normalize_nickname... ⏭️ 환경 변수 미설정으로 건너뜀\n');
+  } else {
+    console.log('2️⃣ 서버 normalize_nickname...');
+    const supabase = createClient(supabaseUrl, supabaseAnonKey);
+    let serverFailed = 0;
+
+    for (const [input] of cases) {
+      const { data, error } = await supabase.rpc('normalize_nickname', { p_nickname: input });
+      if (error) {
+        throw error;
+      }
+
+      const client = normalizeNickname(input);
+      if (data !== client) {
+        serverFailed++;
+        console.error(`❌ ${format(input)}: 서버 ${format(data)} / 클라이언트 ${format(client)}`);
+      }
+    }
+
+    failed += serverFailed;
+    console.log(serverFailed === 0 ? '✅ 서버 규칙과 일치\n' : '');
+  }
+
+  if (failed > 0) {
+    console.error(`❌ ${failed}건 불일치`);
+    process.exit(1);
+  }
+
+  console.log('🎉 모든 테스트 통과!');
+}
+
+// 스크립트 실행
+testNicknameNormalize().catch(error => {
+  console.error('\n❌ 테스트 실패!');
+  console.error('오류 내용:', error.message);
+  process.exit(1);
+});
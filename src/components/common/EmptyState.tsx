@@ -1,5 +1,5 @@
 import React from 'react';
-import { StyleSheet, View, Text } from 'react-native';
+import { StyleSheet, View, Text, TouchableOpacity } from 'react-native';
 import { colors } from '../../theme/colors';
 import { typography } from '../../theme/typography';
 
@@ -10,6 +10,10 @@ interface EmptyStateProps {
   title: string;
   /** 메시지 */
   message: string;
+  /** 액션 버튼 라벨 (onAction과 함께 지정 시 버튼 표시) */
+  actionLabel?: string;
+  /** 액션 버튼 클릭 핸들러 (예: 다시 시도) */
+  onAction?: () => void;
 }
 
 /**
@@ -24,14 +28,28 @@ interface EmptyStateProps {
  *   title="아직 랭커가 없어요"
  *   message="첫 번째로 기부하고\n명예의 전당에 등록하세요!"
  * />
+ *
+ * // 오류 상태 (다시 시도 버튼)
+ * <EmptyState icon="⚠️" title="오류" message="..." actionLabel="다시 시도" onAction={refetch} />
  * ```
  */
-export const EmptyState: React.FC<EmptyStateProps> = ({ icon, title, message }) => {
+export const EmptyState: React.FC<EmptyStateProps> = ({
+  icon,
+  title,
+  message,
+  actionLabel,
+  onAction,
+}) => {
   return (
     <View style={styles.container}>
       <Text style={styles.icon}>{icon}</Text>
       <Text style={styles.title}>{title}</Text>
       <Text style={styles.message}>{message}</Text>
+      {actionLabel && onAction && (
+        <TouchableOpacity style={styles.actionButton} onPress={onAction} activeOpacity={0.8}>
+          <Text style={styles.actionText}>{actionLabel}</Text>
+        </TouchableOpacity>
+      )}
     </View>
   );
 };
@@ -59,4 +77,16 @@ const styles = StyleSheet.create({
     textAlign: 'center',
     lineHeight: 22,
   },
+  actionButton: {
+    marginTop: 20,
+    paddingVertical: 10,
+    paddingHorizontal: 20,
+    borderRadius: 20,
+    borderWidth: 1,
+    borderColor: colors.primary,
+  },
+  actionText: {
+    ...typography.labelLarge,
+    color: colors.primary,
+  },
 });
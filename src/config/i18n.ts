@@ -9,21 +9,7 @@ import { initReactI18next } from 'react-i18next';
 import * as Localization from 'expo-localization';
 import AsyncStorage from '@react-native-async-storage/async-storage';
 import { STORAGE_KEYS } from '../constants/storage';
-
-// 번역 리소스
-import koTranslation from '../locales/ko/translation.json';
-import enTranslation from '../locales/en/translation.json';
-import deTranslation from '../locales/de-DE/translation.json';
-import esUSTranslation from '../locales/es-US/translation.json';
-import esESTranslation from '../locales/es-ES/translation.json';
-import enUSTranslation from '../locales/en-US/translation.json';
-import enGBTranslation from '../locales/en-GB/translation.json';
-import itTranslation from '../locales/it-IT/translation.json';
-import jaTranslation from '../locales/ja-JP/translation.json';
-import ptBRTranslation from '../locales/pt-BR/translation.json';
-import ptPTTranslation from '../locales/pt-PT/translation.json';
-import frCATranslation from '../locales/fr-CA/translation.json';
-import frFRTranslation from '../locales/fr-FR/translation.json';
+import { lazyTranslationBackend } from './i18nResources';
 
 /**
  * 지원 언어 목록
@@ -45,55 +31,6 @@ export const SUPPORTED_LANGUAGES = {
 
 export type SupportedLanguage = keyof typeof SUPPORTED_LANGUAGES;
 
-/**
- * 번역 리소스 객체
- */
-const resources = {
-  'ko-KR': {
-    translation: koTranslation,
-  },
-  'de-DE': {
-    translation: deTranslation,
-  },
-  'es-US': {
-    translation: esUSTranslation,
-  },
-  'es-ES': {
-    translation: esESTranslation,
-  },
-  'en-US': {
-    translation: enUSTranslation,
-  },
-  'en-GB': {
-    translation: enGBTranslation,
-  },
-  'it-IT': {
-    translation: itTranslation,
-  },
-  'ja-JP': {
-    translation: jaTranslation,
-  },
-  'pt-BR': {
-    translation: ptBRTranslation,
-  },
-  'pt-PT': {
-    translation: ptPTTranslation,
-  },
-  'fr-CA': {
-    translation: frCATranslation,
-  },
-  'fr-FR': {
-    translation: frFRTranslation,
-  },
-  // 하위 호환성을 위한 레거시 키 (ko, en)
-  ko: {
-    translation: koTranslation,
-  },
-  en: {
-    translation: enTranslation,
-  },
-};
-
 /**
  * 디바이스 언어 감지
  *
@@ -212,16 +149,19 @@ async function getInitialLanguage(): Promise<SupportedLanguage> {
  * i18next 초기화
  *
  * React Native 앱 시작 시 호출
+ * 초기 언어와 폴백 언어(ko-KR)의 번역만 로딩하며,
+ * 다른 언어는 changeLanguage() 시점에 backend를 통해 로딩됨
  */
 export async function initializeI18n(): Promise<void> {
   const initialLanguage = await getInitialLanguage();
 
   await i18n
+    .use(lazyTranslationBackend) // 로케일별 지연 로딩
     .use(initReactI18next) // React i18next 바인딩
     .init({
-      resources,
       lng: initialLanguage, // 초기 언어
       fallbackLng: 'ko-KR', // 폴백 언어
+      load: 'currentOnly', // 'ko-KR' 외에 'ko' 등 언어 코드 리소스를 추가로 로딩하지 않음
       compatibilityJSON: 'v3' as any, // React Native에서 중요: Intl API 없이 작동 (타입 v4이지만 v3 필요)
       interpolation: {
         escapeValue: false, // React에서는 XSS 방지가 기본
@@ -0,0 +1,90 @@
+/**
+ * i18n Translation Resources
+ *
+ * 로케일별 번역 리소스를 필요할 때만 로딩하는 i18next backend
+ * (React Native 의존성 없음 - scripts/benchmark-i18n.ts에서도 사용)
+ */
+
+import type { BackendModule, ResourceKey } from 'i18next';
+
+type TranslationLoader = () => ResourceKey;
+
+/**
+ * 로케일별 번역 로더
+ *
+ * Metro는 리터럴 경로의 require만 번들에 포함할 수 있으므로 경로는 그대로 두고,
+ * 함수로 감싸 실제로 요청된 로케일의 JSON 모듈만 평가되도록 함
+ */
+const TRANSLATION_LOADERS: Record<string, TranslationLoader> = {
+  'ko-KR': () => require('../locales/ko/translation.json'),
+  'de-DE': () => require('../locales/de-DE/translation.json'),
+  'es-US': () => require('../locales/es-US/translation.json'),
+  'es-ES': () => require('../locales/es-ES/translation.json'),
+  'en-US': () => require('../locales/en-US/translation.json'),
+  'en-GB': () => require('../locales/en-GB/translation.json'),
+  'it-IT': () => require('../locales/it-IT/translation.json'),
+  'ja-JP': () => require('../locales/ja-JP/translation.json'),
+  'pt-BR': () => require('../locales/pt-BR/translation.json'),
+  'pt-PT': () => require('../locales/pt-PT/translation.json'),
+  'fr-CA': () => require('../locales/fr-CA/translation.json'),
+  'fr-FR': () => require('../locales/fr-FR/translation.json'),
+  // 하위 호환성을 위한 레거시 키 (ko, en)
+  ko: () => require('../locales/ko/translation.json'),
+  en: () => require('../locales/en/translation.json'),
+};
+
+/**
+ * 로딩된 번역 캐시
+ */
+const loadedTranslations = new Map<string, ResourceKey>();
+
+/**
+ * 번역 리소스 로딩 (한 번 로딩한 로케일은 캐시에서 반환)
+ *
+ * @param language - 로케일 코드
+ * @returns 번역 리소스 (지원하지 않는 로케일이면 null)
+ */
+export function loadTranslation(language: string): ResourceKey | null {
+  const cached = loadedTranslations.get(language);
+  if (cached) {
+    return cached;
+  }
+
+  const loader = TRANSLATION_LOADERS[language];
+  if (!loader) {
+    return null;
+  }
+
+  const translation = loader();
+  loadedTranslations.set(language, translation);
+  return translation;
+}
+
+/**
+ * 현재까지 로딩된 로케일 목록 (디버깅/벤치마크용)
+ */
+export function getLoadedLanguages(): string[] {
+  return [...loadedTranslations.keys()];
+}
+
+/**
+ * i18next backend: 요청된 로케일(+ 폴백 로케일)만 로딩
+ */
+export const lazyTranslationBackend: BackendModule = {
+  type: 'backend',
+  init: () => {},
+  read: (language, _namespace, callback) => {
+    try {
+      const translation = loadTranslation(language);
+
+      if (!translation) {
+        callback(new Error(`[i18n] Unsupported language: ${language}`), false);
+        return;
+      }
+
+      callback(null, translation);
+    } catch (error) {
+      callback(error as Error, false);
+    }
+  },
+};
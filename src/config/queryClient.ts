@@ -0,0 +1,36 @@
+/**
+ * React Query Client 설정
+ *
+ * - 앱 전역 QueryClient 인스턴스
+ * - NetInfo 기반 온라인 상태 연동 (오프라인 동안 refetch/폴링 일시 중지)
+ */
+
+import { QueryClient, onlineManager } from '@tanstack/react-query';
+import NetInfo from '@react-native-community/netinfo';
+
+/**
+ * React Native에는 브라우저 online/offline 이벤트가 없으므로
+ * NetInfo 상태를 React Query onlineManager에 전달
+ *
+ * 오프라인 동안 쿼리는 'paused' 상태가 되어 캐시(스냅샷) 데이터를 그대로 보여주고,
+ * 연결이 복구되면 자동으로 재조회됨
+ */
+onlineManager.setEventListener(setOnline => {
+  return NetInfo.addEventListener(state => {
+    setOnline(!!state.isConnected && state.isInternetReachable !== false);
+  });
+});
+
+// React Query Client 설정
+export const queryClient = new QueryClient({
+  defaultOptions: {
+    queries: {
+      retry: 3, // 3회 재시도
+      staleTime: 1000 * 60 * 5, // 5분
+      gcTime: 1000 * 60 * 10, // 10분 (구 cacheTime)
+    },
+    mutations: {
+      retry: 1, // 1회 재시도
+    },
+  },
+});
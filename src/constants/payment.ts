@@ -29,6 +29,20 @@ export const PAYMENT_RETRY_CONFIG = {
   BACKOFF_MULTIPLIER: 2,
 } as const;
 
+/**
+ * 기부 저장 대기열(outbox) 설정
+ */
+export const DONATION_OUTBOX_CONFIG = {
+  /** 결제 직후 즉시 저장 시도 타임아웃 (밀리초) - 초과 시 대기열에서 계속 재시도 */
+  SUBMIT_TIMEOUT: 5000,
+  /** 첫 재시도 간격 (밀리초) */
+  BASE_DELAY: 2000,
+  /** 최대 재시도 간격 (밀리초) */
+  MAX_DELAY: 10 * 60 * 1000,
+  /** 한 번에 전송할 최대 기부 수 (record_donations 제한과 동일) */
+  BATCH_SIZE: 50,
+} as const;
+
 /**
  * 영수증 검증 타임아웃 (밀리초)
  */
@@ -52,6 +66,8 @@ export const PAYMENT_ERROR_CODES = {
   NETWORK_ERROR: 'E_NETWORK_ERROR',
   /** 중복 결제 */
   DUPLICATE_PAYMENT: 'E_DUPLICATE_PAYMENT',
+  /** 서버가 기부 저장을 거부함 (재시도 불가) */
+  DONATION_REJECTED: 'E_DONATION_REJECTED',
   /** 알 수 없는 오류 */
   UNKNOWN_ERROR: 'E_UNKNOWN_ERROR',
 } as const;
@@ -67,5 +83,6 @@ export const PAYMENT_ERROR_MESSAGES = {
   [PAYMENT_ERROR_CODES.RECEIPT_VALIDATION_FAILED]: '영수증 검증에 실패했습니다.',
   [PAYMENT_ERROR_CODES.NETWORK_ERROR]: '네트워크 오류가 발생했습니다. 다시 시도해주세요.',
   [PAYMENT_ERROR_CODES.DUPLICATE_PAYMENT]: '이미 처리된 결제입니다.',
+  [PAYMENT_ERROR_CODES.DONATION_REJECTED]: '기부 정보를 저장할 수 없습니다. 고객센터로 문의해주세요.',
   [PAYMENT_ERROR_CODES.UNKNOWN_ERROR]: '알 수 없는 오류가 발생했습니다.',
 } as const;
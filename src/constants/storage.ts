@@ -17,11 +17,14 @@ export const STORAGE_KEYS = {
   /** 첫 기부 날짜 (ISO 8601 문자열) */
   FIRST_DONATION: '@burn-a-buck:first-donation',
 
-  /** 대기 중인 구매 정보 (결제 복구용) */
+  /** 대기 중인 구매 정보 (결제 복구용, 서버 저장 전 기부 outbox - JSON 배열) */
   PENDING_PURCHASE: '@burn-a-buck:pending-purchase',
 
   /** 앱 언어 설정 (ko | en) */
   APP_LANGUAGE: '@burn-a-buck:app-language',
+
+  /** React Query 캐시 스냅샷 (콜드 스타트 즉시 렌더링용) */
+  QUERY_CACHE: '@burn-a-buck:query-cache',
 } as const;
 
 /**
@@ -33,4 +36,5 @@ export type StorageValues = {
   [STORAGE_KEYS.FIRST_DONATION]: string | null;
   [STORAGE_KEYS.PENDING_PURCHASE]: string | null;
   [STORAGE_KEYS.APP_LANGUAGE]: 'ko' | 'en' | null;
+  [STORAGE_KEYS.QUERY_CACHE]: string | null;
 };
@@ -95,14 +95,21 @@ export const useDonationPayment = (): UseDonationPaymentReturn => {
         console.log('[useDonationPayment] Payment successful:', result);
 
         // PaymentService의 isFirstDonation 결과 신뢰 (DB 기반 판단)
-        setIsFirstDonation(result.isFirstDonation || false);
-
-        // Step 5: 순위 및 총 후원금액 조회
-        console.log('[useDonationPayment] Fetching post-donation data...');
-        const postDonationData = await getPostDonationData(finalNickname);
-
-        const rank = postDonationData?.rank || undefined;
-        const totalDonated = postDonationData?.user?.total_donated || undefined;
+        // (서버 저장 대기 중이면 아직 알 수 없으므로 null)
+        setIsFirstDonation(result.isFirstDonation ?? null);
+
+        // Step 5: 순위 및 총 후원금액 (record_donation RPC 응답에 포함)
+        // 응답에 없는 경우에만 별도 조회
+        // (서버 저장 대기 중이면 아직 반영되지 않았으므로 조회 생략)
+        let rank = result.rank;
+        let totalDonated = result.totalDonated;
+
+        if (totalDonated === undefined && !result.isPending) {
+          console.log('[useDonationPayment] Fetching post-donation data...');
+          const postDonationData = await getPostDonationData(finalNickname);
+          rank = postDonationData?.rank || undefined;
+          totalDonated = postDonationData?.user?.total_donated || undefined;
+        }
 
         console.log('[useDonationPayment] Post-donation data:', { rank, totalDonated });
 
@@ -117,16 +124,17 @@ export const useDonationPayment = (): UseDonationPaymentReturn => {
             nickname: finalNickname,
             amount: 1000,
           },
-          isFirstDonation: result.isFirstDonation || false,
+          isFirstDonation: result.isFirstDonation,
           rank,
           totalDonated,
+          pendingReceiptToken: result.isPending ? result.receiptToken : undefined,
         });
 
         // Step 7: React Query 캐시 무효화 (메인 화면 즉시 업데이트)
         console.log('[useDonationPayment] Invalidating React Query cache...');
         await queryClient.invalidateQueries({ queryKey: ['leaderboard', 'top'] });
         await queryClient.invalidateQueries({ queryKey: ['donations', 'recent'] });
-        await queryClient.invalidateQueries({ queryKey: ['leaderboard', 'full'] });
+        await queryClient.invalidateQueries({ queryKey: ['leaderboard', 'pages'] });
 
         // Step 8: 상태 초기화
         setTimeout(() => {
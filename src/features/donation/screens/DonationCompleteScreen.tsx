@@ -6,9 +6,10 @@
  * - 감사 메시지 UI with animations
  * - 최초 기부자 배지
  * - 축하 애니메이션 (별빛 효과)
+ * - 서버 저장 대기 중인 기부는 대기열의 저장 확인 시 첫 기부 여부 / 순위 갱신
  */
 
-import React, { useMemo } from 'react';
+import React, { useEffect, useMemo, useState } from 'react';
 import { View, Text, StyleSheet, TouchableOpacity, ScrollView } from 'react-native';
 import { useTranslation } from 'react-i18next';
 import { useQueryClient } from '@tanstack/react-query';
@@ -18,6 +19,7 @@ import ThankYouMessage from '../components/ThankYouMessage';
 import FirstDonorBadge from '../components/FirstDonorBadge';
 import CelebrationAnimation from '../components/CelebrationAnimation';
 import { shareGeneral } from '../../../services/shareService';
+import { subscribeDonationOutbox } from '../../../services/donationOutbox';
 import type { ShareData } from '../../../types/share';
 
 const DonationCompleteScreen: React.FC<DonationCompleteScreenProps> = ({
@@ -26,7 +28,30 @@ const DonationCompleteScreen: React.FC<DonationCompleteScreenProps> = ({
 }) => {
   const { t } = useTranslation();
   const queryClient = useQueryClient();
-  const { donation, isFirstDonation, rank, totalDonated } = route.params;
+  const { donation, pendingReceiptToken } = route.params;
+  const [isFirstDonation, setIsFirstDonation] = useState(route.params.isFirstDonation);
+  const [rank, setRank] = useState(route.params.rank);
+  const [totalDonated, setTotalDonated] = useState(route.params.totalDonated);
+
+  /**
+   * 서버 저장 대기 중인 기부: 대기열이 저장을 확인하면 결과 반영
+   */
+  useEffect(() => {
+    if (!pendingReceiptToken) return;
+
+    return subscribeDonationOutbox(event => {
+      if (event.receiptToken !== pendingReceiptToken) return;
+
+      if (event.type === 'recorded') {
+        const { recorded } = event;
+        setIsFirstDonation(recorded.isFirstDonation && !recorded.isDuplicate);
+        setRank(recorded.rank ?? undefined);
+        setTotalDonated(recorded.user.total_donated);
+      } else {
+        console.error('[DonationCompleteScreen] Pending donation rejected:', event.error);
+      }
+    });
+  }, [pendingReceiptToken]);
 
   // Prepare share data
   const shareData: ShareData = useMemo(
@@ -47,7 +72,7 @@ const DonationCompleteScreen: React.FC<DonationCompleteScreenProps> = ({
     console.log('[DonationCompleteScreen] Invalidating cache before navigation...');
     await queryClient.invalidateQueries({ queryKey: ['leaderboard', 'top'] });
     await queryClient.invalidateQueries({ queryKey: ['donations', 'recent'] });
-    await queryClient.invalidateQueries({ queryKey: ['leaderboard', 'full'] });
+    await queryClient.invalidateQueries({ queryKey: ['leaderboard', 'pages'] });
 
     navigation.navigate('Main');
   };
@@ -71,7 +96,7 @@ const DonationCompleteScreen: React.FC<DonationCompleteScreenProps> = ({
         {/* Thank You Message */}
         <ThankYouMessage
           nickname={donation.nickname}
-          isFirstDonation={isFirstDonation}
+          isFirstDonation={!!isFirstDonation}
         />
 
         {/* First Donor Badge (only for first donation) */}
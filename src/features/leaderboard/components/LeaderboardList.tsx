@@ -0,0 +1,251 @@
+/**
+ * Leaderboard List
+ *
+ * 전체 순위 무한 스크롤 목록 (커서 기반 페이지 + 고정 높이 가상화)
+ * - 항목 높이가 고정이므로 getItemLayout으로 측정 없이 스크롤/점프
+ * - 양방향 페이지 로딩 (onStartReached / onEndReached)
+ * - "내 순위로 이동": 사용자 주변 페이지를 기준으로 목록을 다시 구성
+ */
+
+import React, { useCallback, useEffect, useMemo, useRef, useState } from 'react';
+import {
+  View,
+  Text,
+  StyleSheet,
+  FlatList,
+  TouchableOpacity,
+  ActivityIndicator,
+  type ListRenderItem,
+} from 'react-native';
+import { useTranslation } from 'react-i18next';
+import { useInfiniteLeaderboard } from '../hooks/useLeaderboard';
+import { colors, typography } from '../../../theme';
+import { formatAmount } from '../../../utils/timeFormat';
+import type { LeaderboardPageEntry } from '../../../types/database.types';
+import { EmptyState } from '../../../components/common/EmptyState';
+
+/** 항목 높이 (고정, getItemLayout용) */
+const ITEM_HEIGHT = 64;
+
+/** 페이지 크기 */
+const PAGE_SIZE = 50;
+
+interface LeaderboardListProps {
+  /** 현재 사용자 닉네임 ("내 순위로 이동" 및 강조 표시용) */
+  nickname?: string;
+}
+
+export const LeaderboardList: React.FC<LeaderboardListProps> = ({ nickname }) => {
+  const { t } = useTranslation();
+  const listRef = useRef<FlatList<LeaderboardPageEntry>>(null);
+  const [anchorNickname, setAnchorNickname] = useState<string | null>(null);
+
+  const {
+    data,
+    isLoading,
+    isError,
+    refetch,
+    fetchNextPage,
+    fetchPreviousPage,
+    hasNextPage,
+    hasPreviousPage,
+    isFetchingNextPage,
+    isFetchingPreviousPage,
+  } = useInfiniteLeaderboard(PAGE_SIZE, anchorNickname);
+
+  const entries = useMemo(() => data?.pages.flat() ?? [], [data]);
+
+  /**
+   * 내 순위로 이동한 경우, 첫 로딩 후 내 항목으로 스크롤
+   */
+  useEffect(() => {
+    if (!anchorNickname || !data || data.pages.length !== 1) return;
+
+    const index = entries.findIndex(entry => entry.nickname === anchorNickname);
+    if (index > 0) {
+      listRef.current?.scrollToIndex({ index, viewPosition: 0.5, animated: false });
+    }
+  }, [anchorNickname, data, entries]);
+
+  const handleToggleAnchor = useCallback(() => {
+    setAnchorNickname(current => (current ? null : nickname ?? null));
+  }, [nickname]);
+
+  const handleEndReached = useCallback(() => {
+    if (hasNextPage && !isFetchingNextPage) {
+      fetchNextPage();
+    }
+  }, [hasNextPage, isFetchingNextPage, fetchNextPage]);
+
+  const handleStartReached = useCallback(() => {
+    if (hasPreviousPage && !isFetchingPreviousPage) {
+      fetchPreviousPage();
+    }
+  }, [hasPreviousPage, isFetchingPreviousPage, fetchPreviousPage]);
+
+  const getItemLayout = useCallback(
+    (_data: ArrayLike<LeaderboardPageEntry> | null | undefined, index: number) => ({
+      length: ITEM_HEIGHT,
+      offset: ITEM_HEIGHT * index,
+      index,
+    }),
+    []
+  );
+
+  /**
+   * 각 순위 항목 렌더링
+   */
+  const renderItem: ListRenderItem<LeaderboardPageEntry> = useCallback(
+    ({ item }) => {
+      const isMe = !!nickname && item.nickname === nickname;
+
+      return (
+        <View style={[styles.item, isMe && styles.myItem]}>
+          <Text style={styles.rankText}>{t('main.leaderboard.rank', { rank: item.rank })}</Text>
+          <View style={styles.infoSection}>
+            <Text style={styles.nickname} numberOfLines={1}>
+              {item.nickname}
+            </Text>
+            <Text style={styles.amount}>₩{formatAmount(item.total_donated)}</Text>
+          </View>
+          {item.donation_count > 1 && (
+            <Text style={styles.donationCount}>
+              {t('main.leaderboard.donationCount', { count: item.donation_count })}
+            </Text>
+          )}
+        </View>
+      );
+    },
+    [nickname, t]
+  );
+
+  const renderFooter = () =>
+    isFetchingNextPage ? (
+      <ActivityIndicator style={styles.loadingIndicator} color={colors.primary} />
+    ) : null;
+
+  if (isLoading) {
+    return (
+      <View style={styles.loadingContainer}>
+        <ActivityIndicator size="large" color={colors.primary} />
+      </View>
+    );
+  }
+
+  if (isError && entries.length === 0) {
+    return (
+      <EmptyState
+        icon="⚠️"
+        title={t('error.general.title')}
+        message={t('error.general.message')}
+        actionLabel={t('common.retry')}
+        onAction={() => refetch()}
+      />
+    );
+  }
+
+  if (entries.length === 0) {
+    return (
+      <EmptyState
+        icon="🗑️"
+        title={t('main.leaderboard.emptyState.topRanker.title')}
+        message={t('main.leaderboard.emptyState.topRanker.message')}
+      />
+    );
+  }
+
+  return (
+    <View style={styles.container}>
+      {nickname && (
+        <TouchableOpacity style={styles.jumpButton} onPress={handleToggleAnchor}>
+          <Text style={styles.jumpButtonText}>
+            {anchorNickname ? t('main.leaderboard.backToTop') : t('main.leaderboard.jumpToMyRank')}
+          </Text>
+        </TouchableOpacity>
+      )}
+      <FlatList
+        ref={listRef}
+        data={entries}
+        renderItem={renderItem}
+        keyExtractor={item => item.id}
+        getItemLayout={getItemLayout}
+        onEndReached={handleEndReached}
+        onEndReachedThreshold={0.5}
+        onStartReached={handleStartReached}
+        onStartReachedThreshold={0.5}
+        // 앞쪽 페이지 추가/제거 시 현재 보고 있는 위치 유지
+        maintainVisibleContentPosition={{ minIndexForVisible: 0 }}
+        ListFooterComponent={renderFooter}
+        initialNumToRender={15}
+        maxToRenderPerBatch={20}
+        windowSize={7}
+        removeClippedSubviews
+        showsVerticalScrollIndicator={false}
+      />
+    </View>
+  );
+};
+
+const styles = StyleSheet.create({
+  container: {
+    flex: 1,
+  },
+  loadingContainer: {
+    paddingVertical: 40,
+    alignItems: 'center',
+  },
+  loadingIndicator: {
+    paddingVertical: 16,
+  },
+  jumpButton: {
+    alignSelf: 'flex-end',
+    marginHorizontal: 24,
+    marginBottom: 8,
+    paddingVertical: 6,
+    paddingHorizontal: 12,
+    borderRadius: 16,
+    backgroundColor: colors.surface,
+    borderWidth: 1,
+    borderColor: colors.border,
+  },
+  jumpButtonText: {
+    ...typography.labelSmall,
+    color: colors.primary,
+  },
+  item: {
+    height: ITEM_HEIGHT,
+    flexDirection: 'row',
+    alignItems: 'center',
+    paddingHorizontal: 24,
+    borderBottomWidth: StyleSheet.hairlineWidth,
+    borderBottomColor: colors.border,
+    backgroundColor: colors.surface,
+  },
+  myItem: {
+    backgroundColor: `${colors.primary}10`,
+  },
+  rankText: {
+    ...typography.leaderboardStats,
+    color: colors.textSecondary,
+    width: 70,
+  },
+  infoSection: {
+    flex: 1,
+    marginRight: 8,
+  },
+  nickname: {
+    ...typography.rankerNickname,
+    color: colors.text,
+    marginBottom: 2,
+  },
+  amount: {
+    ...typography.leaderboardAmount,
+    color: colors.primary,
+  },
+  donationCount: {
+    ...typography.labelSmall,
+    color: colors.textSecondary,
+  },
+});
+
+export default LeaderboardList;
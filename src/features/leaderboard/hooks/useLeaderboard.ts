@@ -2,25 +2,63 @@
  * Leaderboard Hooks
  *
  * 리더보드 데이터를 조회하는 React Query hooks
+ *
+ * 실시간 모드(기본값)에서는 Supabase Realtime 변경분으로 캐시를 직접 갱신하며,
+ * 채널이 연결되지 않은 동안에만 폴링으로 동작한다.
  */
 
-import { useQuery } from '@tanstack/react-query';
-import { getTopRankers } from '../../../services/leaderboardService';
+import { useInfiniteQuery, useQuery } from '@tanstack/react-query';
+import {
+  getDonationTrend,
+  getLeaderboardPage,
+  getLeaderboardStats,
+  getRankingsAroundUser,
+  getTopRankers,
+  toLeaderboardCursor,
+} from '../../../services/leaderboardService';
 import { getRecentDonations } from '../../../services/donationService';
-import type { LeaderboardEntry } from '../../../types/database.types';
+import { normalizeNickname } from '../../../services/userService';
+import type { DonationTrendBucketType, LeaderboardCursor } from '../../../types/database.types';
+import { useLeaderboardRealtime } from './useLeaderboardRealtime';
+
+/** 무한 스크롤 리더보드에서 메모리에 유지할 최대 페이지 수 */
+const MAX_CACHED_PAGES = 5;
+
+/**
+ * 무한 스크롤 리더보드 페이지 파라미터
+ * - around: 특정 사용자 주변 (내 순위로 이동)
+ * - page: 커서 기준 위/아래 방향 페이지
+ */
+type LeaderboardPageParam =
+  | { type: 'around'; nickname: string }
+  | { type: 'page'; cursor: LeaderboardCursor | null; direction: 'after' | 'before' };
+
+/**
+ * 리더보드 Hook 옵션
+ */
+export interface LeaderboardQueryOptions {
+  /** 실시간 delta push 사용 여부 (기본값: true) */
+  realtime?: boolean;
+}
 
 /**
  * Top Rankers 조회 Hook (1~3등)
  *
  * @param limit - 조회할 랭커 수 (기본값: 3)
+ * @param options - 실시간 모드 옵션
  * @returns React Query result
  */
-export const useTopRankers = (limit: number = 3) => {
+export const useTopRankers = (
+  limit: number = 3,
+  { realtime = true }: LeaderboardQueryOptions = {}
+) => {
+  const isLive = useLeaderboardRealtime(realtime);
+
   return useQuery({
     queryKey: ['leaderboard', 'top', limit],
     queryFn: () => getTopRankers(limit),
-    // 30초마다 자동 리프레시
-    refetchInterval: 30000,
+    // 실시간 채널이 끊긴 동안에만 30초마다 자동 리프레시
+    refetchInterval: isLive ? false : 30000,
     // 에러 발생 시 자동 재시도 (3회)
     retry: 3,
     // 캐시 시간 5분
@@ -32,14 +70,20 @@ export const useTopRankers = (limit: number = 3) => {
  * Recent Donations 조회 Hook (최근 10명)
  *
  * @param limit - 조회할 기부 내역 수 (기본값: 10)
+ * @param options - 실시간 모드 옵션
  * @returns React Query result
  */
-export const useRecentDonations = (limit: number = 10) => {
+export const useRecentDonations = (
+  limit: number = 10,
+  { realtime = true }: LeaderboardQueryOptions = {}
+) => {
+  const isLive = useLeaderboardRealtime(realtime);
+
   return useQuery({
     queryKey: ['donations', 'recent', limit],
     queryFn: () => getRecentDonations(limit),
-    // 30초마다 자동 리프레시
-    refetchInterval: 30000,
+    // 실시간 채널이 끊긴 동안에만 30초마다 자동 리프레시
+    refetchInterval: isLive ? false : 30000,
     // 에러 발생 시 자동 재시도 (3회)
     retry: 3,
     // 캐시 시간 5분
@@ -48,17 +92,107 @@ export const useRecentDonations = (limit: number = 10) => {
 };
 
 /**
- * Full Leaderboard 조회 Hook (전체 순위)
+ * 리더보드 전체 통계 조회 Hook
  *
- * @param limit - 조회할 랭커 수 (기본값: 100)
+ * 카운터 단일 행 조회라 비용이 일정하며, 실시간 모드에서는 기부 payload로 캐시를 직접 증분
+ *
+ * @param options - 실시간 모드 옵션
  * @returns React Query result
  */
-export const useLeaderboard = (limit: number = 100) => {
+export const useLeaderboardStats = ({ realtime = true }: LeaderboardQueryOptions = {}) => {
+  const isLive = useLeaderboardRealtime(realtime);
+
   return useQuery({
-    queryKey: ['leaderboard', 'full', limit],
-    queryFn: () => getTopRankers(limit),
-    // 1분마다 자동 리프레시
-    refetchInterval: 60000,
+    queryKey: ['leaderboard', 'stats'],
+    queryFn: getLeaderboardStats,
+    // 실시간 채널이 끊긴 동안에만 1분마다 자동 리프레시
+    refetchInterval: isLive ? false : 60000,
+    // 에러 발생 시 자동 재시도 (3회)
+    retry: 3,
+    // 캐시 시간 5분
+    staleTime: 1000 * 60 * 5,
+  });
+};
+
+/**
+ * 기부 추이 조회 Hook (시간/일 구간)
+ *
+ * @param bucket - 구간 단위 (기본값: 'hour')
+ * @param limit - 구간 수 (기본값: 24)
+ * @param options - 실시간 모드 옵션
+ * @returns React Query result
+ */
+export const useDonationTrend = (
+  bucket: DonationTrendBucketType = 'hour',
+  limit: number = 24,
+  { realtime = true }: LeaderboardQueryOptions = {}
+) => {
+  const isLive = useLeaderboardRealtime(realtime);
+
+  return useQuery({
+    queryKey: ['leaderboard', 'trend', bucket, limit],
+    queryFn: () => getDonationTrend(bucket, limit),
+    // 실시간 채널이 끊긴 동안에만 1분마다 자동 리프레시
+    refetchInterval: isLive ? false : 60000,
+    // 에러 발생 시 자동 재시도 (3회)
+    retry: 3,
+    // 캐시 시간 5분
+    staleTime: 1000 * 60 * 5,
+  });
+};
+
+/**
+ * 무한 스크롤 리더보드 Hook (커서 기반)
+ *
+ * - 페이지마다 커서(keyset)로 조회하므로 깊이와 무관하게 페이지 비용이 일정
+ * - 최대 MAX_CACHED_PAGES 페이지만 유지하여 스크롤 길이와 무관하게 메모리 사용 일정
+ * - anchorNickname을 지정하면 해당 사용자 주변에서 시작하여 위/아래로 스크롤
+ *
+ * @param pageSize - 페이지 크기 (기본값: 50)
+ * @param anchorNickname - 시작 위치로 사용할 사용자 닉네임 (없으면 1위부터)
+ * @returns React Query infinite query result
+ */
+export const useInfiniteLeaderboard = (
+  pageSize: number = 50,
+  anchorNickname: string | null = null
+) => {
+  const aroundRange = Math.floor(pageSize / 2);
+
+  return useInfiniteQuery({
+    queryKey: ['leaderboard', 'pages', pageSize, anchorNickname],
+    initialPageParam: (anchorNickname
+      ? { type: 'around', nickname: anchorNickname }
+      : { type: 'page', cursor: null, direction: 'after' }) as LeaderboardPageParam,
+    queryFn: ({ pageParam }) =>
+      pageParam.type === 'around'
+        ? getRankingsAroundUser(pageParam.nickname, aroundRange)
+        : getLeaderboardPage(pageParam.cursor, pageSize, pageParam.direction),
+    getNextPageParam: (lastPage, _allPages, lastPageParam): LeaderboardPageParam | undefined => {
+      const last = lastPage[lastPage.length - 1];
+      // 페이지가 가득 차지 않았으면 마지막 페이지
+      if (!last || (lastPageParam.type === 'page' && lastPage.length < pageSize)) {
+        return undefined;
+      }
+      // around 페이지는 기준 사용자 뒤쪽 행이 요청 수보다 적으면 마지막 페이지
+      if (lastPageParam.type === 'around') {
+        const anchorKey = normalizeNickname(lastPageParam.nickname);
+        const anchorIndex = lastPage.findIndex(
+          entry => normalizeNickname(entry.nickname) === anchorKey
+        );
+        if (anchorIndex !== -1 && lastPage.length - 1 - anchorIndex < aroundRange) {
+          return undefined;
+        }
+      }
+      return { type: 'page', cursor: toLeaderboardCursor(last), direction: 'after' };
+    },
+    getPreviousPageParam: (firstPage): LeaderboardPageParam | undefined => {
+      const first = firstPage[0];
+      if (!first || first.position <= 1) {
+        return undefined;
+      }
+      return { type: 'page', cursor: toLeaderboardCursor(first), direction: 'before' };
+    },
+    maxPages: MAX_CACHED_PAGES,
     // 에러 발생 시 자동 재시도 (3회)
     retry: 3,
     // 캐시 시간 5분
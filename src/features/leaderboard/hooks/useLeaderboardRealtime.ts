@@ -0,0 +1,235 @@
+/**
+ * Leaderboard Realtime Hook
+ *
+ * Supabase Realtime 변경분으로 리더보드 React Query 캐시를 직접 갱신
+ * - 모든 구독자가 하나의 채널을 공유 (참조 카운트)
+ * - 연속된 이벤트는 FLUSH_INTERVAL_MS 단위로 모아서 한 번에 반영
+ * - 통계/추이도 기부 payload로 로컬 증분 (서버 재조회 없음)
+ * - 채널이 끊기면 폴링으로 폴백하고, 재연결 시 한 번 재조회하여 누락분 보정
+ */
+
+import { useEffect, useSyncExternalStore } from 'react';
+import { useQueryClient, type QueryClient, type QueryKey } from '@tanstack/react-query';
+import {
+  subscribeToLeaderboard,
+  type LeaderboardChange,
+} from '../../../services/leaderboardService';
+import {
+  applyDonationsToStats,
+  applyDonationsToTrend,
+  applyUserChanges,
+  mergeRecentDonations,
+} from '../../../utils/leaderboardCache';
+import type {
+  DonationTrendBucket,
+  DonationTrendBucketType,
+  LeaderboardEntry,
+  LeaderboardStats,
+  RecentDonation,
+  User,
+} from '../../../types/database.types';
+
+/** 이벤트 병합 주기 (한 번의 UI 업데이트로 묶음) */
+const FLUSH_INTERVAL_MS = 250;
+
+/** 실시간 갱신 대상 쿼리 키 */
+const RANKER_QUERY_KEYS: QueryKey[] = [['leaderboard', 'top']];
+const RECENT_DONATIONS_QUERY_KEY: QueryKey = ['donations', 'recent'];
+
+/** 커서 기반 전체 순위 페이지 (순위가 페이지 경계를 넘나들어 로컬 패치 대신 재연결 시 재조회) */
+const LEADERBOARD_PAGES_QUERY_KEY: QueryKey = ['leaderboard', 'pages'];
+
+/** 기부 payload로 로컬 증분하는 집계 쿼리 키 (재연결 시에만 재조회) */
+const STATS_QUERY_KEY: QueryKey = ['leaderboard', 'stats'];
+const TREND_QUERY_KEY: QueryKey = ['leaderboard', 'trend'];
+
+type FeedStatus = 'idle' | 'connecting' | 'live' | 'down';
+
+// 공유 피드 상태 (모듈 단위 싱글톤)
+let status: FeedStatus = 'idle';
+let hasBeenLive = false;
+let refCount = 0;
+let generation = 0;
+let unsubscribe: (() => void) | null = null;
+let flushTimer: ReturnType<typeof setTimeout> | null = null;
+let pendingDonations: RecentDonation[] = [];
+let pendingUsers = new Map<string, User>();
+let pendingNewUserTimes: string[] = [];
+const statusListeners = new Set<() => void>();
+
+const setStatus = (next: FeedStatus) => {
+  if (status === next) return;
+  status = next;
+  statusListeners.forEach(listener => listener());
+};
+
+/**
+ * 모든 리더보드 관련 쿼리 재조회 (채널 장애/재연결 시 누락분 보정)
+ */
+const resyncQueries = (queryClient: QueryClient) => {
+  [
+    ...RANKER_QUERY_KEYS,
+    LEADERBOARD_PAGES_QUERY_KEY,
+    RECENT_DONATIONS_QUERY_KEY,
+    STATS_QUERY_KEY,
+    TREND_QUERY_KEY,
+  ].forEach(queryKey => {
+    queryClient.invalidateQueries({ queryKey });
+  });
+};
+
+/**
+ * 쌓인 변경분을 캐시에 반영
+ * 쿼리 키의 마지막 요소(limit)에 맞춰 목록 길이를 유지
+ */
+const flush = (queryClient: QueryClient) => {
+  flushTimer = null;
+
+  const donations = pendingDonations;
+  const users = [...pendingUsers.values()];
+  const newUserTimes = pendingNewUserTimes;
+  pendingDonations = [];
+  pendingUsers = new Map();
+  pendingNewUserTimes = [];
+
+  if (donations.length > 0) {
+    queryClient
+      .getQueriesData<RecentDonation[]>({ queryKey: RECENT_DONATIONS_QUERY_KEY })
+      .forEach(([queryKey]) => {
+        const limit = queryKey[queryKey.length - 1] as number;
+        queryClient.setQueryData<RecentDonation[]>(queryKey, current =>
+          mergeRecentDonations(current, donations, limit)
+        );
+      });
+  }
+
+  if (donations.length > 0 || newUserTimes.length > 0) {
+    queryClient.setQueryData<LeaderboardStats>(STATS_QUERY_KEY, current =>
+      applyDonationsToStats(current, donations, newUserTimes.length)
+    );
+
+    // 쿼리 키: ['leaderboard', 'trend', bucket, limit]
+    queryClient
+      .getQueriesData<DonationTrendBucket[]>({ queryKey: TREND_QUERY_KEY })
+      .forEach(([queryKey]) => {
+        const bucket = queryKey[2] as DonationTrendBucketType;
+        queryClient.setQueryData<DonationTrendBucket[]>(queryKey, current =>
+          applyDonationsToTrend(current, bucket, donations, newUserTimes)
+        );
+      });
+  }
+
+  if (users.length > 0) {
+    RANKER_QUERY_KEYS.forEach(rankerKey => {
+      queryClient
+        .getQueriesData<LeaderboardEntry[]>({ queryKey: rankerKey })
+        .forEach(([queryKey]) => {
+          const limit = queryKey[queryKey.length - 1] as number;
+          queryClient.setQueryData<LeaderboardEntry[]>(queryKey, current =>
+            applyUserChanges(current, users, limit)
+          );
+        });
+    });
+  }
+};
+
+const handleChange = (queryClient: QueryClient, change: LeaderboardChange) => {
+  if (change.type === 'donation') {
+    pendingDonations.push(change.donation);
+  } else {
+    // 같은 사용자의 연속 변경은 마지막 값만 유지
+    pendingUsers.set(change.user.id, change.user);
+    if (change.isNew && change.user.first_donation_at) {
+      pendingNewUserTimes.push(change.user.first_donation_at);
+    }
+  }
+
+  if (!flushTimer) {
+    flushTimer = setTimeout(() => flush(queryClient), FLUSH_INTERVAL_MS);
+  }
+};
+
+const acquireFeed = (queryClient: QueryClient) => {
+  refCount += 1;
+  if (unsubscribe) return;
+
+  // 해제된 이전 채널의 늦은 콜백(CLOSED 등)은 무시
+  const feedGeneration = ++generation;
+
+  setStatus('connecting');
+  unsubscribe = subscribeToLeaderboard(
+    change => {
+      if (feedGeneration === generation) handleChange(queryClient, change);
+    },
+    channelStatus => {
+      if (feedGeneration !== generation) return;
+
+      if (channelStatus === 'SUBSCRIBED') {
+        // 재연결이면 끊긴 동안의 변경분을 한 번 재조회
+        if (hasBeenLive) {
+          resyncQueries(queryClient);
+        }
+        hasBeenLive = true;
+        setStatus('live');
+      } else if (status === 'live' || status === 'connecting') {
+        console.warn(
+          '[Leaderboard Realtime] Channel unavailable, falling back to polling:',
+          channelStatus
+        );
+        setStatus('down');
+        resyncQueries(queryClient);
+      }
+    }
+  );
+};
+
+const releaseFeed = () => {
+  refCount = Math.max(0, refCount - 1);
+  if (refCount > 0 || !unsubscribe) return;
+
+  generation += 1;
+  unsubscribe();
+  unsubscribe = null;
+
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  pendingDonations = [];
+  pendingUsers = new Map();
+  pendingNewUserTimes = [];
+  hasBeenLive = false;
+  setStatus('idle');
+};
+
+const subscribeStatus = (listener: () => void) => {
+  statusListeners.add(listener);
+  return () => {
+    statusListeners.delete(listener);
+  };
+};
+
+const getStatus = () => status;
+
+/**
+ * 리더보드 실시간 피드 Hook
+ *
+ * @param enabled - 실시간 모드 사용 여부 (false면 구독하지 않음)
+ * @returns 채널이 연결되어 캐시가 push로 갱신 중인지 여부
+ *          (false인 동안은 호출 측에서 폴링을 유지해야 함)
+ */
+export const useLeaderboardRealtime = (enabled: boolean = true): boolean => {
+  const queryClient = useQueryClient();
+  const feedStatus = useSyncExternalStore(subscribeStatus, getStatus);
+
+  useEffect(() => {
+    if (!enabled) return;
+
+    acquireFeed(queryClient);
+    return () => {
+      releaseFeed();
+    };
+  }, [enabled, queryClient]);
+
+  return enabled && feedStatus === 'live';
+};
@@ -0,0 +1,96 @@
+/**
+ * Leaderboard Screen
+ *
+ * 전체 순위 화면 - 커서 기반 무한 스크롤 목록 + 내 순위로 이동
+ * (가상화 목록이므로 메인 화면의 ScrollView 안에 중첩하지 않고 별도 화면으로 표시)
+ */
+
+import React, { useEffect, useState } from 'react';
+import { View, Text, StyleSheet, TouchableOpacity } from 'react-native';
+import { useTranslation } from 'react-i18next';
+import type { LeaderboardScreenProps } from '../../../types/navigation';
+import { colors, typography } from '../../../theme';
+import { LeaderboardList } from '../components/LeaderboardList';
+import { getNickname } from '../../../utils/nickname';
+
+const LeaderboardScreen: React.FC<LeaderboardScreenProps> = ({ navigation }) => {
+  const { t } = useTranslation();
+  const [nickname, setNickname] = useState<string | undefined>(undefined);
+
+  /**
+   * 닉네임 로드 ("내 순위로 이동" 및 내 항목 강조용)
+   */
+  useEffect(() => {
+    const loadNickname = async () => {
+      const savedNickname = await getNickname();
+      if (savedNickname) {
+        setNickname(savedNickname);
+      }
+    };
+
+    loadNickname();
+  }, []);
+
+  return (
+    <View style={styles.container}>
+      {/* Header */}
+      <View style={styles.header}>
+        <TouchableOpacity
+          style={styles.backButton}
+          onPress={() => navigation.goBack()}
+          activeOpacity={0.7}
+        >
+          <Text style={styles.backButtonText}>‹ {t('common.back')}</Text>
+        </TouchableOpacity>
+        <Text style={styles.headerTitle}>{t('main.leaderboard.title')}</Text>
+      </View>
+
+      {/* 전체 순위 목록 */}
+      <View style={styles.content}>
+        <LeaderboardList nickname={nickname} />
+      </View>
+    </View>
+  );
+};
+
+const styles = StyleSheet.create({
+  container: {
+    flex: 1,
+    backgroundColor: colors.background,
+  },
+  header: {
+    paddingTop: 48,
+    paddingHorizontal: 24,
+    paddingBottom: 16,
+    backgroundColor: colors.surface,
+    shadowColor: '#000',
+    shadowOffset: { width: 0, height: 2 },
+    shadowOpacity: 0.1,
+    shadowRadius: 4,
+    elevation: 3,
+    flexDirection: 'row',
+    alignItems: 'center',
+    justifyContent: 'center',
+  },
+  backButton: {
+    position: 'absolute',
+    left: 16,
+    top: 48,
+    paddingVertical: 4,
+    paddingHorizontal: 8,
+  },
+  backButtonText: {
+    ...typography.labelLarge,
+    color: colors.primary,
+  },
+  headerTitle: {
+    ...typography.titleMedium,
+    color: colors.text,
+  },
+  content: {
+    flex: 1,
+    paddingTop: 16,
+  },
+});
+
+export default LeaderboardScreen;
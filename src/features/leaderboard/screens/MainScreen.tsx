@@ -155,6 +155,15 @@ const MainScreen: React.FC<MainScreenProps> = ({ navigation }) => {
         {/* Top Rankers (1~3등) */}
         <TopRankersSection />
 
+        {/* 전체 순위 화면으로 이동 (커서 기반 무한 스크롤 + 내 순위로 이동) */}
+        <TouchableOpacity
+          style={styles.viewAllButton}
+          onPress={() => navigation.navigate('Leaderboard')}
+          activeOpacity={0.7}
+        >
+          <Text style={styles.viewAllButtonText}>{t('main.leaderboard.viewAll')} ›</Text>
+        </TouchableOpacity>
+
         {/* Recent Donations (최근 10명) */}
         <RecentDonationsSection />
       </ScrollView>
@@ -237,6 +246,18 @@ const styles = StyleSheet.create({
     paddingTop: 24,
     paddingBottom: 16,
   },
+  viewAllButton: {
+    alignSelf: 'flex-end',
+    marginHorizontal: 24,
+    marginTop: -8,
+    marginBottom: 16,
+    paddingVertical: 6,
+    paddingHorizontal: 12,
+  },
+  viewAllButtonText: {
+    ...typography.labelLarge,
+    color: colors.primary,
+  },
   footer: {
     padding: 24,
   },
@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react';
 import { useQuery } from '@tanstack/react-query';
 import { useTranslation } from 'react-i18next';
-import { checkNicknameAvailable } from '../../../services/userService';
+import { checkNicknameAvailable, normalizeNickname } from '../../../services/userService';
 
 interface UseNicknameValidationProps {
   nickname: string;
@@ -53,27 +53,33 @@ export const useNicknameValidation = ({
     !lengthError && debouncedNickname.length >= 2 && debouncedNickname.length <= 12;
 
   // Duplicate check (async, debounced)
+  // Keyed by the normalized nickname so case/width variants share one result,
+  // and kept fresh for a short window so re-typing a settled value doesn't refetch
   const {
     data: isAvailable,
     isLoading: isChecking,
     error: checkError,
     refetch: retry,
   } = useQuery({
-    queryKey: ['nicknameAvailable', debouncedNickname],
+    queryKey: ['nicknameAvailable', normalizeNickname(debouncedNickname)],
     queryFn: () => checkNicknameAvailable(debouncedNickname),
     enabled: shouldCheckDuplicate,
     retry: 3, // Retry 3 times on network error
     retryDelay: (attemptIndex) => Math.min(1000 * 2 ** attemptIndex, 30000), // Exponential backoff
-    staleTime: 0, // Always check fresh data
+    staleTime: 10 * 1000, // Matches the service-level TTL for "available" answers
     gcTime: 5 * 60 * 1000, // Cache for 5 minutes
+    refetchOnWindowFocus: false,
   });
 
   // Compute duplicate flag
   const isDuplicate = shouldCheckDuplicate && isAvailable === false;
 
+  // Input hasn't settled yet: the last answer belongs to a different value
+  const isSettling = nickname !== debouncedNickname;
+
   // Compute overall validation flags
   const hasError = Boolean(lengthError || isDuplicate || checkError);
-  const isValid = !hasError && !isChecking && nickname.length >= 2;
+  const isValid = !hasError && !isChecking && !isSettling && nickname.length >= 2;
 
   return {
     isChecking,
@@ -14,6 +14,7 @@ import { colors } from '../theme/colors';
 // Screens (lazy import for better performance)
 import OnboardingScreen from '../features/onboarding/screens/OnboardingScreen';
 import MainScreen from '../features/leaderboard/screens/MainScreen';
+import LeaderboardScreen from '../features/leaderboard/screens/LeaderboardScreen';
 import DonationCompleteScreen from '../features/donation/screens/DonationCompleteScreen';
 
 const Stack = createStackNavigator<RootStackParamList>();
@@ -84,6 +85,15 @@ export const RootNavigator: React.FC = () => {
           }}
         />
 
+        {/* 전체 순위 화면 */}
+        <Stack.Screen
+          name="Leaderboard"
+          component={LeaderboardScreen}
+          options={{
+            headerShown: false,
+          }}
+        />
+
         {/* 기부 완료 화면 */}
         <Stack.Screen
           name="DonationComplete"
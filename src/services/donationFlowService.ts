@@ -3,19 +3,21 @@
  *
  * 기부 플로우 통합 서비스
  * (결제 → 영수증 검증 → Supabase 저장 → 사용자 통계 업데이트)
+ *
+ * 저장은 기부 대기열(donationOutbox)을 거치므로, 저장에 실패해도 결제된 기부는
+ * 유실되지 않고 백그라운드에서 재시도되며 구매는 서버 확인 후에만 소비됨
  */
 
 import { Platform } from 'react-native';
 import {
   purchaseProduct,
-  finalizePurchase,
   validateReceiptClient,
   extractPurchaseToken,
   PRODUCT_IDS,
 } from './payment/index';
-import { createDonation, getDonationByReceipt } from './donationService';
-import { getUserByNickname, createUser, getUserRank } from './userService';
-import type { Purchase, PurchaseResult, CreateDonationInput } from '../types/payment';
+import { submitDonation } from './donationOutbox';
+import { getUserByNickname, getUserRank } from './userService';
+import type { PurchaseResult } from '../types/payment';
 import type { User } from '../types/database.types';
 
 /**
@@ -25,7 +27,10 @@ export interface DonationFlowResult {
   success: boolean;
   isFirstDonation?: boolean;
   user?: User;
+  rank?: number | null;
   donationId?: string;
+  /** 서버 저장 대기 중 여부 (대기열에서 백그라운드 저장) */
+  isPending?: boolean;
   error?: string;
 }
 
@@ -38,8 +43,6 @@ export interface DonationFlowResult {
 export const executeDonationFlow = async (
   nickname: string
 ): Promise<DonationFlowResult> => {
-  let purchase: Purchase | undefined;
-
   try {
     // Step 1: 구매 시작
     console.log('[Donation Flow] Starting purchase...');
@@ -52,7 +55,7 @@ export const executeDonationFlow = async (
       };
     }
 
-    purchase = purchaseResult.purchase;
+    const { purchase } = purchaseResult;
 
     // Step 2: 영수증 클라이언트 검증
     console.log('[Donation Flow] Validating receipt...');
@@ -62,77 +65,65 @@ export const executeDonationFlow = async (
       throw new Error(validationResult.error || 'Invalid receipt');
     }
 
-    // Step 3: 중복 결제 확인
-    console.log('[Donation Flow] Checking for duplicate...');
+    // Step 3: 기부 저장 (단일 RPC: 중복 확인 + 사용자 갱신 + 순위 계산)
+    // 대기열에 먼저 보관 후 저장하며, 구매 소비(영수증 소비)는 서버 확인 후 대기열이 처리
+    console.log('[Donation Flow] Recording donation...');
     const receiptToken = extractPurchaseToken(purchase);
-    const existingDonation = await getDonationByReceipt(receiptToken);
+    const submitted = await submitDonation(
+      {
+        nickname,
+        amount: 1000, // ₩1,000 고정
+        receipt_token: receiptToken,
+        platform: Platform.OS === 'android' ? 'google_play' : 'app_store',
+      },
+      purchase
+    );
 
-    if (existingDonation) {
-      console.warn('[Donation Flow] Duplicate donation detected:', receiptToken);
-      // 중복이지만 구매는 완료 처리
-      await finalizePurchase(purchase);
+    if (submitted.status === 'queued') {
+      console.log('[Donation Flow] Donation queued for background save');
 
+      // 첫 기부 여부는 서버 저장 후에 알 수 있음 (subscribeDonationOutbox로 전달)
       return {
-        success: false,
-        error: 'This donation has already been processed',
+        success: true,
+        isFirstDonation: undefined,
+        isPending: true,
       };
     }
 
-    // Step 4: 사용자 조회 또는 생성
-    console.log('[Donation Flow] Getting or creating user...');
-    let user = await getUserByNickname(nickname);
-    const isFirstDonation = !user || user.total_donated === 0;
+    if (submitted.status === 'rejected') {
+      console.error('[Donation Flow] Donation rejected by server:', submitted.error);
 
-    if (!user) {
-      user = await createUser({
-        nickname,
-        total_donated: 0,
-        first_donation_at: null,
-        last_donation_at: null,
-        badge_earned: false,
-      });
+      return {
+        success: false,
+        error: submitted.error.message,
+      };
     }
 
-    // Step 5: 기부 내역 저장 (Supabase)
-    console.log('[Donation Flow] Creating donation record...');
-    const donationInput = {
-      nickname: user.nickname || nickname,
-      amount: 1000, // ₩1,000 고정
-      receipt_token: receiptToken,
-      platform: (Platform.OS === 'android' ? 'google_play' : 'app_store') as
-        | 'google_play'
-        | 'app_store',
-    };
-
-    const donation = await createDonation(donationInput);
+    const { recorded } = submitted;
 
-    // Step 6: 구매 완료 처리 (영수증 소비)
-    console.log('[Donation Flow] Finalizing purchase...');
-    await finalizePurchase(purchase);
+    if (recorded.isDuplicate) {
+      console.warn('[Donation Flow] Duplicate donation detected:', receiptToken);
 
-    // Step 7: 사용자 정보 다시 조회 (트리거로 업데이트된 통계)
-    const updatedUser = await getUserByNickname(nickname);
+      return {
+        success: false,
+        error: 'This donation has already been processed',
+      };
+    }
 
     console.log('[Donation Flow] Donation flow completed successfully');
 
     return {
       success: true,
-      isFirstDonation,
-      user: updatedUser || user,
-      donationId: donation.id,
+      isFirstDonation: recorded.isFirstDonation,
+      user: recorded.user,
+      rank: recorded.rank,
+      donationId: recorded.donationId,
     };
   } catch (err) {
+    // 저장 전 단계에서 실패한 구매는 소비하지 않음
+    // (서버에 기록되지 않은 결제가 소비되어 유실되지 않도록)
     console.error('[Donation Flow] Error:', err);
 
-    // 구매는 했지만 저장에 실패한 경우, 영수증 소비
-    if (purchase) {
-      try {
-        await finalizePurchase(purchase);
-      } catch (finalizeErr) {
-        console.error('[Donation Flow] Failed to finalize purchase:', finalizeErr);
-      }
-    }
-
     return {
       success: false,
       error: err instanceof Error ? err.message : 'Unknown error',
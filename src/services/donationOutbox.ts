@@ -0,0 +1,565 @@
+/**
+ * Donation Outbox
+ *
+ * 영수증 검증이 끝난 기부를 서버 저장이 확인될 때까지 AsyncStorage에 보관하는 대기열
+ * - 결제 직후 한 번 즉시 저장을 시도하고, 실패하거나 늦어지면 대기열에 맡기고 바로 반환
+ * - NetInfo가 연결을 보고하면 대기 중인 기부를 record_donations 한 번으로 일괄 전송
+ * - 실패한 항목은 지수 백오프 + 지터로 재시도 (앱 재시작 후에도 이어서 재시도)
+ * - 재시도해도 성공할 수 없는 오류(SQLSTATE 22/23 클래스, unique 위반 제외)는 dead-letter로 옮기고
+ *   재시도 중단 (구매는 소비하지 않고 보관하며, 앱이 업데이트되면 다시 재시도)
+ * - receipt_token 기준 멱등 저장이므로 같은 기부를 여러 번 보내도 한 번만 기록됨
+ * - 서버가 저장(또는 이미 저장됨)을 확인한 뒤에만 구매를 소비(finishTransaction)
+ * - 저장/거부 결과는 subscribeDonationOutbox로 전달 (대기 중이던 기부의 첫 기부 여부 등)
+ */
+
+import AsyncStorage from '@react-native-async-storage/async-storage';
+import NetInfo from '@react-native-community/netinfo';
+import * as Updates from 'expo-updates';
+import { STORAGE_KEYS } from '../constants/storage';
+import { DONATION_OUTBOX_CONFIG } from '../constants/payment';
+import { IAP_TEST_MODE } from '../config/env';
+import { recordDonation, recordDonations, type RecordDonationResult } from './donationService';
+import { finalizePurchase, initializeIAP } from './payment/index';
+import type { DonationInsert } from '../types/database.types';
+import type { Purchase } from '../types/payment';
+
+/**
+ * 대기열 항목
+ */
+export interface DonationOutboxEntry {
+  /** 저장할 기부 (receipt_token이 항목 식별자) */
+  donation: DonationInsert;
+  /** 서버 확인 후 소비할 구매 (없으면 소비 생략) */
+  purchase: Purchase | null;
+  /** 서버 저장 확인 여부 (true면 구매 소비만 남은 상태) */
+  acknowledged: boolean;
+  /** 실패한 시도 횟수 */
+  attempts: number;
+  /** 다음 시도 가능 시각 (epoch ms) */
+  nextAttemptAt: number;
+  /** 대기열 추가 시각 (epoch ms) */
+  createdAt: number;
+  /** 마지막 실패 사유 */
+  lastError?: string;
+  /** 마지막 실패 SQLSTATE (서버가 거부한 경우) */
+  errorCode?: string;
+  /** 영구 실패로 재시도 중단 여부 (구매는 소비하지 않고 보관) */
+  deadLettered?: boolean;
+  /** dead-letter 처리 당시 앱 버전 (버전이 바뀌면 다시 재시도) */
+  deadLetteredVersion?: string;
+}
+
+/**
+ * 기부 제출 결과
+ * - recorded: 즉시 저장됨 (순위 등 서버 응답 포함)
+ * - queued: 대기열에 보관됨 (연결 복구 시 백그라운드 저장)
+ */
+export type DonationSubmitResult =
+  | { status: 'recorded'; recorded: RecordDonationResult }
+  | { status: 'queued' }
+  | { status: 'rejected'; error: DonationOutboxError };
+
+/**
+ * 서버가 거부한 기부의 오류 정보
+ */
+export interface DonationOutboxError {
+  /** SQLSTATE (예: 23505) */
+  code?: string;
+  message: string;
+}
+
+/**
+ * 대기열 처리 결과 이벤트
+ * - recorded: 서버 저장 확인 (대기 중이던 기부 포함)
+ * - rejected: 영구 실패로 dead-letter 처리됨
+ */
+export type DonationOutboxEvent =
+  | { type: 'recorded'; receiptToken: string; recorded: RecordDonationResult }
+  | { type: 'rejected'; receiptToken: string; error: DonationOutboxError };
+
+// 메모리 상태 (AsyncStorage와 동기화)
+let entries: DonationOutboxEntry[] | null = null;
+let storageLock: Promise<unknown> = Promise.resolve();
+let flushPromise: Promise<void> | null = null;
+let retryTimer: ReturnType<typeof setTimeout> | null = null;
+let isIAPConnected = false;
+const inFlightTokens = new Set<string>();
+const listeners = new Set<(event: DonationOutboxEvent) => void>();
+
+const emit = (event: DonationOutboxEvent) => {
+  listeners.forEach(listener => {
+    try {
+      listener(event);
+    } catch (error) {
+      console.error('[Donation Outbox] Listener error:', error);
+    }
+  });
+};
+
+/**
+ * 저장된 대기열 로드
+ */
+const loadEntries = async (): Promise<DonationOutboxEntry[]> => {
+  try {
+    const raw = await AsyncStorage.getItem(STORAGE_KEYS.PENDING_PURCHASE);
+    const parsed = raw ? JSON.parse(raw) : [];
+    return Array.isArray(parsed) ? parsed : [];
+  } catch (error) {
+    console.error('[Donation Outbox] Failed to load outbox:', error);
+    return [];
+  }
+};
+
+/**
+ * 대기열을 순서대로 접근 (읽기/수정이 서로 끼어들지 않도록 직렬화)
+ *
+ * @param persist - 작업 후 AsyncStorage에 저장할지 여부
+ */
+const withEntries = <T>(
+  task: (current: DonationOutboxEntry[]) => T,
+  persist: boolean = true
+): Promise<T> => {
+  const run = storageLock.then(async () => {
+    if (!entries) {
+      entries = await loadEntries();
+    }
+
+    const result = task(entries);
+
+    if (persist) {
+      await AsyncStorage.setItem(STORAGE_KEYS.PENDING_PURCHASE, JSON.stringify(entries));
+    }
+
+    return result;
+  });
+
+  storageLock = run.catch(() => undefined);
+  return run;
+};
+
+const removeEntry = (current: DonationOutboxEntry[], receiptToken: string) => {
+  const index = current.findIndex(entry => entry.donation.receipt_token === receiptToken);
+  if (index >= 0) {
+    current.splice(index, 1);
+  }
+};
+
+/**
+ * 재시도 간격 계산 (지수 백오프 + equal jitter)
+ * 절반은 고정, 절반은 무작위로 두어 여러 기기가 동시에 재시도하지 않도록 분산
+ */
+const getRetryDelay = (attempts: number): number => {
+  const { BASE_DELAY, MAX_DELAY } = DONATION_OUTBOX_CONFIG;
+  const ceiling = Math.min(MAX_DELAY, BASE_DELAY * 2 ** attempts);
+  return ceiling / 2 + Math.random() * (ceiling / 2);
+};
+
+/**
+ * 재시도해도 성공할 수 없는 오류인지 여부
+ * SQLSTATE 22xxx(데이터 예외: 값 길이 초과 등), 23xxx(무결성 제약 위반)
+ * 단, unique 위반(23505)은 요청 내용이 아니라 서버 데이터 상태에서 오므로 재시도 대상
+ */
+const isPermanentError = (code: string | undefined): boolean =>
+  !!code && code !== '23505' && (code.startsWith('22') || code.startsWith('23'));
+
+/**
+ * 현재 앱 버전 (스토어 빌드의 runtimeVersion + OTA 업데이트 ID)
+ * dead-letter 항목은 이 값이 바뀌면(서버/클라이언트 수정이 배포되었을 수 있으므로) 다시 재시도
+ */
+const getAppVersion = (): string =>
+  `${Updates.runtimeVersion ?? ''}/${Updates.updateId ?? 'embedded'}`;
+
+/**
+ * dead-letter 항목을 다시 재시도 대상으로 되돌림
+ *
+ * @returns 되돌린 항목 수
+ */
+const reviveDeadLettered = (shouldRevive: (entry: DonationOutboxEntry) => boolean) =>
+  withEntries(current => {
+    const revived = current.filter(entry => entry.deadLettered && shouldRevive(entry));
+
+    revived.forEach(entry => {
+      entry.deadLettered = false;
+      entry.deadLetteredVersion = undefined;
+      entry.attempts = 0;
+      entry.nextAttemptAt = 0;
+    });
+
+    return revived.length;
+  });
+
+/**
+ * 서버 오류 정보 추출 (PostgrestError / Error / 배치 항목 오류)
+ */
+const toOutboxError = (error: unknown): DonationOutboxError => {
+  if (error && typeof error === 'object') {
+    const { code, message } = error as { code?: unknown; message?: unknown };
+    return {
+      code: typeof code === 'string' ? code : undefined,
+      message: typeof message === 'string' ? message : String(error),
+    };
+  }
+  return { message: String(error) };
+};
+
+/**
+ * 영구 실패 항목을 dead-letter로 이동 (재시도 및 구매 소비 중단)
+ */
+const markDeadLettered = async (receiptToken: string, error: DonationOutboxError) => {
+  await withEntries(current => {
+    const entry = current.find(item => item.donation.receipt_token === receiptToken);
+    if (!entry) return;
+
+    entry.deadLettered = true;
+    entry.deadLetteredVersion = getAppVersion();
+    entry.attempts += 1;
+    entry.lastError = error.message;
+    entry.errorCode = error.code;
+  });
+
+  console.error('[Donation Outbox] Donation rejected permanently:', receiptToken, error);
+  emit({ type: 'rejected', receiptToken, error });
+};
+
+/**
+ * 첫 기부 플래그 저장 (AsyncStorage)
+ */
+const saveFirstDonationFlag = async (recorded: RecordDonationResult): Promise<void> => {
+  if (!recorded.isFirstDonation || recorded.isDuplicate) return;
+
+  try {
+    await AsyncStorage.setItem(STORAGE_KEYS.FIRST_DONATION, new Date().toISOString());
+  } catch (error) {
+    console.error('[Donation Outbox] Failed to save first donation flag:', error);
+  }
+};
+
+/**
+ * 실패한 항목의 다음 시도 시각 갱신
+ */
+const markFailed = (receiptTokens: string[], error: unknown) =>
+  withEntries(current => {
+    const message = error instanceof Error ? error.message : String(error);
+
+    current.forEach(entry => {
+      if (receiptTokens.includes(entry.donation.receipt_token)) {
+        entry.nextAttemptAt = Date.now() + getRetryDelay(entry.attempts);
+        entry.attempts += 1;
+        entry.lastError = message;
+      }
+    });
+  });
+
+/**
+ * 구매 소비 (서버 저장 확인 후에만 호출)
+ */
+const consumePurchase = async (purchase: Purchase | null): Promise<void> => {
+  // 테스트 모드의 가짜 구매는 스토어에 존재하지 않으므로 소비 생략
+  if (!purchase || IAP_TEST_MODE) return;
+
+  // 앱 재시작 직후에는 결제 서비스보다 먼저 대기열이 처리될 수 있음
+  if (!isIAPConnected) {
+    isIAPConnected = await initializeIAP();
+    if (!isIAPConnected) {
+      throw new Error('IAP connection unavailable');
+    }
+  }
+
+  await finalizePurchase(purchase);
+};
+
+/**
+ * 서버 저장이 확인된 항목 처리: 확인 상태 기록 → 구매 소비 → 대기열에서 제거
+ * 구매 소비에 실패하면 확인 상태로 남아 다음 시도에서 소비만 다시 시도
+ */
+const completeEntries = async (receiptTokens: string[]): Promise<void> => {
+  if (receiptTokens.length === 0) return;
+
+  const purchases = await withEntries(current =>
+    current
+      .filter(entry => receiptTokens.includes(entry.donation.receipt_token))
+      .map(entry => {
+        entry.acknowledged = true;
+        return { receiptToken: entry.donation.receipt_token, purchase: entry.purchase };
+      })
+  );
+
+  for (const { receiptToken, purchase } of purchases) {
+    try {
+      await consumePurchase(purchase);
+      await withEntries(current => removeEntry(current, receiptToken));
+    } catch (error) {
+      console.error('[Donation Outbox] Failed to finalize purchase:', error);
+      await markFailed([receiptToken], error);
+    }
+  }
+};
+
+const withTimeout = <T>(promise: Promise<T>, timeoutMs: number): Promise<T> =>
+  new Promise<T>((resolve, reject) => {
+    const timer = setTimeout(() => reject(new Error('Request timed out')), timeoutMs);
+    promise.then(
+      value => {
+        clearTimeout(timer);
+        resolve(value);
+      },
+      error => {
+        clearTimeout(timer);
+        reject(error);
+      }
+    );
+  });
+
+/**
+ * 다음 재시도 예약 (가장 이른 nextAttemptAt 기준)
+ */
+const scheduleRetry = async (): Promise<void> => {
+  if (retryTimer) {
+    clearTimeout(retryTimer);
+    retryTimer = null;
+  }
+
+  const pending = await withEntries(
+    current => current.filter(entry => !entry.deadLettered),
+    false
+  );
+  if (pending.length === 0) return;
+
+  const nextAttemptAt = Math.min(...pending.map(entry => entry.nextAttemptAt));
+  retryTimer = setTimeout(
+    () => {
+      retryTimer = null;
+      flushDonationOutbox();
+    },
+    Math.max(0, nextAttemptAt - Date.now())
+  );
+};
+
+/**
+ * 대기 중인 기부 일괄 전송
+ */
+const runFlush = async (force: boolean): Promise<void> => {
+  const now = Date.now();
+  const due = await withEntries(
+    current =>
+      current.filter(
+        entry =>
+          !entry.deadLettered &&
+          (force || entry.nextAttemptAt <= now) &&
+          !inFlightTokens.has(entry.donation.receipt_token)
+      ),
+    false
+  );
+
+  if (due.length === 0) return;
+
+  const acknowledged = due
+    .filter(entry => entry.acknowledged)
+    .map(entry => entry.donation.receipt_token);
+  const toSend = due
+    .filter(entry => !entry.acknowledged)
+    .slice(0, DONATION_OUTBOX_CONFIG.BATCH_SIZE);
+
+  if (toSend.length > 0) {
+    const tokens = toSend.map(entry => entry.donation.receipt_token);
+    tokens.forEach(token => inFlightTokens.add(token));
+
+    try {
+      console.log(`[Donation Outbox] Sending ${toSend.length} pending donation(s)...`);
+      const results = await recordDonations(toSend.map(entry => entry.donation));
+
+      for (const item of results) {
+        if (item.result) {
+          // 중복 응답도 서버에 이미 저장되었다는 확인이므로 완료 처리
+          acknowledged.push(item.receiptToken);
+          await saveFirstDonationFlag(item.result);
+          emit({ type: 'recorded', receiptToken: item.receiptToken, recorded: item.result });
+        } else if (item.error && isPermanentError(item.error.code)) {
+          await markDeadLettered(item.receiptToken, item.error);
+        } else {
+          console.warn(
+            '[Donation Outbox] Donation failed, will retry:',
+            item.receiptToken,
+            item.error
+          );
+          await markFailed([item.receiptToken], item.error?.message);
+        }
+      }
+    } catch (error) {
+      console.warn('[Donation Outbox] Flush failed, will retry:', error);
+      await markFailed(tokens, error);
+    } finally {
+      tokens.forEach(token => inFlightTokens.delete(token));
+    }
+  }
+
+  await completeEntries(acknowledged);
+};
+
+/**
+ * 대기열 전송 (동시에 하나의 전송만 진행)
+ *
+ * @param options.force - 백오프 대기 중인 항목도 바로 전송 (연결 복구 시)
+ */
+export const flushDonationOutbox = ({ force = false }: { force?: boolean } = {}): Promise<void> => {
+  if (!flushPromise) {
+    flushPromise = runFlush(force)
+      .catch(error => {
+        console.error('[Donation Outbox] Unexpected flush error:', error);
+      })
+      .finally(() => {
+        flushPromise = null;
+        scheduleRetry().catch(() => undefined);
+      });
+  }
+
+  return flushPromise;
+};
+
+/**
+ * 결제된 기부 제출
+ *
+ * 대기열에 먼저 영구 저장한 뒤 한 번 즉시 저장을 시도
+ * SUBMIT_TIMEOUT 안에 서버 응답이 없거나 실패하면 'queued'로 바로 반환하고
+ * 이후 저장과 구매 소비는 대기열이 백그라운드에서 처리
+ *
+ * @param donation - 저장할 기부
+ * @param purchase - 서버 확인 후 소비할 구매
+ */
+export const submitDonation = async (
+  donation: DonationInsert,
+  purchase: Purchase | null
+): Promise<DonationSubmitResult> => {
+  const receiptToken = donation.receipt_token;
+
+  await withEntries(current => {
+    if (current.some(entry => entry.donation.receipt_token === receiptToken)) return;
+
+    current.push({
+      donation,
+      purchase,
+      acknowledged: false,
+      attempts: 0,
+      nextAttemptAt: Date.now(),
+      createdAt: Date.now(),
+    });
+  });
+
+  inFlightTokens.add(receiptToken);
+
+  try {
+    const recorded = await withTimeout(
+      recordDonation(donation),
+      DONATION_OUTBOX_CONFIG.SUBMIT_TIMEOUT
+    );
+    inFlightTokens.delete(receiptToken);
+    await saveFirstDonationFlag(recorded);
+    await completeEntries([receiptToken]);
+    return { status: 'recorded', recorded };
+  } catch (error) {
+    inFlightTokens.delete(receiptToken);
+
+    const outboxError = toOutboxError(error);
+    if (isPermanentError(outboxError.code)) {
+      await markDeadLettered(receiptToken, outboxError);
+      return { status: 'rejected', error: outboxError };
+    }
+
+    console.warn('[Donation Outbox] Immediate save failed, queued for retry:', error);
+    await markFailed([receiptToken], error);
+    scheduleRetry().catch(() => undefined);
+    return { status: 'queued' };
+  }
+};
+
+/**
+ * 서버 저장 대기 중인 기부 목록 (dead-letter 제외)
+ */
+export const getPendingDonations = (): Promise<DonationOutboxEntry[]> =>
+  withEntries(
+    current => current.filter(entry => !entry.deadLettered).map(entry => ({ ...entry })),
+    false
+  );
+
+/**
+ * 서버가 영구 거부하여 재시도를 중단한 기부 목록 (문의 대응/진단용)
+ * 구매는 소비되지 않은 상태로 보관되며 retryDeadLetteredDonations 또는 앱 업데이트 후 재시도됨
+ */
+export const getDeadLetteredDonations = (): Promise<DonationOutboxEntry[]> =>
+  withEntries(
+    current => current.filter(entry => entry.deadLettered).map(entry => ({ ...entry })),
+    false
+  );
+
+/**
+ * dead-letter 기부를 모두 다시 전송 (고객 문의 대응 / 서버 수정 후 수동 복구)
+ *
+ * @returns 재시도한 항목 수
+ */
+export const retryDeadLetteredDonations = async (): Promise<number> => {
+  const revived = await reviveDeadLettered(() => true);
+
+  if (revived > 0) {
+    console.log(`[Donation Outbox] Retrying ${revived} dead-lettered donation(s)...`);
+    await flushDonationOutbox({ force: true });
+  }
+
+  return revived;
+};
+
+/**
+ * 대기열 처리 결과 구독 (대기 중이던 기부의 저장 확인 / 영구 거부)
+ *
+ * @returns 구독 해제 함수
+ */
+export const subscribeDonationOutbox = (
+  listener: (event: DonationOutboxEvent) => void
+): (() => void) => {
+  listeners.add(listener);
+  return () => {
+    listeners.delete(listener);
+  };
+};
+
+/**
+ * 대기열 백그라운드 처리 시작
+ * NetInfo가 연결(인터넷 도달 가능)을 보고할 때마다 대기 중인 기부를 바로 전송
+ * (리스너 등록 시 현재 상태로 한 번 호출되므로 앱 시작 시에도 전송됨)
+ *
+ * @returns 정리 함수
+ */
+export const startDonationOutbox = (): (() => void) => {
+  let wasConnected = false;
+
+  // 앱이 업데이트되었으면 이전 버전에서 dead-letter 처리된 기부를 다시 재시도
+  // (첫 연결 시 전송보다 먼저 대기열에 반영됨)
+  const appVersion = getAppVersion();
+  reviveDeadLettered(entry => entry.deadLetteredVersion !== appVersion)
+    .then(revived => {
+      if (revived > 0) {
+        console.log(`[Donation Outbox] App updated, retrying ${revived} dead-lettered donation(s)`);
+      }
+    })
+    .catch(error => {
+      console.error('[Donation Outbox] Failed to revive dead-lettered donations:', error);
+    });
+
+  const unsubscribe = NetInfo.addEventListener(state => {
+    const isConnected = !!state.isConnected && state.isInternetReachable !== false;
+
+    if (isConnected && !wasConnected) {
+      flushDonationOutbox({ force: true });
+    }
+
+    wasConnected = isConnected;
+  });
+
+  return () => {
+    unsubscribe();
+
+    if (retryTimer) {
+      clearTimeout(retryTimer);
+      retryTimer = null;
+    }
+  };
+};
@@ -5,7 +5,47 @@
  */
 
 import { supabase } from './supabase';
-import type { Donation, DonationInsert } from '../types/database.types';
+import type { Donation, DonationInsert, RecentDonation, User } from '../types/database.types';
+
+/**
+ * record_donation RPC 결과
+ */
+export interface RecordDonationResult {
+  /** 저장된 (또는 기존) 기부 ID */
+  donationId: string;
+  /** 기부 생성 시간 */
+  createdAt: string;
+  /** 이미 저장된 영수증이었는지 여부 */
+  isDuplicate: boolean;
+  /** 이 기부가 사용자의 첫 기부인지 여부 */
+  isFirstDonation: boolean;
+  /** 이 기부까지 반영된 사용자 정보 */
+  user: User;
+  /** 이 기부까지 반영된 순위 */
+  rank: number | null;
+}
+
+/**
+ * record_donations 배치 RPC 항목별 결과
+ * (result와 error 중 하나만 채워짐)
+ */
+export interface RecordDonationBatchItem {
+  receiptToken: string;
+  result: RecordDonationResult | null;
+  error: { code: string; message: string } | null;
+}
+
+/**
+ * record_donation / record_donations RPC 행을 결과 객체로 변환
+ */
+const mapRecordDonationRow = (row: any): RecordDonationResult => ({
+  donationId: row.donation_id,
+  createdAt: row.donation_created_at,
+  isDuplicate: row.is_duplicate,
+  isFirstDonation: row.is_first_donation,
+  user: row.user_data,
+  rank: row.rank ?? null,
+});
 
 /**
  * 새 기부 내역 생성
@@ -20,6 +60,64 @@ export const createDonation = async (donation: DonationInsert): Promise<Donation
   return data;
 };
 
+/**
+ * 기부 저장 (단일 트랜잭션 RPC)
+ *
+ * 영수증 토큰 기준 멱등 저장 + 사용자 통계 갱신 + 순위 계산을 한 번의 왕복으로 처리
+ * 이미 저장된 영수증이면 isDuplicate = true와 기존 기부 정보를 반환
+ */
+export const recordDonation = async (donation: DonationInsert): Promise<RecordDonationResult> => {
+  const { data, error } = await supabase.rpc('record_donation', {
+    p_nickname: donation.nickname,
+    p_receipt_token: donation.receipt_token,
+    p_platform: donation.platform,
+    p_transaction_id: donation.transaction_id ?? null,
+    p_amount: donation.amount,
+  });
+
+  if (error) {
+    throw error;
+  }
+
+  const row = data?.[0];
+
+  if (!row) {
+    throw new Error('record_donation returned no rows');
+  }
+
+  return mapRecordDonationRow(row);
+};
+
+/**
+ * 여러 기부를 한 번에 저장 (오프라인 대기열 전송용)
+ *
+ * 항목마다 record_donation과 같은 멱등 저장을 수행하며,
+ * 일부 항목이 실패해도 나머지 항목은 저장됨 (최대 50개)
+ */
+export const recordDonations = async (
+  donations: DonationInsert[]
+): Promise<RecordDonationBatchItem[]> => {
+  const { data, error } = await supabase.rpc('record_donations', {
+    p_donations: donations.map(donation => ({
+      nickname: donation.nickname,
+      receipt_token: donation.receipt_token,
+      platform: donation.platform,
+      transaction_id: donation.transaction_id ?? null,
+      amount: donation.amount,
+    })),
+  });
+
+  if (error) {
+    throw error;
+  }
+
+  return (data || []).map((row: any) => ({
+    receiptToken: row.receipt_token,
+    result: row.error_code ? null : mapRecordDonationRow(row),
+    error: row.error_code ? { code: row.error_code, message: row.error_message } : null,
+  }));
+};
+
 /**
  * 영수증 토큰으로 기부 내역 조회
  */
@@ -61,16 +159,7 @@ export const getUserDonations = async (nickname: string): Promise<Donation[]> =>
 /**
  * 최근 기부 내역 조회
  */
-export const getRecentDonations = async (
-  limit: number = 10
-): Promise<
-  Array<{
-    id: string;
-    nickname: string;
-    amount: number;
-    created_at: string;
-  }>
-> => {
+export const getRecentDonations = async (limit: number = 10): Promise<RecentDonation[]> => {
   const { data, error } = await supabase.rpc('get_recent_donations', {
     p_limit: limit,
   });
@@ -4,8 +4,19 @@
  * 리더보드 관련 API 서비스 레이어
  */
 
+import type { REALTIME_SUBSCRIBE_STATES } from '@supabase/supabase-js';
 import { supabase } from './supabase';
-import type { LeaderboardEntry, LeaderboardStats } from '../types/database.types';
+import type {
+  Donation,
+  DonationTrendBucket,
+  DonationTrendBucketType,
+  LeaderboardCursor,
+  LeaderboardEntry,
+  LeaderboardPageEntry,
+  LeaderboardStats,
+  RecentDonation,
+  User,
+} from '../types/database.types';
 
 /**
  * 상위 랭커 조회
@@ -24,6 +35,7 @@ export const getTopRankers = async (limit: number = 10): Promise<LeaderboardEntr
 
 /**
  * 전체 리더보드 조회
+ * @deprecated offset이 커질수록 느려지므로 getLeaderboardPage() 사용 권장
  */
 export const getLeaderboard = async (
   limit: number = 100,
@@ -41,8 +53,50 @@ export const getLeaderboard = async (
   return data || [];
 };
 
+/**
+ * 리더보드 페이지 조회 (커서 기반)
+ *
+ * @param cursor - 경계 행 커서 (null이면 1위부터)
+ * @param limit - 페이지 크기
+ * @param direction - 'after': 커서 다음 행들, 'before': 커서 이전 행들
+ * @returns 순위 오름차순 페이지 (limit보다 적으면 해당 방향의 끝)
+ */
+export const getLeaderboardPage = async (
+  cursor: LeaderboardCursor | null,
+  limit: number = 50,
+  direction: 'after' | 'before' = 'after'
+): Promise<LeaderboardPageEntry[]> => {
+  const { data, error } = await supabase.rpc('get_leaderboard_page', {
+    p_cursor_total: cursor?.total_donated ?? null,
+    p_cursor_first_donation_at: cursor?.first_donation_at ?? null,
+    p_cursor_id: cursor?.id ?? null,
+    p_cursor_rank: cursor?.rank ?? null,
+    p_cursor_position: cursor?.position ?? null,
+    p_limit: limit,
+    p_before: direction === 'before',
+  });
+
+  if (error) {
+    throw error;
+  }
+
+  return data || [];
+};
+
+/**
+ * 페이지 항목으로부터 커서 생성
+ */
+export const toLeaderboardCursor = (entry: LeaderboardPageEntry): LeaderboardCursor => ({
+  total_donated: entry.total_donated,
+  first_donation_at: entry.first_donation_at,
+  id: entry.id,
+  rank: entry.rank,
+  position: entry.position,
+});
+
 /**
  * 리더보드 전체 통계 조회
+ * 기부 트리거가 유지하는 카운터 단일 행을 읽으므로 기부량과 무관하게 일정한 비용
  */
 export const getLeaderboardStats = async (): Promise<LeaderboardStats> => {
   const { data, error } = await supabase.rpc('get_leaderboard_stats');
@@ -62,74 +116,111 @@ export const getLeaderboardStats = async (): Promise<LeaderboardStats> => {
 };
 
 /**
- * 특정 사용자 주변 순위 조회
- * (해당 사용자 위아래 N명씩)
+ * 최근 기부 추이 조회 (UTC 기준 시간/일 구간)
+ *
+ * @param bucket - 구간 단위 ('hour' | 'day')
+ * @param limit - 구간 수 (기부가 없는 구간은 0으로 채워짐, 최대 168)
+ * @returns 시간 오름차순 구간 목록
  */
-export const getRankingsAroundUser = async (
-  userId: string,
-  range: number = 5
-): Promise<LeaderboardEntry[]> => {
-  // 1. 사용자의 현재 순위 조회
-  const { data: userData, error: userError } = await supabase
-    .from('leaderboard')
-    .select('rank')
-    .eq('id', userId)
-    .single();
+export const getDonationTrend = async (
+  bucket: DonationTrendBucketType = 'hour',
+  limit: number = 24
+): Promise<DonationTrendBucket[]> => {
+  const { data, error } = await supabase.rpc('get_donation_trend', {
+    p_bucket: bucket,
+    p_limit: limit,
+  });
 
-  if (userError || !userData) {
-    throw userError || new Error('User not found in leaderboard');
+  if (error) {
+    throw error;
   }
 
-  const userRank = userData.rank as number;
-
-  // 2. 순위 범위 계산
-  const startRank = Math.max(1, userRank - range);
-  const endRank = userRank + range;
+  return data || [];
+};
 
-  // 3. 해당 범위의 순위 조회
-  const { data, error } = await supabase
-    .from('leaderboard')
-    .select('*')
-    .gte('rank', startRank)
-    .lte('rank', endRank)
-    .order('rank', { ascending: true });
+/**
+ * 특정 사용자 주변 순위 조회 (nickname 기반)
+ * (해당 사용자 위아래 N명씩, 단일 RPC 호출)
+ *
+ * 반환 항목의 position으로 커서를 만들어 getLeaderboardPage()로 양방향 스크롤 가능
+ */
+export const getRankingsAroundUser = async (
+  nickname: string,
+  range: number = 5
+): Promise<LeaderboardPageEntry[]> => {
+  const { data, error } = await supabase.rpc('get_leaderboard_around_user', {
+    p_nickname: nickname,
+    p_range: range,
+  });
 
   if (error) {
     throw error;
   }
 
-  return data || [];
+  if (!data || data.length === 0) {
+    throw new Error('User not found in leaderboard');
+  }
+
+  return data;
 };
 
+/**
+ * 리더보드 실시간 변경 이벤트
+ * - donation: donations INSERT (최근 기부 목록 갱신용)
+ * - user: users INSERT/UPDATE (트리거가 갱신한 통계, 순위 재계산용)
+ */
+export type LeaderboardChange =
+  | { type: 'donation'; donation: RecentDonation }
+  | { type: 'user'; user: User; isNew: boolean };
+
 /**
  * 리더보드 실시간 구독
  *
- * @param callback - 리더보드 변경 시 호출될 콜백 함수
+ * 변경 payload를 그대로 전달하며 서버 재조회는 하지 않음
+ * (기부 N건 × 클라이언트 수만큼 RPC가 발생하는 것을 방지)
+ *
+ * @param onChange - 변경 이벤트마다 호출될 콜백 함수
+ * @param onStatusChange - 채널 상태 변경 시 호출될 콜백 함수
  * @returns Unsubscribe 함수
  */
 export const subscribeToLeaderboard = (
-  callback: (payload: LeaderboardEntry[]) => void
+  onChange: (change: LeaderboardChange) => void,
+  onStatusChange?: (status: `${REALTIME_SUBSCRIBE_STATES}`) => void
 ): (() => void) => {
-  // donations 테이블 변경 감지
-  const subscription = supabase
+  const channel = supabase
     .channel('leaderboard-changes')
-    .on(
+    .on<Donation>(
       'postgres_changes',
       {
         event: 'INSERT',
         schema: 'public',
         table: 'donations',
       },
-      async () => {
-        // 기부가 발생하면 리더보드 재조회
-        const updatedLeaderboard = await getTopRankers(10);
-        callback(updatedLeaderboard);
+      payload => {
+        const { id, nickname, amount, created_at } = payload.new;
+        onChange({ type: 'donation', donation: { id, nickname, amount, created_at } });
+      }
+    )
+    .on<User>(
+      'postgres_changes',
+      {
+        event: '*',
+        schema: 'public',
+        table: 'users',
+      },
+      payload => {
+        if (payload.eventType === 'INSERT' || payload.eventType === 'UPDATE') {
+          // INSERT = 첫 기부로 새로 진입한 사용자 (통계 사용자 수 증분용)
+          onChange({ type: 'user', user: payload.new, isNew: payload.eventType === 'INSERT' });
+        }
       }
     )
-    .subscribe();
+    .subscribe(status => {
+      onStatusChange?.(status);
+    });
 
   // Unsubscribe 함수 반환
   return () => {
-    subscription.unsubscribe();
+    supabase.removeChannel(channel);
   };
 };
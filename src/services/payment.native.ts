@@ -9,7 +9,6 @@ import {
   endConnection,
   getProducts,
   requestPurchase,
-  finishTransaction,
   purchaseUpdatedListener,
   purchaseErrorListener,
   type Purchase,
@@ -17,10 +16,10 @@ import {
   type ProductPurchase,
 } from 'react-native-iap';
 import { Platform } from 'react-native';
-import AsyncStorage from '@react-native-async-storage/async-storage';
-import { supabase } from './supabase';
+import { submitDonation } from './donationOutbox';
 import {
   PRODUCT_IDS,
+  DONATION_AMOUNT,
   PAYMENT_ERROR_CODES,
   PAYMENT_ERROR_MESSAGES,
   PAYMENT_RETRY_CONFIG,
@@ -36,14 +35,6 @@ import type {
 } from '../types/payment';
 import { IAP_TEST_MODE } from '../config/env';
 
-/**
- * AsyncStorage 키
- */
-const STORAGE_KEYS = {
-  FIRST_DONATION: '@burn-a-buck:first-donation',
-  PENDING_PURCHASE: '@burn-a-buck:pending-purchase',
-} as const;
-
 /**
  * Platform 매핑 함수
  * React Native Platform.OS → Supabase platform 값
@@ -281,14 +272,8 @@ class PaymentService implements IPaymentService {
       }
 
       // 구매 완료 처리 (영수증 검증 및 Supabase 저장)
-      const result = await this.finalizePurchase(purchase, nickname);
-
-      // 거래 완료 처리
-      if (!IAP_TEST_MODE) {
-        await finishTransaction({ purchase, isConsumable: true });
-      }
-
-      return result;
+      // 거래 완료(소비)는 서버 저장이 확인된 뒤 기부 대기열이 처리
+      return await this.finalizePurchase(purchase, nickname);
     } catch (error: any) {
       console.error('[PaymentService] Purchase failed:', error);
 
@@ -405,21 +390,25 @@ class PaymentService implements IPaymentService {
 
       const { receiptInfo } = validationResult;
 
-      // 2. Supabase에 저장 (중복 방지 포함)
-      const { donation, isFirstDonation } = await this.saveDonationToSupabase(
-        receiptInfo,
-        nickname
-      );
+      // 2. Supabase에 저장 (중복 방지 포함, 실패 시 대기열에서 재시도)
+      const { donation, isFirstDonation, rank, totalDonated, isPending, receiptToken } =
+        await this.saveDonationToSupabase(purchase, receiptInfo, nickname);
 
       console.log('[PaymentService] Purchase finalized:', {
         donation,
         isFirstDonation,
+        rank,
+        isPending,
       });
 
       return {
         success: true,
         donation,
         isFirstDonation,
+        rank: rank ?? undefined,
+        totalDonated,
+        isPending,
+        receiptToken,
       };
     } catch (error) {
       console.error('[PaymentService] Finalize purchase failed:', error);
@@ -434,64 +423,87 @@ class PaymentService implements IPaymentService {
 
   /**
    * Supabase에 기부 저장 (중복 방지 포함, nickname 기반)
+   *
+   * record_donation RPC 한 번으로 영수증 중복 확인, 기부 저장, 사용자 통계 갱신,
+   * 첫 기부 여부 및 순위 계산을 단일 트랜잭션에서 처리
+   *
+   * 기부는 먼저 대기열(outbox)에 보관되므로 네트워크가 불안정해도 유실되지 않으며,
+   * 즉시 저장되지 않으면 isPending = true로 바로 반환 (저장/구매 소비는 백그라운드 처리)
+   * 대기 중에는 첫 기부 여부를 알 수 없으므로 isFirstDonation = undefined
+   * (저장 결과는 subscribeDonationOutbox로 전달되며, 첫 기부 플래그는 대기열이 저장)
    */
   private async saveDonationToSupabase(
+    purchase: Purchase,
     receiptInfo: ReceiptInfo,
     nickname: string
-  ): Promise<{ donation: any; isFirstDonation: boolean }> {
+  ): Promise<{
+    donation: any;
+    isFirstDonation?: boolean;
+    rank: number | null;
+    totalDonated?: number;
+    isPending: boolean;
+    receiptToken: string;
+  }> {
     try {
-      // 1. 중복 결제 확인
-      const { data: existingDonation, error: checkError } = await supabase
-        .from('donations')
-        .select('*')
-        .eq('receipt_token', receiptInfo.token)
-        .single();
-
-      if (checkError && checkError.code !== 'PGRST116') {
-        // PGRST116 = 결과 없음 (정상)
-        throw checkError;
-      }
-
-      if (existingDonation) {
-        console.warn('[PaymentService] Duplicate payment detected:', receiptInfo.token);
-        throw this.createPaymentError(PAYMENT_ERROR_CODES.DUPLICATE_PAYMENT);
-      }
-
-      // 2. 첫 기부 여부 확인 (nickname 기반)
-      const isFirstDonation = await this.checkFirstDonation(nickname);
-
-      // 3. donations 테이블에 저장
       const donationData = {
         nickname,
-        amount: 1000,
+        amount: DONATION_AMOUNT,
         receipt_token: receiptInfo.token,
         transaction_id: receiptInfo.transactionId,
         platform: mapPlatformToDb(receiptInfo.platform),
       };
 
-      const { data: donation, error: insertError } = await supabase
-        .from('donations')
-        .insert(donationData)
-        .select()
-        .single();
+      const submitted = await submitDonation(donationData, {
+        productId: purchase.productId,
+        transactionId: purchase.transactionId || '',
+        transactionDate: purchase.transactionDate,
+        transactionReceipt: purchase.transactionReceipt,
+        purchaseToken: purchase.purchaseToken || '',
+      });
+
+      if (submitted.status === 'queued') {
+        console.log('[PaymentService] Donation queued for background save:', receiptInfo.token);
 
-      if (insertError) {
-        throw insertError;
+        return {
+          donation: donationData,
+          isFirstDonation: undefined,
+          rank: null,
+          isPending: true,
+          receiptToken: receiptInfo.token,
+        };
       }
 
-      // 4. 첫 기부 플래그 업데이트 (AsyncStorage)
-      if (isFirstDonation) {
-        await AsyncStorage.setItem(
-          STORAGE_KEYS.FIRST_DONATION,
-          new Date().toISOString()
-        );
+      if (submitted.status === 'rejected') {
+        // 재시도해도 저장될 수 없는 기부 (dead-letter 보관, 구매는 소비하지 않음)
+        console.error('[PaymentService] Donation rejected by server:', submitted.error);
+        throw this.createPaymentError(PAYMENT_ERROR_CODES.DONATION_REJECTED, submitted.error);
       }
 
+      const { recorded } = submitted;
+
+      if (recorded.isDuplicate) {
+        console.warn('[PaymentService] Duplicate payment detected:', receiptInfo.token);
+        throw this.createPaymentError(PAYMENT_ERROR_CODES.DUPLICATE_PAYMENT);
+      }
+
+      // 첫 기부 플래그(AsyncStorage)는 대기열이 서버 확인 시 저장
+      const { isFirstDonation } = recorded;
+
+      const donation = {
+        ...donationData,
+        id: recorded.donationId,
+        created_at: recorded.createdAt,
+      };
+
       console.log('[PaymentService] Donation saved to Supabase:', donation);
 
       return {
         donation,
         isFirstDonation,
+        rank: recorded.rank,
+        totalDonated: recorded.user.total_donated,
+        isPending: false,
+        receiptToken: receiptInfo.token,
       };
     } catch (error) {
       console.error('[PaymentService] Failed to save to Supabase:', error);
@@ -504,102 +516,6 @@ class PaymentService implements IPaymentService {
     }
   }
 
-  /**
-   * 첫 기부 여부 확인 (nickname 기반)
-   *
-   * Supabase donations 테이블을 nickname으로 조회
-   * 로그인 없이도 작동 (익명 사용자 지원)
-   *
-   * @param nickname - 사용자 닉네임
-   * @returns true: 첫 기부, false: 재기부
-   */
-  private async checkFirstDonation(nickname: string): Promise<boolean> {
-    try {
-      console.log('[checkFirstDonation] Checking first donation for nickname:', nickname);
-
-      // nickname으로 기부 내역 조회
-      const { data: donations, error } = await supabase
-        .from('donations')
-        .select('id')
-        .eq('nickname', nickname)
-        .limit(1);
-
-      if (error) {
-        console.error('[checkFirstDonation] Database error:', error);
-        // 에러 시 AsyncStorage fallback
-        const firstDonationDate = await AsyncStorage.getItem(
-          STORAGE_KEYS.FIRST_DONATION
-        );
-        const isFirst = !firstDonationDate;
-        console.log('[checkFirstDonation] Fallback to AsyncStorage due to error:', isFirst);
-        return isFirst;
-      }
-
-      // 기부 내역이 없으면 첫 기부
-      const isFirst = !donations || donations.length === 0;
-      console.log('[checkFirstDonation] Database result:', {
-        nickname,
-        isFirst,
-        donationCount: donations?.length || 0,
-      });
-      return isFirst;
-    } catch (err) {
-      console.error('[checkFirstDonation] Unexpected error:', err);
-      // 에러 시 AsyncStorage fallback
-      const firstDonationDate = await AsyncStorage.getItem(
-        STORAGE_KEYS.FIRST_DONATION
-      );
-      const isFirst = !firstDonationDate;
-      console.log('[checkFirstDonation] Fallback to AsyncStorage due to exception:', isFirst);
-      return isFirst;
-    }
-  }
-
-  /**
-   * 사용자 기부 통계 업데이트
-   * @deprecated 트리거가 자동으로 처리하므로 더 이상 사용하지 않음
-   */
-  private async updateUserDonationStats(
-    userId: string,
-    nickname: string,
-    isFirstDonation: boolean
-  ): Promise<void> {
-    try {
-      // 사용자 정보 조회
-      const { data: existingUser } = await supabase
-        .from('users')
-        .select('*')
-        .eq('id', userId)
-        .single();
-
-      if (existingUser) {
-        // 기존 사용자 업데이트
-        await supabase
-          .from('users')
-          .update({
-            nickname,
-            total_donated: existingUser.total_donated + 1000,
-            last_donation_at: new Date().toISOString(),
-            badge_earned: isFirstDonation ? true : existingUser.badge_earned,
-          })
-          .eq('id', userId);
-      } else {
-        // 새 사용자 생성
-        await supabase.from('users').insert({
-          id: userId,
-          nickname,
-          total_donated: 1000,
-          first_donation_at: new Date().toISOString(),
-          last_donation_at: new Date().toISOString(),
-          badge_earned: isFirstDonation,
-        });
-      }
-    } catch (error) {
-      console.error('[PaymentService] Failed to update user stats:', error);
-      // 사용자 통계 업데이트 실패는 치명적이지 않으므로 로그만 남김
-    }
-  }
-
   /**
    * 초기화 확인
    */
@@ -649,10 +565,11 @@ export async function purchaseWithRetry(
     } catch (error: any) {
       lastError = error;
 
-      // 사용자 취소나 중복 결제는 재시도하지 않음
+      // 사용자 취소, 중복 결제, 서버 거부는 재시도하지 않음
       if (
         error.code === PAYMENT_ERROR_CODES.USER_CANCELLED ||
-        error.code === PAYMENT_ERROR_CODES.DUPLICATE_PAYMENT
+        error.code === PAYMENT_ERROR_CODES.DUPLICATE_PAYMENT ||
+        error.code === PAYMENT_ERROR_CODES.DONATION_REJECTED
       ) {
         throw error;
       }
@@ -6,6 +6,44 @@
 
 import { supabase } from './supabase';
 import type { User, UserInsert, UserUpdate } from '../types/database.types';
+import { LruCache } from '../utils/lruCache';
+import { normalizeNickname } from '../utils/nicknameNormalize';
+
+export { normalizeNickname };
+
+/** 닉네임 확인 결과 캐시 크기 */
+const NICKNAME_CACHE_SIZE = 100;
+
+/** 사용 가능 응답 TTL (다른 사용자가 곧 가져갈 수 있으므로 짧게) */
+const NICKNAME_AVAILABLE_TTL = 10 * 1000;
+
+/** 사용 중 응답 TTL (닉네임이 다시 풀리는 경우는 거의 없음) */
+const NICKNAME_TAKEN_TTL = 5 * 60 * 1000;
+
+/**
+ * 닉네임 확인 결과 캐시 (정규화된 닉네임 → 사용 가능 여부)
+ */
+const nicknameAvailabilityCache = new LruCache<string, boolean>(NICKNAME_CACHE_SIZE);
+
+/**
+ * 진행 중인 닉네임 확인 요청 (같은 값에 대한 동시 요청을 하나로 합침)
+ */
+const pendingNicknameChecks = new Map<string, Promise<boolean>>();
+
+export interface NicknameAvailability {
+  nickname: string;
+  isAvailable: boolean;
+  /** 사용 중인 닉네임일 때 추천하는 사용 가능한 대체 닉네임 */
+  suggestions: string[];
+}
+
+const cacheNicknameAvailability = (nickname: string, isAvailable: boolean) => {
+  nicknameAvailabilityCache.set(
+    normalizeNickname(nickname),
+    isAvailable,
+    isAvailable ? NICKNAME_AVAILABLE_TTL : NICKNAME_TAKEN_TTL
+  );
+};
 
 /**
  * 닉네임으로 사용자 조회
@@ -55,6 +93,10 @@ export const createUser = async (user: UserInsert): Promise<User> => {
     throw error;
   }
 
+  if (user.nickname) {
+    cacheNicknameAvailability(user.nickname, false);
+  }
+
   return data;
 };
 
@@ -78,17 +120,76 @@ export const updateUser = async (nickname: string, updates: UserUpdate): Promise
 
 /**
  * 닉네임 사용 가능 여부 확인
+ *
+ * 대소문자/전각·반각 차이는 같은 닉네임으로 취급 (정규화 인덱스 단일 조회)
+ * 최근 응답은 LRU 캐시에서 바로 반환하고, 같은 값의 동시 요청은 하나로 합침
  */
 export const checkNicknameAvailable = async (nickname: string): Promise<boolean> => {
-  const { data, error } = await supabase.rpc('check_nickname_available', {
-    p_nickname: nickname,
+  const key = normalizeNickname(nickname);
+
+  const cached = nicknameAvailabilityCache.get(key);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const pending = pendingNicknameChecks.get(key);
+  if (pending) {
+    return pending;
+  }
+
+  const request = (async () => {
+    const { data, error } = await supabase.rpc('check_nickname_available', {
+      p_nickname: nickname,
+    });
+
+    if (error) {
+      throw error;
+    }
+
+    cacheNicknameAvailability(nickname, data as boolean);
+    return data as boolean;
+  })().finally(() => {
+    pendingNicknameChecks.delete(key);
+  });
+
+  pendingNicknameChecks.set(key, request);
+  return request;
+};
+
+/**
+ * 여러 닉네임의 사용 가능 여부 + 대체 닉네임 추천을 한 번에 조회
+ *
+ * @param nicknames - 확인할 닉네임 목록 (최대 20개)
+ * @param suggestionCount - 사용 중인 닉네임마다 추천받을 대체 닉네임 수
+ */
+export const checkNicknamesAvailable = async (
+  nicknames: string[],
+  suggestionCount: number = 3
+): Promise<NicknameAvailability[]> => {
+  const { data, error } = await supabase.rpc('check_nicknames_available', {
+    p_nicknames: nicknames,
+    p_suggestion_count: suggestionCount,
   });
 
   if (error) {
     throw error;
   }
 
-  return data as boolean;
+  const results: NicknameAvailability[] = (data || []).map(
+    (row: { nickname: string; is_available: boolean; suggestions: string[] | null }) => ({
+      nickname: row.nickname,
+      isAvailable: row.is_available,
+      suggestions: row.suggestions || [],
+    })
+  );
+
+  // 추천 닉네임도 방금 확인된 값이므로 선택 시 추가 요청 없이 바로 확인됨
+  results.forEach(result => {
+    cacheNicknameAvailability(result.nickname, result.isAvailable);
+    result.suggestions.forEach(suggestion => cacheNicknameAvailability(suggestion, true));
+  });
+
+  return results;
 };
 
 /**
@@ -97,19 +198,14 @@ export const checkNicknameAvailable = async (nickname: string): Promise<boolean>
 export const getUserRank = async (
   nickname: string
 ): Promise<{ rank: number; total_donated: number; nickname: string } | null> => {
-  // RPC 함수 대신 leaderboard 뷰에서 직접 조회
-  const { data, error } = await supabase
-    .from('leaderboard')
-    .select('rank, total_donated, nickname')
-    .eq('nickname', nickname)
-    .single();
+  // 인덱스 기반 순위 계산 RPC (leaderboard 뷰 전체 스캔 회피)
+  const { data, error } = await supabase.rpc('get_user_rank_by_nickname', {
+    p_nickname: nickname,
+  });
 
   if (error) {
-    if (error.code === 'PGRST116') {
-      return null;
-    }
     throw error;
   }
 
-  return data;
+  return data?.[0] || null;
 };
@@ -8,6 +8,7 @@ export interface User {
   id: string;
   nickname: string | null;
   total_donated: number;
+  donation_count: number;
   first_donation_at: string | null;
   last_donation_at: string | null;
   badge_earned: boolean;
@@ -33,8 +34,31 @@ export interface LeaderboardEntry {
   last_donation_at: string | null;
   badge_earned: boolean;
   donation_count: number;
+  first_donation_at?: string | null;
+}
+
+/**
+ * 커서 기반 리더보드 페이지 항목
+ * position: 전체 정렬에서의 1부터 시작하는 행 번호 (동점자도 서로 다름)
+ */
+export interface LeaderboardPageEntry extends LeaderboardEntry {
+  first_donation_at: string | null;
+  position: number;
+}
+
+/**
+ * 리더보드 페이지 커서 (경계 행의 정렬 키 + rank/position)
+ */
+export interface LeaderboardCursor {
+  total_donated: number;
+  first_donation_at: string | null;
+  id: string;
+  rank: number;
+  position: number;
 }
 
+export type RecentDonation = Pick<Donation, 'id' | 'nickname' | 'amount' | 'created_at'>;
+
 export interface LeaderboardStats {
   total_users: number;
   total_donations_count: number;
@@ -42,10 +66,21 @@ export interface LeaderboardStats {
   average_donation: number;
 }
 
+export type DonationTrendBucketType = 'hour' | 'day';
+
+export interface DonationTrendBucket {
+  bucket_start: string;
+  donations_count: number;
+  amount_donated: number;
+  new_users: number;
+}
+
 // Insert types (for creating new records)
-export type UserInsert = Omit<User, 'id' | 'created_at' | 'updated_at'>;
+export type UserInsert = Omit<User, 'id' | 'donation_count' | 'created_at' | 'updated_at'>;
 export type DonationInsert = Omit<Donation, 'id' | 'created_at'>;
 
 // Update types (for updating existing records)
-export type UserUpdate = Partial<Omit<User, 'id' | 'created_at' | 'updated_at'>>;
+export type UserUpdate = Partial<
+  Omit<User, 'id' | 'donation_count' | 'created_at' | 'updated_at'>
+>;
 export type DonationUpdate = Partial<Omit<Donation, 'id' | 'created_at'>>;
@@ -17,16 +17,21 @@ export type RootStackParamList = {
   /** 메인 화면 (기부 버튼) */
   Main: undefined;
 
+  /** 전체 순위 화면 */
+  Leaderboard: undefined;
+
   /** 기부 완료 화면 */
   DonationComplete: {
     /** 기부 정보 */
     donation: DonationInfo;
-    /** 첫 기부 여부 */
-    isFirstDonation: boolean;
+    /** 첫 기부 여부 (서버 저장 대기 중이면 undefined) */
+    isFirstDonation?: boolean;
     /** 사용자 순위 (선택사항) */
     rank?: number;
     /** 총 후원금액 (선택사항) */
     totalDonated?: number;
+    /** 서버 저장 대기 중인 기부의 영수증 토큰 (저장 확인 시 화면 갱신) */
+    pendingReceiptToken?: string;
   };
 };
 
@@ -40,6 +45,8 @@ export type OnboardingScreenProps = StackScreenProps<
 
 export type MainScreenProps = StackScreenProps<RootStackParamList, 'Main'>;
 
+export type LeaderboardScreenProps = StackScreenProps<RootStackParamList, 'Leaderboard'>;
+
 export type DonationCompleteScreenProps = StackScreenProps<
   RootStackParamList,
   'DonationComplete'
@@ -192,8 +192,16 @@ export interface PaymentResult {
   success: boolean;
   /** 기부 정보 (성공 시) */
   donation?: DonationInfo;
-  /** 첫 기부 여부 (필수 - DB 기반 판단) */
-  isFirstDonation: boolean;
+  /** 첫 기부 여부 (DB 기반 판단, 서버 저장 대기 중이면 undefined) */
+  isFirstDonation?: boolean;
+  /** 이 기부까지 반영된 순위 (성공 시) */
+  rank?: number;
+  /** 이 기부까지 반영된 총 후원금액 (성공 시) */
+  totalDonated?: number;
+  /** 서버 저장 대기 중 여부 (오프라인 대기열에서 백그라운드 저장) */
+  isPending?: boolean;
+  /** 영수증 토큰 (대기 중인 기부의 저장 결과 구독용) */
+  receiptToken?: string;
   /** 에러 정보 (실패 시) */
   error?: PaymentError;
 }
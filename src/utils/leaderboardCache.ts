@@ -0,0 +1,241 @@
+/**
+ * Leaderboard Cache Utilities
+ *
+ * Realtime 변경분을 React Query 캐시 데이터에 반영하는 순수 함수들
+ * (서버 재조회 없이 로컬에서 병합/재정렬)
+ */
+
+import type {
+  DonationTrendBucket,
+  DonationTrendBucketType,
+  LeaderboardEntry,
+  LeaderboardStats,
+  RecentDonation,
+  User,
+} from '../types/database.types';
+
+/** 추이 구간 길이 (UTC 기준, epoch에 정렬됨) */
+const TREND_BUCKET_MS: Record<DonationTrendBucketType, number> = {
+  hour: 1000 * 60 * 60,
+  day: 1000 * 60 * 60 * 24,
+};
+
+/**
+ * ISO 8601 문자열을 비교 가능한 timestamp로 변환
+ * (Realtime payload와 RPC 응답의 timestamptz 포맷 차이를 흡수)
+ */
+const toTime = (value: string | null | undefined): number | null => {
+  if (!value) return null;
+  const time = Date.parse(value);
+  return Number.isNaN(time) ? null : time;
+};
+
+/**
+ * 리더보드 정렬 비교 함수
+ * 서버 정렬 순서와 동일: total_donated DESC, first_donation_at ASC (NULLS LAST), id ASC
+ */
+export const compareLeaderboardEntries = (a: LeaderboardEntry, b: LeaderboardEntry): number => {
+  if (a.total_donated !== b.total_donated) {
+    return b.total_donated - a.total_donated;
+  }
+
+  const aFirst = toTime(a.first_donation_at);
+  const bFirst = toTime(b.first_donation_at);
+
+  if (aFirst !== bFirst) {
+    if (aFirst === null) return 1;
+    if (bFirst === null) return -1;
+    return aFirst - bFirst;
+  }
+
+  return a.id < b.id ? -1 : a.id > b.id ? 1 : 0;
+};
+
+/**
+ * users 행을 리더보드 항목으로 변환
+ * (rank는 병합 후 재계산되므로 임시값)
+ */
+export const userToLeaderboardEntry = (user: User): LeaderboardEntry => ({
+  id: user.id,
+  nickname: user.nickname ?? '',
+  total_donated: user.total_donated,
+  rank: 0,
+  last_donation_at: user.last_donation_at,
+  badge_earned: user.badge_earned,
+  donation_count: user.donation_count ?? 0,
+  first_donation_at: user.first_donation_at,
+});
+
+/**
+ * 변경된 사용자들을 상위 N명 목록에 병합하고 순위 재계산
+ *
+ * 캐시 목록은 전체 순위의 접두사(1~N등)이므로, 새로 진입하는 사용자는
+ * 반드시 변경 이벤트로 전달되며 밀려나는 사용자는 잘라내기로 제거된다.
+ * 따라서 RANK() 결과가 서버 계산과 동일하게 유지된다.
+ *
+ * @param current - 캐시된 랭커 목록 (없으면 그대로 반환)
+ * @param users - 변경된 users 행
+ * @param limit - 목록 최대 길이
+ * @returns 병합된 랭커 목록
+ */
+export const applyUserChanges = (
+  current: LeaderboardEntry[] | undefined,
+  users: User[],
+  limit: number
+): LeaderboardEntry[] | undefined => {
+  if (!current || users.length === 0) {
+    return current;
+  }
+
+  const byId = new Map(current.map(entry => [entry.id, entry]));
+
+  users.forEach(user => {
+    if (user.total_donated > 0) {
+      byId.set(user.id, userToLeaderboardEntry(user));
+    } else {
+      byId.delete(user.id);
+    }
+  });
+
+  const sorted = [...byId.values()].sort(compareLeaderboardEntries).slice(0, limit);
+
+  const ranked: LeaderboardEntry[] = [];
+
+  sorted.forEach((entry, index) => {
+    const prev = ranked[index - 1];
+    // 동점자는 앞 사람과 같은 순위 (RANK() 의미)
+    const isPeer =
+      prev !== undefined &&
+      prev.total_donated === entry.total_donated &&
+      toTime(prev.first_donation_at) === toTime(entry.first_donation_at);
+
+    ranked.push({ ...entry, rank: isPeer ? prev.rank : index + 1 });
+  });
+
+  return ranked;
+};
+
+/**
+ * 새 기부 내역을 최근 기부 목록에 병합
+ *
+ * @param current - 캐시된 최근 기부 목록 (없으면 그대로 반환)
+ * @param donations - 새로 추가된 기부 내역
+ * @param limit - 목록 최대 길이
+ * @returns 병합된 최근 기부 목록 (created_at DESC)
+ */
+export const mergeRecentDonations = (
+  current: RecentDonation[] | undefined,
+  donations: RecentDonation[],
+  limit: number
+): RecentDonation[] | undefined => {
+  if (!current || donations.length === 0) {
+    return current;
+  }
+
+  const byId = new Map(current.map(donation => [donation.id, donation]));
+  donations.forEach(donation => byId.set(donation.id, donation));
+
+  return [...byId.values()]
+    .sort((a, b) => (toTime(b.created_at) ?? 0) - (toTime(a.created_at) ?? 0))
+    .slice(0, limit);
+};
+
+/**
+ * 새 기부를 전체 통계에 반영 (서버 카운터 트리거와 같은 증분)
+ *
+ * @param current - 캐시된 통계 (없으면 그대로 반환)
+ * @param donations - 새로 추가된 기부 내역
+ * @param newUserCount - 첫 기부로 새로 진입한 사용자 수
+ * @returns 갱신된 통계
+ */
+export const applyDonationsToStats = (
+  current: LeaderboardStats | undefined,
+  donations: RecentDonation[],
+  newUserCount: number
+): LeaderboardStats | undefined => {
+  if (!current || (donations.length === 0 && newUserCount === 0)) {
+    return current;
+  }
+
+  const totalDonationsCount = current.total_donations_count + donations.length;
+  const totalAmountDonated =
+    current.total_amount_donated + donations.reduce((sum, donation) => sum + donation.amount, 0);
+
+  return {
+    total_users: current.total_users + newUserCount,
+    total_donations_count: totalDonationsCount,
+    total_amount_donated: totalAmountDonated,
+    average_donation:
+      totalDonationsCount > 0 ? Math.round(totalAmountDonated / totalDonationsCount) : 0,
+  };
+};
+
+/**
+ * 새 기부를 기부 추이 구간에 반영
+ *
+ * - 각 기부/신규 사용자를 UTC 구간에 더함
+ * - 현재 구간이 목록 마지막 구간 이후로 넘어가면 빈 구간을 채워 밀어내고 길이를 유지
+ * - 목록 범위보다 오래된 시각은 무시
+ *
+ * @param current - 캐시된 추이 (시간 오름차순, 없으면 그대로 반환)
+ * @param bucket - 구간 단위
+ * @param donations - 새로 추가된 기부 내역
+ * @param newUserTimes - 새로 진입한 사용자의 첫 기부 시각
+ * @returns 갱신된 추이
+ */
+export const applyDonationsToTrend = (
+  current: DonationTrendBucket[] | undefined,
+  bucket: DonationTrendBucketType,
+  donations: RecentDonation[],
+  newUserTimes: string[]
+): DonationTrendBucket[] | undefined => {
+  if (!current || current.length === 0 || (donations.length === 0 && newUserTimes.length === 0)) {
+    return current;
+  }
+
+  const step = TREND_BUCKET_MS[bucket];
+  const toBucketStart = (value: string | null | undefined): number | null => {
+    const time = toTime(value);
+    return time === null ? null : Math.floor(time / step) * step;
+  };
+
+  const buckets = current.map(entry => ({ ...entry }));
+  const starts = buckets.map(entry => toBucketStart(entry.bucket_start) ?? 0);
+
+  const add = (value: string | null | undefined, apply: (entry: DonationTrendBucket) => void) => {
+    const start = toBucketStart(value);
+    if (start === null) return;
+
+    // 새 구간 시작: 사이의 빈 구간까지 채우고 앞에서 밀어냄
+    for (let next = starts[starts.length - 1] + step; next <= start; next += step) {
+      buckets.push({
+        bucket_start: new Date(next).toISOString(),
+        donations_count: 0,
+        amount_donated: 0,
+        new_users: 0,
+      });
+      starts.push(next);
+      buckets.shift();
+      starts.shift();
+    }
+
+    const index = starts.indexOf(start);
+    if (index >= 0) {
+      apply(buckets[index]);
+    }
+  };
+
+  donations.forEach(donation =>
+    add(donation.created_at, entry => {
+      entry.donations_count += 1;
+      entry.amount_donated += donation.amount;
+    })
+  );
+  newUserTimes.forEach(time =>
+    add(time, entry => {
+      entry.new_users += 1;
+    })
+  );
+
+  return buckets;
+};
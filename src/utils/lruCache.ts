@@ -0,0 +1,60 @@
+/**
+ * LRU Cache Utilities
+ *
+ * 항목별 TTL을 지원하는 작은 LRU 캐시 (Map의 삽입 순서를 사용 순서로 활용)
+ */
+
+interface LruEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+export class LruCache<K, V> {
+  private readonly entries = new Map<K, LruEntry<V>>();
+
+  /**
+   * @param maxSize - 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+   */
+  constructor(private readonly maxSize: number) {}
+
+  /**
+   * 값 조회 (만료된 항목은 제거 후 undefined 반환)
+   */
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    // 최근 사용으로 갱신
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  /**
+   * 값 저장
+   *
+   * @param ttlMs - 이 항목의 유효 시간 (ms)
+   */
+  set(key: K, value: V, ttlMs: number): void {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+
+    if (this.entries.size > this.maxSize) {
+      const oldestKey = this.entries.keys().next().value as K;
+      this.entries.delete(oldestKey);
+    }
+  }
+
+  delete(key: K): void {
+    this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
@@ -0,0 +1,16 @@
+/**
+ * Nickname Normalization
+ *
+ * 닉네임 비교용 정규화 키 (서버 normalize_nickname과 동일한 규칙)
+ * 외부 의존성이 없어 앱과 scripts/ 양쪽에서 사용
+ */
+
+/**
+ * 닉네임 비교용 정규화 (서버: lower(btrim(normalize(p, NFKC))))
+ * - NFKC를 먼저 적용하여 전각 공백(U+3000) 등도 ' '로 바꾼 뒤
+ * - 앞뒤 ASCII 공백만 제거 (btrim과 같은 공백 집합, String.trim()은 탭/줄바꿈 등도 제거하므로 사용하지 않음)
+ * - 소문자로 통합
+ * 'Tester', 'tester', 'ｔｅｓｔｅｒ', '　Tester　'는 모두 같은 닉네임으로 취급됨
+ */
+export const normalizeNickname = (nickname: string): string =>
+  nickname.normalize('NFKC').replace(/^ +| +$/g, '').toLowerCase();
@@ -0,0 +1,172 @@
+/**
+ * Query Persistence Utilities
+ *
+ * 리더보드 관련 React Query 캐시를 AsyncStorage에 스냅샷으로 저장/복원
+ * (콜드 스타트 시 네트워크 응답을 기다리지 않고 마지막 데이터로 즉시 렌더링 후
+ *  항상 백그라운드에서 재검증 - stale-while-revalidate)
+ *
+ * 스냅샷 형식 (compact):
+ * { v: 버전, t: 저장 시각, e: [[queryKey, dataUpdatedAt, data], ...] }
+ */
+
+import AsyncStorage from '@react-native-async-storage/async-storage';
+import type { QueryClient, QueryKey } from '@tanstack/react-query';
+import { STORAGE_KEYS } from '../constants/storage';
+
+/**
+ * 스냅샷 버전
+ * 캐시 데이터 형태(RPC 반환 컬럼 등)가 바뀌면 올려서 이전 스냅샷을 폐기
+ */
+const SNAPSHOT_VERSION = 1;
+
+/** 스냅샷 최대 크기 (UTF-16 문자 수 기준) */
+const MAX_SNAPSHOT_SIZE = 64 * 1024;
+
+/** 이보다 오래된 항목은 복원하지 않음 */
+const MAX_ENTRY_AGE_MS = 1000 * 60 * 60 * 24; // 24시간
+
+/** 연속된 캐시 갱신을 하나의 저장으로 묶는 간격 */
+const SAVE_THROTTLE_MS = 1000;
+
+/**
+ * 저장 대상 쿼리 키 prefix
+ * (무한 스크롤 페이지 등 크기가 큰 쿼리는 제외)
+ */
+const PERSISTED_QUERY_PREFIXES: QueryKey[] = [
+  ['leaderboard', 'top'],
+  ['leaderboard', 'stats'],
+  ['donations', 'recent'],
+];
+
+type SnapshotEntry = [queryKey: QueryKey, dataUpdatedAt: number, data: unknown];
+
+interface QuerySnapshot {
+  v: number;
+  t: number;
+  e: SnapshotEntry[];
+}
+
+const isPersistedQuery = (queryKey: QueryKey): boolean =>
+  PERSISTED_QUERY_PREFIXES.some(prefix =>
+    prefix.every((part, index) => queryKey[index] === part)
+  );
+
+/**
+ * 현재 캐시에서 저장 대상 쿼리만 스냅샷으로 변환
+ * 크기 제한을 넘으면 가장 오래된 항목부터 제거
+ */
+const buildSnapshot = (queryClient: QueryClient): string | null => {
+  const entries: SnapshotEntry[] = queryClient
+    .getQueryCache()
+    .getAll()
+    .filter(
+      query =>
+        isPersistedQuery(query.queryKey) &&
+        query.state.status === 'success' &&
+        query.state.data !== undefined
+    )
+    .map(query => [query.queryKey, query.state.dataUpdatedAt, query.state.data] as SnapshotEntry)
+    // 최신 항목 우선 (제거는 뒤에서부터)
+    .sort((a, b) => b[1] - a[1]);
+
+  while (entries.length > 0) {
+    const serialized = JSON.stringify({
+      v: SNAPSHOT_VERSION,
+      t: Date.now(),
+      e: entries,
+    } satisfies QuerySnapshot);
+
+    if (serialized.length <= MAX_SNAPSHOT_SIZE) {
+      return serialized;
+    }
+
+    entries.pop();
+  }
+
+  return null;
+};
+
+/**
+ * 저장된 스냅샷을 캐시에 복원
+ *
+ * 캐시 데이터로 즉시 렌더링하되, 복원된 쿼리는 모두 stale로 표시하여
+ * 마운트 시 항상 백그라운드에서 재조회됨 (staleTime 이내의 스냅샷이라도 앱이 꺼져 있던
+ * 동안의 변경분은 실시간 채널로 전달되지 않으므로)
+ *
+ * @returns 복원된 쿼리 수
+ */
+export const restoreQueryCache = async (queryClient: QueryClient): Promise<number> => {
+  try {
+    const serialized = await AsyncStorage.getItem(STORAGE_KEYS.QUERY_CACHE);
+    if (!serialized) return 0;
+
+    const snapshot = JSON.parse(serialized) as QuerySnapshot;
+
+    if (snapshot.v !== SNAPSHOT_VERSION || !Array.isArray(snapshot.e)) {
+      await AsyncStorage.removeItem(STORAGE_KEYS.QUERY_CACHE);
+      return 0;
+    }
+
+    const now = Date.now();
+    let restored = 0;
+
+    snapshot.e.forEach(([queryKey, dataUpdatedAt, data]) => {
+      if (now - dataUpdatedAt > MAX_ENTRY_AGE_MS || !isPersistedQuery(queryKey)) return;
+      // 이미 네트워크에서 받은 데이터가 있으면 덮어쓰지 않음
+      if (queryClient.getQueryData(queryKey) !== undefined) return;
+
+      queryClient.setQueryData(queryKey, data, { updatedAt: dataUpdatedAt });
+      // 데이터는 유지하고 stale 표시만 (재조회는 구독 컴포넌트 마운트 시)
+      queryClient.invalidateQueries({ queryKey, exact: true, refetchType: 'none' });
+      restored += 1;
+    });
+
+    console.log(`[queryPersistence] Restored ${restored} cached queries`);
+    return restored;
+  } catch (err) {
+    console.error('[queryPersistence] Failed to restore query cache:', err);
+    await AsyncStorage.removeItem(STORAGE_KEYS.QUERY_CACHE).catch(() => undefined);
+    return 0;
+  }
+};
+
+/**
+ * 저장 대상 쿼리가 갱신될 때마다 스냅샷 저장 (throttle 적용)
+ *
+ * @returns 구독 해제 함수
+ */
+export const persistQueryCache = (queryClient: QueryClient): (() => void) => {
+  let saveTimer: ReturnType<typeof setTimeout> | null = null;
+
+  const save = async () => {
+    saveTimer = null;
+    const serialized = buildSnapshot(queryClient);
+
+    try {
+      if (serialized) {
+        await AsyncStorage.setItem(STORAGE_KEYS.QUERY_CACHE, serialized);
+      } else {
+        await AsyncStorage.removeItem(STORAGE_KEYS.QUERY_CACHE);
+      }
+    } catch (err) {
+      console.error('[queryPersistence] Failed to save query cache:', err);
+    }
+  };
+
+  const unsubscribe = queryClient.getQueryCache().subscribe(event => {
+    if (event.type !== 'updated' || event.action.type !== 'success') return;
+    if (!isPersistedQuery(event.query.queryKey)) return;
+
+    if (!saveTimer) {
+      saveTimer = setTimeout(save, SAVE_THROTTLE_MS);
+    }
+  });
+
+  return () => {
+    unsubscribe();
+    if (saveTimer) {
+      clearTimeout(saveTimer);
+      saveTimer = null;
+    }
+  };
+};
@@ -0,0 +1,78 @@
+-- ============================================
+-- Benchmark: explain
+-- Description: 워크로드별 쿼리의 EXPLAIN (ANALYZE, BUFFERS) 실행 계획 수집
+-- Note: 대부분 plpgsql 함수라 바깥 EXPLAIN에는 Function Scan만 보이므로
+--       auto_explain으로 함수 내부 쿼리의 실제 계획도 함께 출력
+-- ============================================
+--
+-- 사용 방법 (run.sh가 자동 실행):
+--   psql "$BENCH_DB_URL" -f supabase/bench/explain.sql > explain.txt 2>&1
+--
+-- 기부 저장은 실제 데이터를 바꾸므로 트랜잭션 안에서 실행 후 ROLLBACK
+-- ============================================
+
+\set ON_ERROR_STOP on
+
+-- auto_explain이 없는 빌드에서도 바깥 계획은 수집되도록 LOAD 실패는 무시
+\set ON_ERROR_STOP off
+LOAD 'auto_explain';
+\set ON_ERROR_STOP on
+
+SET auto_explain.log_min_duration = 0;
+SET auto_explain.log_analyze = on;
+SET auto_explain.log_buffers = on;
+SET auto_explain.log_nested_statements = on;
+SET client_min_messages = log;
+
+-- 중간 순위의 사용자를 샘플로 사용
+SELECT
+  nickname AS sample_nickname,
+  total_donated AS sample_total,
+  first_donation_at AS sample_first_at
+FROM users
+ORDER BY total_donated DESC, first_donation_at ASC, id ASC
+OFFSET (SELECT COUNT(*) / 2 FROM users)
+LIMIT 1
+\gset
+
+\echo '=== top_rankers ==='
+EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM get_top_rankers(10);
+
+\echo '=== rank_lookup ==='
+EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM get_user_rank_by_nickname(:'sample_nickname');
+
+-- 함수 안의 SQL은 파라미터화된 generic plan으로도 실행되므로 부분 인덱스 사용 여부를 따로 확인
+-- (leaderboard_rank_of 본문과 동일: Index Only Scan on idx_users_leaderboard 이어야 함)
+\echo '=== rank_of (generic plan) ==='
+SET plan_cache_mode = force_generic_plan;
+PREPARE bench_rank_of(INTEGER, TIMESTAMP WITH TIME ZONE) AS
+SELECT
+  1
+  + (SELECT COUNT(*) FROM users
+      WHERE total_donated > 0
+        AND total_donated > $1)
+  + (SELECT COUNT(*) FROM users
+      WHERE total_donated > 0
+        AND total_donated = $1
+        AND first_donation_at < $2);
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE bench_rank_of(:'sample_total', :'sample_first_at');
+DEALLOCATE bench_rank_of;
+RESET plan_cache_mode;
+
+\echo '=== leaderboard_around ==='
+EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM get_leaderboard_around_user(:'sample_nickname', 5);
+
+\echo '=== nickname_check ==='
+EXPLAIN (ANALYZE, BUFFERS) SELECT check_nickname_available(upper(:'sample_nickname')::VARCHAR);
+
+\echo '=== recent_donations ==='
+EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM get_recent_donations(10);
+
+\echo '=== stats ==='
+EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM get_leaderboard_stats();
+
+\echo '=== donate ==='
+BEGIN;
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM record_donation(:'sample_nickname', 'bench_explain_' || gen_random_uuid(), 'google_play', NULL, 1000);
+ROLLBACK;
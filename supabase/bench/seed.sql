@@ -0,0 +1,102 @@
+-- ============================================
+-- Benchmark: seed
+-- Description: 벤치마크용 대량 데이터 생성 (기본: 사용자 10만 명 / 기부 200만 건)
+-- ============================================
+--
+-- 사용 방법 (run.sh --seed가 자동 실행):
+--   psql "$BENCH_DB_URL" -v users=100000 -v donations=2000000 -f supabase/bench/seed.sql
+--
+-- - 기부는 batch 단위 multi-row INSERT ... SELECT generate_series로 생성 (배치마다 커밋)
+-- - 건별 트리거 대신 users / 통계 카운터를 집계 한 번으로 생성 후 트리거 재활성화
+-- - 기부 분포는 상위 사용자에게 몰리도록 치우침 (random()^3)
+--
+-- ⚠️ 주의: 기존 users / donations 데이터가 모두 삭제됩니다! (로컬 벤치마크 DB 전용)
+-- ============================================
+
+\set ON_ERROR_STOP on
+\timing on
+
+\if :{?users}
+\else
+  \set users 100000
+\endif
+
+\if :{?donations}
+\else
+  \set donations 2000000
+\endif
+
+\if :{?batch}
+\else
+  \set batch 200000
+\endif
+
+SELECT
+  set_config('bench.users', :'users', false),
+  set_config('bench.donations', :'donations', false),
+  set_config('bench.batch', :'batch', false);
+
+-- ============================================
+-- STEP 1: 기존 데이터 삭제
+-- ============================================
+TRUNCATE donations, users;
+
+-- ============================================
+-- STEP 2: 기부 대량 생성 (트리거 비활성화)
+-- ============================================
+ALTER TABLE donations DISABLE TRIGGER trigger_update_user_donation_stats;
+
+DO $$
+DECLARE
+  v_users INTEGER := current_setting('bench.users')::INTEGER;
+  v_donations BIGINT := current_setting('bench.donations')::BIGINT;
+  v_batch BIGINT := current_setting('bench.batch')::BIGINT;
+  v_from BIGINT := 1;
+BEGIN
+  IF v_users > 9999999 THEN
+    RAISE EXCEPTION 'users는 최대 9,999,999명까지 지원합니다 (닉네임 12자 제한)';
+  END IF;
+
+  WHILE v_from <= v_donations LOOP
+    INSERT INTO donations (nickname, amount, receipt_token, platform, transaction_id, created_at)
+    SELECT
+      'bench' || lpad((1 + floor(v_users * power(random(), 3)))::INTEGER::TEXT, 7, '0'),
+      1000,
+      'bench_seed_' || g,
+      CASE WHEN random() < 0.8 THEN 'google_play' ELSE 'app_store' END,
+      'bench_txn_' || g,
+      NOW() - random() * INTERVAL '90 days'
+    FROM generate_series(v_from, LEAST(v_from + v_batch - 1, v_donations)) AS g;
+
+    COMMIT;
+    RAISE NOTICE '기부 % / % 건 생성', LEAST(v_from + v_batch - 1, v_donations), v_donations;
+    v_from := v_from + v_batch;
+  END LOOP;
+END $$;
+
+ALTER TABLE donations ENABLE TRIGGER trigger_update_user_donation_stats;
+
+-- ============================================
+-- STEP 3: 사용자 통계 / 카운터 집계 생성
+-- ============================================
+INSERT INTO users (nickname, total_donated, donation_count, first_donation_at, last_donation_at, badge_earned)
+SELECT
+  d.nickname,
+  SUM(d.amount),
+  COUNT(*),
+  MIN(d.created_at),
+  MAX(d.created_at),
+  TRUE
+FROM donations d
+GROUP BY d.nickname;
+
+SELECT refresh_leaderboard_stats();
+
+VACUUM ANALYZE users;
+VACUUM ANALYZE donations;
+VACUUM ANALYZE donation_stats_buckets;
+
+-- ============================================
+-- STEP 4: 결과 확인
+-- ============================================
+SELECT * FROM get_leaderboard_stats();
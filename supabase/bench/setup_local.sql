@@ -0,0 +1,51 @@
+-- ============================================
+-- Benchmark: setup_local
+-- Description: 일반 PostgreSQL에서 마이그레이션을 실행하기 위한 Supabase 대체 객체
+-- Note: `supabase start` 로컬 스택처럼 이미 존재하는 객체는 건드리지 않음
+-- ============================================
+
+-- Supabase 기본 역할 (GRANT ... TO anon, authenticated 대상)
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'anon') THEN
+    CREATE ROLE anon NOLOGIN;
+  END IF;
+
+  IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'authenticated') THEN
+    CREATE ROLE authenticated NOLOGIN;
+  END IF;
+
+  IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'service_role') THEN
+    CREATE ROLE service_role NOLOGIN BYPASSRLS;
+  END IF;
+END $$;
+
+-- RLS 정책에서 사용하는 auth 함수 (002_rls_policies)
+CREATE SCHEMA IF NOT EXISTS auth;
+
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM pg_proc p JOIN pg_namespace n ON n.oid = p.pronamespace
+    WHERE n.nspname = 'auth' AND p.proname = 'role'
+  ) THEN
+    CREATE FUNCTION auth.role() RETURNS TEXT
+      LANGUAGE sql STABLE AS $fn$ SELECT 'authenticated'::TEXT $fn$;
+  END IF;
+
+  IF NOT EXISTS (
+    SELECT 1 FROM pg_proc p JOIN pg_namespace n ON n.oid = p.pronamespace
+    WHERE n.nspname = 'auth' AND p.proname = 'uid'
+  ) THEN
+    CREATE FUNCTION auth.uid() RETURNS UUID
+      LANGUAGE sql STABLE AS $fn$ SELECT NULL::UUID $fn$;
+  END IF;
+END $$;
+
+-- Realtime publication (007_realtime_leaderboard)
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_publication WHERE pubname = 'supabase_realtime') THEN
+    CREATE PUBLICATION supabase_realtime;
+  END IF;
+END $$;
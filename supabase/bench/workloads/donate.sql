@@ -0,0 +1,10 @@
+-- 기부 저장 (record_donation RPC: INSERT + 트리거의 users/통계 카운터 갱신 + 순위 계산)
+-- 기존 사용자에게 몰리도록 zipfian 분포, 일부는 신규 닉네임
+\set uid random_zipfian(1, :users + :users / 10, 1.07)
+SELECT * FROM record_donation(
+  ('bench' || lpad(:uid::TEXT, 7, '0'))::VARCHAR,
+  'bench_' || gen_random_uuid(),
+  'google_play',
+  NULL,
+  1000
+);
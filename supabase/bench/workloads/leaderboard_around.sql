@@ -0,0 +1,3 @@
+-- 내 주변 순위 조회 (get_leaderboard_around_user)
+\set uid random_zipfian(1, :users, 1.07)
+SELECT * FROM get_leaderboard_around_user(('bench' || lpad(:uid::TEXT, 7, '0'))::VARCHAR, 5);
@@ -0,0 +1,4 @@
+-- 닉네임 중복 확인 (check_nickname_available, 정규화 인덱스 조회)
+-- 절반은 사용 중, 절반은 사용 가능한 닉네임 / 대소문자를 바꿔 정규화 경로 확인
+\set uid random(1, :users * 2)
+SELECT check_nickname_available(upper('bench' || lpad(:uid::TEXT, 7, '0'))::VARCHAR);
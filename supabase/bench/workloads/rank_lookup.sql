@@ -0,0 +1,3 @@
+-- 닉네임으로 내 순위 조회 (get_user_rank_by_nickname)
+\set uid random_zipfian(1, :users, 1.07)
+SELECT * FROM get_user_rank_by_nickname(('bench' || lpad(:uid::TEXT, 7, '0'))::VARCHAR);
@@ -0,0 +1,2 @@
+-- 최근 기부 내역 조회 (get_recent_donations)
+SELECT * FROM get_recent_donations(10);
@@ -0,0 +1,2 @@
+-- 리더보드 전체 통계 조회 (get_leaderboard_stats, 카운터 행)
+SELECT * FROM get_leaderboard_stats();
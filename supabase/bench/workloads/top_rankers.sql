@@ -0,0 +1,2 @@
+-- 리더보드 상위 N명 폴링 (get_top_rankers)
+SELECT * FROM get_top_rankers(10);
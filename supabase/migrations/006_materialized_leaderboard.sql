@@ -0,0 +1,204 @@
+-- ============================================
+-- Migration: 006_materialized_leaderboard
+-- Description: 리더보드를 users 테이블의 저장 컬럼 + 복합 인덱스로 전환
+-- Reason: leaderboard 뷰는 매 조회마다 users 전체와 donations 전체를 조인하고
+--         RANK() OVER를 전체 테이블에 대해 계산함 (O(users + donations))
+-- Created: 2025-11-10
+-- ============================================
+
+-- ============================================
+-- Step 1: donation_count 컬럼 추가 (트리거로 증분 유지)
+-- ============================================
+ALTER TABLE users
+ADD COLUMN IF NOT EXISTS donation_count INTEGER NOT NULL DEFAULT 0 CHECK (donation_count >= 0);
+
+-- ============================================
+-- Step 2: 기존 데이터 백필
+-- ============================================
+UPDATE users u
+SET donation_count = d.cnt
+FROM (
+  SELECT nickname, COUNT(*)::INTEGER AS cnt
+  FROM donations
+  GROUP BY nickname
+) d
+WHERE u.nickname = d.nickname
+  AND u.donation_count <> d.cnt;
+
+-- 순위 계산은 first_donation_at이 항상 존재한다고 가정함
+UPDATE users
+SET first_donation_at = COALESCE(last_donation_at, created_at)
+WHERE total_donated > 0
+  AND first_donation_at IS NULL;
+
+-- ============================================
+-- Step 3: 리더보드 정렬 순서와 동일한 복합 인덱스
+-- ============================================
+-- 상위 N명 조회: 인덱스 앞에서부터 N개만 스캔
+-- 순위 조회: 인덱스 범위 COUNT (index-only scan)
+CREATE INDEX IF NOT EXISTS idx_users_leaderboard
+  ON users (total_donated DESC, first_donation_at ASC, id)
+  WHERE total_donated > 0;
+
+-- 복합 인덱스가 대체하므로 제거 (쓰기 비용 감소)
+DROP INDEX IF EXISTS idx_users_total_donated;
+
+-- ============================================
+-- Step 4: 트리거 재생성 (donation_count 증분 유지)
+-- ============================================
+CREATE OR REPLACE FUNCTION update_user_donation_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+  -- nickname으로 users 테이블 업데이트
+  UPDATE users
+  SET
+    total_donated = total_donated + NEW.amount,
+    donation_count = donation_count + 1,
+    last_donation_at = NEW.created_at,
+    first_donation_at = COALESCE(first_donation_at, NEW.created_at),
+    badge_earned = CASE
+      WHEN first_donation_at IS NULL THEN TRUE  -- 첫 기부 시 배지 획득
+      ELSE badge_earned
+    END
+  WHERE nickname = NEW.nickname;
+
+  -- users 테이블에 해당 nickname이 없으면 새로 생성
+  IF NOT FOUND THEN
+    INSERT INTO users (nickname, total_donated, donation_count, first_donation_at, last_donation_at, badge_earned)
+    VALUES (NEW.nickname, NEW.amount, 1, NEW.created_at, NEW.created_at, TRUE);
+  END IF;
+
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================
+-- Step 5: leaderboard 뷰 재생성 (donations 조인 제거)
+-- ============================================
+-- 하위 호환용 뷰. 순위 조회 경로는 아래 RPC 함수를 사용할 것
+CREATE OR REPLACE VIEW leaderboard AS
+SELECT
+  u.id,
+  u.nickname,
+  u.total_donated,
+  RANK() OVER (ORDER BY u.total_donated DESC, u.first_donation_at ASC) as rank,
+  u.last_donation_at,
+  u.badge_earned,
+  u.donation_count::BIGINT as donation_count
+FROM users u
+WHERE u.total_donated > 0
+ORDER BY rank;
+
+-- ============================================
+-- Function: leaderboard_rank_of
+-- Description: (total_donated, first_donation_at) 위치의 순위 계산
+-- Note: RANK() 의미와 동일 (앞선 사용자 수 + 1)
+--       두 COUNT 모두 idx_users_leaderboard 범위 스캔으로 처리됨
+--       (부분 인덱스 조건 total_donated > 0을 명시해야 플래너가 인덱스를 사용)
+-- ============================================
+CREATE OR REPLACE FUNCTION leaderboard_rank_of(
+  p_total_donated INTEGER,
+  p_first_donation_at TIMESTAMP WITH TIME ZONE
+)
+RETURNS BIGINT AS $$
+  SELECT
+    1
+    + (SELECT COUNT(*) FROM users
+        WHERE total_donated > 0
+          AND total_donated > p_total_donated)
+    + (SELECT COUNT(*) FROM users
+        WHERE total_donated > 0
+          AND total_donated = p_total_donated
+          AND first_donation_at < p_first_donation_at);
+$$ LANGUAGE sql STABLE;
+
+-- ============================================
+-- Function: get_user_rank (시그니처 유지)
+-- ============================================
+CREATE OR REPLACE FUNCTION get_user_rank(p_user_id UUID)
+RETURNS TABLE (
+  rank BIGINT,
+  total_donated INTEGER,
+  nickname VARCHAR(12)
+) AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    leaderboard_rank_of(u.total_donated, u.first_donation_at),
+    u.total_donated,
+    u.nickname
+  FROM users u
+  WHERE u.id = p_user_id
+    AND u.total_donated > 0;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Function: get_user_rank_by_nickname
+-- Description: nickname 기반 순위 조회 (user_id 제거 이후 클라이언트 경로)
+-- ============================================
+CREATE OR REPLACE FUNCTION get_user_rank_by_nickname(p_nickname VARCHAR(12))
+RETURNS TABLE (
+  rank BIGINT,
+  total_donated INTEGER,
+  nickname VARCHAR(12)
+) AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    leaderboard_rank_of(u.total_donated, u.first_donation_at),
+    u.total_donated,
+    u.nickname
+  FROM users u
+  WHERE u.nickname = p_nickname
+    AND u.total_donated > 0;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Function: get_top_rankers (시그니처 유지)
+-- Description: 인덱스에서 상위 N개만 읽은 뒤 그 안에서 순위 계산
+-- Note: 상위 N개는 전체 순서의 접두사이므로 RANK() 결과가 전체 기준과 동일
+-- ============================================
+CREATE OR REPLACE FUNCTION get_top_rankers(p_limit INTEGER DEFAULT 10)
+RETURNS TABLE (
+  id UUID,
+  nickname VARCHAR(12),
+  total_donated INTEGER,
+  rank BIGINT,
+  last_donation_at TIMESTAMP WITH TIME ZONE,
+  badge_earned BOOLEAN,
+  donation_count BIGINT
+) AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    t.id,
+    t.nickname,
+    t.total_donated,
+    RANK() OVER (ORDER BY t.total_donated DESC, t.first_donation_at ASC) as rank,
+    t.last_donation_at,
+    t.badge_earned,
+    t.donation_count::BIGINT
+  FROM (
+    SELECT u.*
+    FROM users u
+    WHERE u.total_donated > 0
+    ORDER BY u.total_donated DESC, u.first_donation_at ASC, u.id
+    LIMIT p_limit
+  ) t
+  ORDER BY t.total_donated DESC, t.first_donation_at ASC, t.id;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Comments 업데이트
+-- ============================================
+COMMENT ON COLUMN users.donation_count IS '총 기부 횟수 (트리거로 자동 증가)';
+COMMENT ON INDEX idx_users_leaderboard IS '리더보드 정렬 순서 인덱스 (상위 N명 / 순위 계산)';
+COMMENT ON VIEW leaderboard IS '리더보드 뷰 (하위 호환용, users 저장 컬럼 기반)';
+COMMENT ON FUNCTION update_user_donation_stats() IS '기부 발생 시 nickname으로 users 통계(금액/횟수) 자동 업데이트';
+COMMENT ON FUNCTION leaderboard_rank_of(INTEGER, TIMESTAMP WITH TIME ZONE) IS '주어진 점수 위치의 리더보드 순위 계산';
+COMMENT ON FUNCTION get_user_rank(UUID) IS '특정 사용자의 현재 순위 조회 (인덱스 기반)';
+COMMENT ON FUNCTION get_user_rank_by_nickname(VARCHAR) IS '닉네임으로 현재 순위 조회 (인덱스 기반)';
+COMMENT ON FUNCTION get_top_rankers(INTEGER) IS '상위 N명의 랭커 조회 (인덱스 기반)';
@@ -0,0 +1,92 @@
+-- ============================================
+-- Migration: 007_realtime_leaderboard
+-- Description: 리더보드 실시간 delta push 지원
+-- Reason: 클라이언트가 30초마다 폴링하는 대신 Realtime 변경분으로
+--         React Query 캐시를 직접 갱신 (users 변경 행으로 로컬 재정렬)
+-- Created: 2025-11-11
+-- ============================================
+
+-- ============================================
+-- Step 1: Realtime publication에 테이블 추가
+-- ============================================
+-- donations INSERT → 최근 기부 목록에 추가
+-- users INSERT/UPDATE → 트리거가 갱신한 통계로 순위 재계산
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM pg_publication_tables
+    WHERE pubname = 'supabase_realtime' AND schemaname = 'public' AND tablename = 'donations'
+  ) THEN
+    ALTER PUBLICATION supabase_realtime ADD TABLE donations;
+  END IF;
+
+  IF NOT EXISTS (
+    SELECT 1 FROM pg_publication_tables
+    WHERE pubname = 'supabase_realtime' AND schemaname = 'public' AND tablename = 'users'
+  ) THEN
+    ALTER PUBLICATION supabase_realtime ADD TABLE users;
+  END IF;
+END $$;
+
+-- ============================================
+-- Step 2: leaderboard 뷰에 first_donation_at 추가
+-- ============================================
+-- 클라이언트 로컬 재정렬 시 동점자 순서(first_donation_at ASC) 판단에 필요
+CREATE OR REPLACE VIEW leaderboard AS
+SELECT
+  u.id,
+  u.nickname,
+  u.total_donated,
+  RANK() OVER (ORDER BY u.total_donated DESC, u.first_donation_at ASC) as rank,
+  u.last_donation_at,
+  u.badge_earned,
+  u.donation_count::BIGINT as donation_count,
+  u.first_donation_at
+FROM users u
+WHERE u.total_donated > 0
+ORDER BY rank;
+
+-- ============================================
+-- Step 3: get_top_rankers 반환 컬럼에 first_donation_at 추가
+-- ============================================
+-- 반환 타입 변경은 CREATE OR REPLACE로 불가하므로 재생성
+-- (기존 컬럼은 그대로 유지, 마지막에 컬럼만 추가)
+DROP FUNCTION IF EXISTS get_top_rankers(INTEGER);
+
+CREATE OR REPLACE FUNCTION get_top_rankers(p_limit INTEGER DEFAULT 10)
+RETURNS TABLE (
+  id UUID,
+  nickname VARCHAR(12),
+  total_donated INTEGER,
+  rank BIGINT,
+  last_donation_at TIMESTAMP WITH TIME ZONE,
+  badge_earned BOOLEAN,
+  donation_count BIGINT,
+  first_donation_at TIMESTAMP WITH TIME ZONE
+) AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    t.id,
+    t.nickname,
+    t.total_donated,
+    RANK() OVER (ORDER BY t.total_donated DESC, t.first_donation_at ASC) as rank,
+    t.last_donation_at,
+    t.badge_earned,
+    t.donation_count::BIGINT,
+    t.first_donation_at
+  FROM (
+    SELECT u.*
+    FROM users u
+    WHERE u.total_donated > 0
+    ORDER BY u.total_donated DESC, u.first_donation_at ASC, u.id
+    LIMIT p_limit
+  ) t
+  ORDER BY t.total_donated DESC, t.first_donation_at ASC, t.id;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Comments 업데이트
+-- ============================================
+COMMENT ON FUNCTION get_top_rankers(INTEGER) IS '상위 N명의 랭커 조회 (인덱스 기반, 로컬 재정렬용 first_donation_at 포함)';
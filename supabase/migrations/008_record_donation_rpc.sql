@@ -0,0 +1,97 @@
+-- ============================================
+-- Migration: 008_record_donation_rpc
+-- Description: 기부 저장을 단일 트랜잭션 RPC로 통합
+-- Reason: 결제 후 영수증 중복 확인 → 사용자 조회/생성 → 기부 저장 → 사용자 재조회
+--         → 순위 조회까지 최대 6번의 순차 네트워크 왕복이 발생하고,
+--         클라이언트의 users.total_donated read-modify-write가 트리거와 경합함
+-- Created: 2025-11-12
+-- ============================================
+
+-- ============================================
+-- Step 1: 트리거를 단일 UPSERT로 변경
+-- ============================================
+-- 같은 신규 닉네임으로 동시에 기부가 들어와도
+-- UPDATE → NOT FOUND → INSERT 사이 경합으로 unique 위반이 나지 않도록 함
+CREATE OR REPLACE FUNCTION update_user_donation_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO users (nickname, total_donated, donation_count, first_donation_at, last_donation_at, badge_earned)
+  VALUES (NEW.nickname, NEW.amount, 1, NEW.created_at, NEW.created_at, TRUE)
+  ON CONFLICT (nickname) DO UPDATE
+  SET
+    total_donated = users.total_donated + EXCLUDED.total_donated,
+    donation_count = users.donation_count + 1,
+    last_donation_at = EXCLUDED.last_donation_at,
+    first_donation_at = COALESCE(users.first_donation_at, EXCLUDED.first_donation_at),
+    badge_earned = CASE
+      WHEN users.first_donation_at IS NULL THEN TRUE  -- 첫 기부 시 배지 획득
+      ELSE users.badge_earned
+    END;
+
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================
+-- Function: record_donation
+-- Description: 영수증 기준 멱등 기부 저장 + 갱신된 사용자/첫 기부 여부/순위 반환
+-- Note: 트리거의 users 행 잠금이 커밋까지 유지되므로 동일 닉네임의
+--       동시 기부는 직렬화되며, 반환되는 통계는 이 기부까지 반영된 값임
+--       이미 저장된 영수증이면 is_duplicate = TRUE와 기존 기부 정보를 반환
+-- ============================================
+CREATE OR REPLACE FUNCTION record_donation(
+  p_nickname VARCHAR(12),
+  p_receipt_token TEXT,
+  p_platform VARCHAR(20) DEFAULT 'google_play',
+  p_transaction_id TEXT DEFAULT NULL,
+  p_amount INTEGER DEFAULT 1000
+)
+RETURNS TABLE (
+  donation_id UUID,
+  donation_created_at TIMESTAMP WITH TIME ZONE,
+  is_duplicate BOOLEAN,
+  is_first_donation BOOLEAN,
+  user_data JSONB,
+  rank BIGINT
+) AS $$
+DECLARE
+  v_donation donations%ROWTYPE;
+  v_user users%ROWTYPE;
+  v_is_duplicate BOOLEAN := FALSE;
+BEGIN
+  INSERT INTO donations (nickname, amount, receipt_token, platform, transaction_id)
+  VALUES (p_nickname, p_amount, p_receipt_token, p_platform, p_transaction_id)
+  ON CONFLICT (receipt_token) DO NOTHING
+  RETURNING * INTO v_donation;
+
+  IF NOT FOUND THEN
+    v_is_duplicate := TRUE;
+
+    SELECT * INTO v_donation
+    FROM donations d
+    WHERE d.receipt_token = p_receipt_token;
+  END IF;
+
+  -- 영수증이 다른 닉네임으로 저장된 경우에도 실제 기부자의 통계를 반환
+  SELECT * INTO v_user
+  FROM users u
+  WHERE u.nickname = v_donation.nickname;
+
+  RETURN QUERY
+  SELECT
+    v_donation.id,
+    v_donation.created_at,
+    v_is_duplicate,
+    (NOT v_is_duplicate AND v_user.donation_count = 1),
+    to_jsonb(v_user),
+    leaderboard_rank_of(v_user.total_donated, v_user.first_donation_at);
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION record_donation(VARCHAR, TEXT, VARCHAR, TEXT, INTEGER) TO anon, authenticated;
+
+-- ============================================
+-- Comments 업데이트
+-- ============================================
+COMMENT ON FUNCTION update_user_donation_stats() IS '기부 발생 시 nickname으로 users 통계(금액/횟수) 자동 UPSERT';
+COMMENT ON FUNCTION record_donation(VARCHAR, TEXT, VARCHAR, TEXT, INTEGER) IS '영수증 기준 멱등 기부 저장 (갱신된 사용자, 첫 기부 여부, 순위 반환)';
@@ -0,0 +1,234 @@
+-- ============================================
+-- Migration: 009_keyset_leaderboard
+-- Description: 커서(keyset) 기반 리더보드 페이지 조회 및 "내 순위로 이동" RPC
+-- Reason: leaderboard 뷰의 .range(offset, ...)는 offset이 커질수록 느려지고,
+--         getRankingsAroundUser는 순위 조회 + 범위 조회 2번의 쿼리가 필요함
+-- Created: 2025-11-13
+-- ============================================
+
+-- ============================================
+-- Function: get_leaderboard_page
+-- Description: (total_donated DESC, first_donation_at ASC, id ASC) 커서 기준 페이지 조회
+--
+-- 커서는 이전 페이지 경계 행의 (total_donated, first_donation_at, id, rank, position)
+-- - p_before = FALSE: 커서 다음 행들 (아래로 스크롤)
+-- - p_before = TRUE : 커서 이전 행들 (위로 스크롤), 결과는 항상 순위 오름차순
+-- - 커서가 NULL이면 1위부터 조회
+--
+-- 두 범위(같은 금액 내 나머지 / 다음 금액 구간)를 각각 idx_users_leaderboard
+-- 범위 스캔 + LIMIT으로 읽으므로 페이지 비용은 깊이와 무관하게 p_limit에 비례
+--
+-- position은 전체 정렬에서의 1부터 시작하는 행 번호 (다음 커서 생성용)
+-- rank는 RANK() 의미이며, 페이지 첫 행과 같은 점수 그룹만 별도로 계산하고
+-- 나머지는 position으로부터 도출 (첫 행 이후의 점수 그룹은 페이지 안에서 시작하므로)
+-- ============================================
+CREATE OR REPLACE FUNCTION get_leaderboard_page(
+  p_cursor_total INTEGER DEFAULT NULL,
+  p_cursor_first_donation_at TIMESTAMP WITH TIME ZONE DEFAULT NULL,
+  p_cursor_id UUID DEFAULT NULL,
+  p_cursor_rank BIGINT DEFAULT NULL,
+  p_cursor_position BIGINT DEFAULT NULL,
+  p_limit INTEGER DEFAULT 50,
+  p_before BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (
+  id UUID,
+  nickname VARCHAR(12),
+  total_donated INTEGER,
+  rank BIGINT,
+  last_donation_at TIMESTAMP WITH TIME ZONE,
+  badge_earned BOOLEAN,
+  donation_count BIGINT,
+  first_donation_at TIMESTAMP WITH TIME ZONE,
+  "position" BIGINT
+) AS $$
+#variable_conflict use_column
+BEGIN
+  IF p_before AND p_cursor_total IS NULL THEN
+    RETURN;
+  END IF;
+
+  RETURN QUERY
+  WITH
+  -- 아래 방향: 커서 다음 p_limit개
+  fwd AS (
+    SELECT x.* FROM (
+      (
+        -- 커서와 같은 금액 구간의 나머지
+        SELECT u.id, u.nickname, u.total_donated, u.first_donation_at,
+               u.last_donation_at, u.badge_earned, u.donation_count
+        FROM users u
+        WHERE NOT p_before
+          AND p_cursor_total IS NOT NULL
+          AND u.total_donated > 0
+          AND u.total_donated = p_cursor_total
+          AND (u.first_donation_at, u.id) > (p_cursor_first_donation_at, p_cursor_id)
+        ORDER BY u.first_donation_at, u.id
+        LIMIT p_limit
+      )
+      UNION ALL
+      (
+        -- 커서보다 낮은 금액 구간
+        SELECT u.id, u.nickname, u.total_donated, u.first_donation_at,
+               u.last_donation_at, u.badge_earned, u.donation_count
+        FROM users u
+        WHERE NOT p_before
+          AND u.total_donated > 0
+          AND (p_cursor_total IS NULL OR u.total_donated < p_cursor_total)
+        ORDER BY u.total_donated DESC, u.first_donation_at, u.id
+        LIMIT p_limit
+      )
+    ) x
+    ORDER BY x.total_donated DESC, x.first_donation_at, x.id
+    LIMIT p_limit
+  ),
+  -- 위 방향: 커서 이전 p_limit개 (인덱스 역방향 스캔)
+  bwd AS (
+    SELECT x.* FROM (
+      (
+        -- 커서와 같은 금액 구간의 앞부분
+        SELECT u.id, u.nickname, u.total_donated, u.first_donation_at,
+               u.last_donation_at, u.badge_earned, u.donation_count
+        FROM users u
+        WHERE p_before
+          AND u.total_donated > 0
+          AND u.total_donated = p_cursor_total
+          AND (u.first_donation_at, u.id) < (p_cursor_first_donation_at, p_cursor_id)
+        ORDER BY u.first_donation_at DESC, u.id DESC
+        LIMIT p_limit
+      )
+      UNION ALL
+      (
+        -- 커서보다 높은 금액 구간
+        SELECT u.id, u.nickname, u.total_donated, u.first_donation_at,
+               u.last_donation_at, u.badge_earned, u.donation_count
+        FROM users u
+        WHERE p_before
+          AND u.total_donated > 0
+          AND u.total_donated > p_cursor_total
+        ORDER BY u.total_donated ASC, u.first_donation_at DESC, u.id DESC
+        LIMIT p_limit
+      )
+    ) x
+    ORDER BY x.total_donated ASC, x.first_donation_at DESC, x.id DESC
+    LIMIT p_limit
+  ),
+  numbered AS (
+    SELECT
+      pg.*,
+      ROW_NUMBER() OVER (ORDER BY pg.total_donated DESC, pg.first_donation_at, pg.id) AS rn,
+      RANK() OVER (ORDER BY pg.total_donated DESC, pg.first_donation_at) AS page_rank,
+      COUNT(*) OVER () AS cnt
+    FROM (SELECT * FROM fwd UNION ALL SELECT * FROM bwd) pg
+  ),
+  -- 페이지 첫 행의 position / rank
+  head AS (
+    SELECT
+      n.total_donated AS head_total,
+      n.first_donation_at AS head_at,
+      CASE
+        WHEN p_before THEN p_cursor_position - n.cnt
+        ELSE COALESCE(p_cursor_position, 0) + 1
+      END AS head_position,
+      CASE
+        -- 첫 행의 점수 그룹은 페이지 위쪽에서 시작했을 수 있으므로 직접 계산
+        WHEN p_before THEN leaderboard_rank_of(n.total_donated, n.first_donation_at)
+        -- 첫 행이 커서와 같은 점수면 커서 순위를 이어받음
+        WHEN n.total_donated = p_cursor_total
+          AND n.first_donation_at = p_cursor_first_donation_at THEN p_cursor_rank
+        ELSE COALESCE(p_cursor_position, 0) + 1
+      END AS head_rank
+    FROM numbered n
+    WHERE n.rn = 1
+  )
+  SELECT
+    n.id,
+    n.nickname,
+    n.total_donated,
+    CASE
+      WHEN n.total_donated = h.head_total AND n.first_donation_at = h.head_at THEN h.head_rank
+      ELSE h.head_position - 1 + n.page_rank
+    END,
+    n.last_donation_at,
+    n.badge_earned,
+    n.donation_count::BIGINT,
+    n.first_donation_at,
+    h.head_position - 1 + n.rn
+  FROM numbered n
+  CROSS JOIN head h
+  ORDER BY n.rn;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Function: get_leaderboard_around_user
+-- Description: 특정 사용자 위아래 N명씩 한 번의 호출로 조회 ("내 순위로 이동")
+-- ============================================
+CREATE OR REPLACE FUNCTION get_leaderboard_around_user(
+  p_nickname VARCHAR(12),
+  p_range INTEGER DEFAULT 5
+)
+RETURNS TABLE (
+  id UUID,
+  nickname VARCHAR(12),
+  total_donated INTEGER,
+  rank BIGINT,
+  last_donation_at TIMESTAMP WITH TIME ZONE,
+  badge_earned BOOLEAN,
+  donation_count BIGINT,
+  first_donation_at TIMESTAMP WITH TIME ZONE,
+  "position" BIGINT
+) AS $$
+DECLARE
+  v_user users%ROWTYPE;
+  v_rank BIGINT;
+  v_position BIGINT;
+BEGIN
+  SELECT * INTO v_user
+  FROM users u
+  WHERE u.nickname = p_nickname
+    AND u.total_donated > 0;
+
+  IF NOT FOUND THEN
+    RETURN;
+  END IF;
+
+  v_rank := leaderboard_rank_of(v_user.total_donated, v_user.first_donation_at);
+
+  -- 같은 점수의 동점자 중 id가 앞서는 사용자 수만큼 position이 밀림
+  SELECT v_rank + COUNT(*) INTO v_position
+  FROM users u
+  WHERE u.total_donated > 0
+    AND u.total_donated = v_user.total_donated
+    AND u.first_donation_at = v_user.first_donation_at
+    AND u.id < v_user.id;
+
+  RETURN QUERY
+  SELECT * FROM get_leaderboard_page(
+    v_user.total_donated, v_user.first_donation_at, v_user.id, v_rank, v_position, p_range, TRUE
+  );
+
+  RETURN QUERY
+  SELECT
+    v_user.id,
+    v_user.nickname,
+    v_user.total_donated,
+    v_rank,
+    v_user.last_donation_at,
+    v_user.badge_earned,
+    v_user.donation_count::BIGINT,
+    v_user.first_donation_at,
+    v_position;
+
+  RETURN QUERY
+  SELECT * FROM get_leaderboard_page(
+    v_user.total_donated, v_user.first_donation_at, v_user.id, v_rank, v_position, p_range, FALSE
+  );
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Comments
+-- ============================================
+COMMENT ON FUNCTION get_leaderboard_page(INTEGER, TIMESTAMP WITH TIME ZONE, UUID, BIGINT, BIGINT, INTEGER, BOOLEAN) IS '커서(keyset) 기반 리더보드 페이지 조회';
+COMMENT ON FUNCTION get_leaderboard_around_user(VARCHAR, INTEGER) IS '사용자 주변 순위 조회 (단일 호출)';
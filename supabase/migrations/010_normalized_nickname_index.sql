@@ -0,0 +1,313 @@
+-- ============================================
+-- Migration: 010_normalized_nickname_index
+-- Description: 정규화된 닉네임 고유 인덱스 + 중복 확인/추천 RPC + 기부 UPSERT/조회를 정규화 키 기준으로 변경
+-- Reason: users.nickname은 대소문자/전각·반각을 구분하는 정확 일치라
+--         'Tester', 'tester', 'ｔｅｓｔｅｒ'가 모두 별개의 닉네임으로 통과함
+-- Created: 2025-11-14
+-- ============================================
+
+-- ============================================
+-- Function: normalize_nickname
+-- Description: 닉네임 비교용 정규화 키
+-- - NFKC: 전각/반각, 호환 문자 통합 (ｔｅｓｔ → test, 전각 공백 U+3000 → ' ')
+-- - btrim: 앞뒤 ASCII 공백(' ') 제거 — NFKC 이후에 적용해야 전각 공백도 제거됨
+-- - lower: 대소문자 통합
+-- 클라이언트 src/utils/nicknameNormalize.ts의 normalizeNickname과 동일한 순서/공백 집합
+-- ============================================
+CREATE OR REPLACE FUNCTION normalize_nickname(p_nickname TEXT)
+RETURNS TEXT AS $$
+  SELECT lower(btrim(normalize(p_nickname, NFKC)));
+$$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+
+-- ============================================
+-- Step 1: 기존 데이터 충돌 확인
+-- ============================================
+-- 정규화 후 겹치는 닉네임이 있으면 고유 인덱스를 만들 수 없으므로
+-- 충돌 목록과 함께 중단 (운영자가 직접 정리 후 재실행)
+DO $$
+DECLARE
+  v_conflicts TEXT;
+BEGIN
+  SELECT string_agg(format('%s: %s', k.key, k.nicknames), E'\n')
+  INTO v_conflicts
+  FROM (
+    SELECT normalize_nickname(nickname) AS key, string_agg(nickname, ', ') AS nicknames
+    FROM users
+    WHERE nickname IS NOT NULL
+    GROUP BY normalize_nickname(nickname)
+    HAVING COUNT(*) > 1
+  ) k;
+
+  IF v_conflicts IS NOT NULL THEN
+    RAISE EXCEPTION E'정규화 후 중복되는 닉네임이 있습니다:\n%', v_conflicts;
+  END IF;
+END $$;
+
+-- ============================================
+-- Step 2: 정규화 고유 인덱스
+-- ============================================
+-- 새로운 근사 중복 닉네임은 DB 레벨에서 거부되고,
+-- 중복 확인은 이 인덱스에 대한 단일 조회로 처리됨
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_nickname_normalized
+  ON users (normalize_nickname(nickname));
+
+-- ============================================
+-- Step 3: 트리거 UPSERT를 정규화 키 기준으로 변경
+-- ============================================
+-- 닉네임은 온보딩 시 기기에만 저장되고 users 행은 첫 기부 때 생성되므로,
+-- 기부 전에 'Tester' / 'tester'를 각각 고른 기기나 이 마이그레이션 이전에 고른 변형 닉네임도
+-- 기부할 수 있어야 함. ON CONFLICT (nickname)이면 정규화 인덱스에서 unique 위반(23505)이
+-- 나므로 정규화 키로 충돌을 판정하여 기존(정규) 행에 누적
+CREATE OR REPLACE FUNCTION update_user_donation_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO users (nickname, total_donated, donation_count, first_donation_at, last_donation_at, badge_earned)
+  VALUES (NEW.nickname, NEW.amount, 1, NEW.created_at, NEW.created_at, TRUE)
+  ON CONFLICT ((normalize_nickname(nickname))) DO UPDATE
+  SET
+    total_donated = users.total_donated + EXCLUDED.total_donated,
+    donation_count = users.donation_count + 1,
+    last_donation_at = EXCLUDED.last_donation_at,
+    first_donation_at = COALESCE(users.first_donation_at, EXCLUDED.first_donation_at),
+    badge_earned = CASE
+      WHEN users.first_donation_at IS NULL THEN TRUE  -- 첫 기부 시 배지 획득
+      ELSE users.badge_earned
+    END;
+
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================
+-- Function: record_donation (재정의)
+-- Description: 008과 동일, 기부자 조회만 정규화 키 기준
+-- (donations.nickname은 입력 그대로이고 users 행은 처음 저장된 표기일 수 있음)
+-- ============================================
+CREATE OR REPLACE FUNCTION record_donation(
+  p_nickname VARCHAR(12),
+  p_receipt_token TEXT,
+  p_platform VARCHAR(20) DEFAULT 'google_play',
+  p_transaction_id TEXT DEFAULT NULL,
+  p_amount INTEGER DEFAULT 1000
+)
+RETURNS TABLE (
+  donation_id UUID,
+  donation_created_at TIMESTAMP WITH TIME ZONE,
+  is_duplicate BOOLEAN,
+  is_first_donation BOOLEAN,
+  user_data JSONB,
+  rank BIGINT
+) AS $$
+DECLARE
+  v_donation donations%ROWTYPE;
+  v_user users%ROWTYPE;
+  v_is_duplicate BOOLEAN := FALSE;
+BEGIN
+  INSERT INTO donations (nickname, amount, receipt_token, platform, transaction_id)
+  VALUES (p_nickname, p_amount, p_receipt_token, p_platform, p_transaction_id)
+  ON CONFLICT (receipt_token) DO NOTHING
+  RETURNING * INTO v_donation;
+
+  IF NOT FOUND THEN
+    v_is_duplicate := TRUE;
+
+    SELECT * INTO v_donation
+    FROM donations d
+    WHERE d.receipt_token = p_receipt_token;
+  END IF;
+
+  -- 영수증이 다른 닉네임으로 저장된 경우에도 실제 기부자의 통계를 반환
+  SELECT * INTO v_user
+  FROM users u
+  WHERE normalize_nickname(u.nickname) = normalize_nickname(v_donation.nickname);
+
+  RETURN QUERY
+  SELECT
+    v_donation.id,
+    v_donation.created_at,
+    v_is_duplicate,
+    (NOT v_is_duplicate AND v_user.donation_count = 1),
+    to_jsonb(v_user),
+    leaderboard_rank_of(v_user.total_donated, v_user.first_donation_at);
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================
+-- Function: get_user_rank_by_nickname (재정의)
+-- Description: 006과 동일, 정규화 키로 조회 (기기에 저장된 표기가 users 행과 달라도 조회됨)
+-- ============================================
+CREATE OR REPLACE FUNCTION get_user_rank_by_nickname(p_nickname VARCHAR(12))
+RETURNS TABLE (
+  rank BIGINT,
+  total_donated INTEGER,
+  nickname VARCHAR(12)
+) AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    leaderboard_rank_of(u.total_donated, u.first_donation_at),
+    u.total_donated,
+    u.nickname
+  FROM users u
+  WHERE normalize_nickname(u.nickname) = normalize_nickname(p_nickname)
+    AND u.total_donated > 0;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Function: get_leaderboard_around_user (재정의)
+-- Description: 009와 동일, 기준 사용자를 정규화 키로 조회
+-- ============================================
+CREATE OR REPLACE FUNCTION get_leaderboard_around_user(
+  p_nickname VARCHAR(12),
+  p_range INTEGER DEFAULT 5
+)
+RETURNS TABLE (
+  id UUID,
+  nickname VARCHAR(12),
+  total_donated INTEGER,
+  rank BIGINT,
+  last_donation_at TIMESTAMP WITH TIME ZONE,
+  badge_earned BOOLEAN,
+  donation_count BIGINT,
+  first_donation_at TIMESTAMP WITH TIME ZONE,
+  "position" BIGINT
+) AS $$
+DECLARE
+  v_user users%ROWTYPE;
+  v_rank BIGINT;
+  v_position BIGINT;
+BEGIN
+  SELECT * INTO v_user
+  FROM users u
+  WHERE normalize_nickname(u.nickname) = normalize_nickname(p_nickname)
+    AND u.total_donated > 0;
+
+  IF NOT FOUND THEN
+    RETURN;
+  END IF;
+
+  v_rank := leaderboard_rank_of(v_user.total_donated, v_user.first_donation_at);
+
+  -- 같은 점수의 동점자 중 id가 앞서는 사용자 수만큼 position이 밀림
+  SELECT v_rank + COUNT(*) INTO v_position
+  FROM users u
+  WHERE u.total_donated > 0
+    AND u.total_donated = v_user.total_donated
+    AND u.first_donation_at = v_user.first_donation_at
+    AND u.id < v_user.id;
+
+  RETURN QUERY
+  SELECT * FROM get_leaderboard_page(
+    v_user.total_donated, v_user.first_donation_at, v_user.id, v_rank, v_position, p_range, TRUE
+  );
+
+  RETURN QUERY
+  SELECT
+    v_user.id,
+    v_user.nickname,
+    v_user.total_donated,
+    v_rank,
+    v_user.last_donation_at,
+    v_user.badge_earned,
+    v_user.donation_count::BIGINT,
+    v_user.first_donation_at,
+    v_position;
+
+  RETURN QUERY
+  SELECT * FROM get_leaderboard_page(
+    v_user.total_donated, v_user.first_donation_at, v_user.id, v_rank, v_position, p_range, FALSE
+  );
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Function: check_nickname_available (재정의)
+-- Description: 정규화 키 기준 닉네임 사용 가능 여부 (인덱스 단일 조회)
+-- ============================================
+CREATE OR REPLACE FUNCTION check_nickname_available(p_nickname VARCHAR(12))
+RETURNS BOOLEAN AS $$
+  SELECT NOT EXISTS(
+    SELECT 1 FROM users u
+    WHERE normalize_nickname(u.nickname) = normalize_nickname(p_nickname)
+  );
+$$ LANGUAGE sql STABLE;
+
+-- ============================================
+-- Function: check_nicknames_available
+-- Description: 여러 닉네임의 사용 가능 여부 + 사용 중인 닉네임의 대체 추천을 한 번에 조회
+--
+-- 추천은 원래 닉네임을 접두어로 두고 숫자를 붙인 후보(최대 12자) 중
+-- 사용 가능한 것을 앞에서부터 p_suggestion_count개 반환
+-- 후보 하나당 인덱스 단일 조회이며, 후보 수는 고정(MAX_CANDIDATES)이라 비용이 제한됨
+-- ============================================
+CREATE OR REPLACE FUNCTION check_nicknames_available(
+  p_nicknames TEXT[],
+  p_suggestion_count INTEGER DEFAULT 3
+)
+RETURNS TABLE (
+  nickname TEXT,
+  is_available BOOLEAN,
+  suggestions TEXT[]
+) AS $$
+#variable_conflict use_column
+DECLARE
+  MAX_NICKNAMES CONSTANT INTEGER := 20;
+  MAX_CANDIDATES CONSTANT INTEGER := 30;
+BEGIN
+  IF cardinality(p_nicknames) > MAX_NICKNAMES THEN
+    RAISE EXCEPTION 'check_nicknames_available: 최대 %개까지 조회할 수 있습니다', MAX_NICKNAMES;
+  END IF;
+
+  RETURN QUERY
+  SELECT
+    req.name,
+    avail.is_available,
+    CASE
+      WHEN avail.is_available OR p_suggestion_count <= 0 THEN ARRAY[]::TEXT[]
+      ELSE ARRAY(
+        SELECT cand.name
+        FROM (
+          -- 앞 후보는 순서대로(1, 2, ...), 뒤 후보는 임의 두 자리 숫자
+          SELECT
+            left(btrim(req.name), 12 - length(sfx.suffix)) || sfx.suffix AS name,
+            sfx.ord
+          FROM (
+            SELECT n::TEXT AS suffix, n AS ord
+            FROM generate_series(1, MAX_CANDIDATES / 2) n
+            UNION ALL
+            SELECT (10 + floor(random() * 90))::INTEGER::TEXT, MAX_CANDIDATES / 2 + n
+            FROM generate_series(1, MAX_CANDIDATES / 2) n
+          ) sfx
+        ) cand
+        WHERE length(cand.name) >= 2
+          AND NOT EXISTS (
+            SELECT 1 FROM users u
+            WHERE normalize_nickname(u.nickname) = normalize_nickname(cand.name)
+          )
+        GROUP BY cand.name
+        ORDER BY MIN(cand.ord)
+        LIMIT p_suggestion_count
+      )
+    END
+  FROM unnest(p_nicknames) WITH ORDINALITY AS req(name, ord)
+  CROSS JOIN LATERAL (
+    SELECT NOT EXISTS(
+      SELECT 1 FROM users u
+      WHERE normalize_nickname(u.nickname) = normalize_nickname(req.name)
+    ) AS is_available
+  ) avail
+  ORDER BY req.ord;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+GRANT EXECUTE ON FUNCTION check_nickname_available(VARCHAR) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION check_nicknames_available(TEXT[], INTEGER) TO anon, authenticated;
+
+-- ============================================
+-- Comments
+-- ============================================
+COMMENT ON FUNCTION update_user_donation_stats() IS '기부 발생 시 정규화 닉네임 기준으로 users 통계(금액/횟수) 자동 UPSERT';
+COMMENT ON FUNCTION normalize_nickname(TEXT) IS '닉네임 비교용 정규화 키 (NFKC → 앞뒤 공백 제거 → 소문자)';
+COMMENT ON FUNCTION check_nickname_available(VARCHAR) IS '닉네임 사용 가능 여부 확인 (대소문자/전각·반각 무시)';
+COMMENT ON FUNCTION check_nicknames_available(TEXT[], INTEGER) IS '여러 닉네임 사용 가능 여부 + 대체 닉네임 추천 (단일 호출)';
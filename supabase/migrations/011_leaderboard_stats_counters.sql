@@ -0,0 +1,265 @@
+-- ============================================
+-- Migration: 011_leaderboard_stats_counters
+-- Description: 리더보드 통계를 트리거로 유지되는 카운터 테이블로 전환
+-- Reason: get_leaderboard_stats()는 004에서 삭제된 donations.user_id로 JOIN하여
+--         동작하지 않으며, 동작하더라도 호출마다 users/donations 전체 스캔이 필요함
+-- Created: 2025-11-15
+-- Note: 다른 마이그레이션과 달리 명시적 BEGIN/COMMIT으로 감쌈
+--       백필 잠금(LOCK TABLE)은 트랜잭션 안에서만 가능하고, 트리거 교체까지
+--       잠금을 유지해야 하므로 전체를 하나의 트랜잭션으로 실행
+--       (SQL Editor / supabase CLI / psql -f 어느 경로로 실행해도 동일하게 동작)
+--       재실행 가능 (IF NOT EXISTS / DROP ... IF EXISTS / CREATE OR REPLACE)
+-- ============================================
+
+BEGIN;
+
+-- ============================================
+-- Step 1: 카운터 테이블
+-- ============================================
+
+-- 전체 누적 통계 (항상 단일 행)
+CREATE TABLE IF NOT EXISTS leaderboard_stats (
+  id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+  total_users BIGINT NOT NULL DEFAULT 0,
+  total_donations_count BIGINT NOT NULL DEFAULT 0,
+  total_amount_donated BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- 시간 단위 통계 (추이 표시용, UTC 기준 구간)
+CREATE TABLE IF NOT EXISTS donation_stats_buckets (
+  bucket_type VARCHAR(4) NOT NULL CHECK (bucket_type IN ('hour', 'day')),
+  bucket_start TIMESTAMP WITH TIME ZONE NOT NULL,
+  donations_count BIGINT NOT NULL DEFAULT 0,
+  amount_donated BIGINT NOT NULL DEFAULT 0,
+  new_users BIGINT NOT NULL DEFAULT 0,
+  PRIMARY KEY (bucket_type, bucket_start)
+);
+
+-- 읽기는 누구나, 쓰기는 트리거(SECURITY DEFINER)만
+ALTER TABLE leaderboard_stats ENABLE ROW LEVEL SECURITY;
+ALTER TABLE donation_stats_buckets ENABLE ROW LEVEL SECURITY;
+
+-- 중복 실행 방지
+DROP POLICY IF EXISTS "Anyone can read leaderboard stats" ON leaderboard_stats;
+DROP POLICY IF EXISTS "Anyone can read donation stats buckets" ON donation_stats_buckets;
+
+CREATE POLICY "Anyone can read leaderboard stats"
+  ON leaderboard_stats
+  FOR SELECT
+  USING (true);
+
+CREATE POLICY "Anyone can read donation stats buckets"
+  ON donation_stats_buckets
+  FOR SELECT
+  USING (true);
+
+-- ============================================
+-- Function: refresh_leaderboard_stats
+-- Description: 원본 테이블로부터 카운터 전체 재계산
+-- 마이그레이션 백필과 donations/users 삭제 시(관리/테스트 데이터 정리)에만 사용
+-- ============================================
+CREATE OR REPLACE FUNCTION refresh_leaderboard_stats()
+RETURNS VOID AS $$
+BEGIN
+  INSERT INTO leaderboard_stats (id, total_users, total_donations_count, total_amount_donated, updated_at)
+  SELECT
+    TRUE,
+    (SELECT COUNT(*) FROM users u WHERE u.total_donated > 0),
+    COUNT(*),
+    COALESCE(SUM(d.amount), 0),
+    NOW()
+  FROM donations d
+  ON CONFLICT (id) DO UPDATE
+  SET
+    total_users = EXCLUDED.total_users,
+    total_donations_count = EXCLUDED.total_donations_count,
+    total_amount_donated = EXCLUDED.total_amount_donated,
+    updated_at = EXCLUDED.updated_at;
+
+  -- WHERE 없는 DELETE를 막는 pg_safeupdate 환경(PostgREST 경유 호출)에서도 동작하도록 명시
+  DELETE FROM donation_stats_buckets WHERE TRUE;
+
+  INSERT INTO donation_stats_buckets (bucket_type, bucket_start, donations_count, amount_donated, new_users)
+  SELECT b.bucket_type, b.bucket_start, SUM(b.donations_count), SUM(b.amount_donated), SUM(b.new_users)
+  FROM (
+    SELECT t.bucket_type, date_trunc(t.bucket_type, d.created_at, 'UTC') AS bucket_start,
+           1 AS donations_count, d.amount AS amount_donated, 0 AS new_users
+    FROM donations d
+    CROSS JOIN (VALUES ('hour'), ('day')) t(bucket_type)
+    UNION ALL
+    SELECT t.bucket_type, date_trunc(t.bucket_type, u.first_donation_at, 'UTC'),
+           0, 0, 1
+    FROM users u
+    CROSS JOIN (VALUES ('hour'), ('day')) t(bucket_type)
+    WHERE u.total_donated > 0
+      AND u.first_donation_at IS NOT NULL
+  ) b
+  GROUP BY b.bucket_type, b.bucket_start;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION refresh_leaderboard_stats() FROM PUBLIC, anon, authenticated;
+
+-- ============================================
+-- Step 2: 백필
+-- ============================================
+-- 백필과 트리거 교체 사이에 들어오는 기부가 누락되지 않도록 잠금
+LOCK TABLE donations IN SHARE ROW EXCLUSIVE MODE;
+
+SELECT refresh_leaderboard_stats();
+
+-- ============================================
+-- Step 3: 기부 트리거에서 카운터 증분
+-- ============================================
+-- users → leaderboard_stats → donation_stats_buckets 순서로 항상 같은 순서로
+-- 잠그므로 동시 기부 간 교착 상태 없음
+-- leaderboard_stats 단일 행은 기부 트랜잭션 커밋까지 잠기므로 기부는 이 행에서 직렬화됨
+-- (기부 1건 = 결제 1건이라 쓰기 빈도가 낮아 허용 가능)
+-- 사용자 UPSERT는 010과 같이 정규화 닉네임 기준
+CREATE OR REPLACE FUNCTION update_user_donation_stats()
+RETURNS TRIGGER AS $$
+DECLARE
+  v_donation_count INTEGER;
+  v_new_users INTEGER;
+BEGIN
+  INSERT INTO users (nickname, total_donated, donation_count, first_donation_at, last_donation_at, badge_earned)
+  VALUES (NEW.nickname, NEW.amount, 1, NEW.created_at, NEW.created_at, TRUE)
+  ON CONFLICT ((normalize_nickname(nickname))) DO UPDATE
+  SET
+    total_donated = users.total_donated + EXCLUDED.total_donated,
+    donation_count = users.donation_count + 1,
+    last_donation_at = EXCLUDED.last_donation_at,
+    first_donation_at = COALESCE(users.first_donation_at, EXCLUDED.first_donation_at),
+    badge_earned = CASE
+      WHEN users.first_donation_at IS NULL THEN TRUE  -- 첫 기부 시 배지 획득
+      ELSE users.badge_earned
+    END
+  RETURNING donation_count INTO v_donation_count;
+
+  -- 첫 기부면 리더보드 사용자 수 증가
+  v_new_users := CASE WHEN v_donation_count = 1 THEN 1 ELSE 0 END;
+
+  UPDATE leaderboard_stats
+  SET
+    total_users = total_users + v_new_users,
+    total_donations_count = total_donations_count + 1,
+    total_amount_donated = total_amount_donated + NEW.amount,
+    updated_at = NOW()
+  WHERE id;
+
+  INSERT INTO donation_stats_buckets AS b (bucket_type, bucket_start, donations_count, amount_donated, new_users)
+  VALUES
+    ('hour', date_trunc('hour', NEW.created_at, 'UTC'), 1, NEW.amount, v_new_users),
+    ('day', date_trunc('day', NEW.created_at, 'UTC'), 1, NEW.amount, v_new_users)
+  ON CONFLICT (bucket_type, bucket_start) DO UPDATE
+  SET
+    donations_count = b.donations_count + EXCLUDED.donations_count,
+    amount_donated = b.amount_donated + EXCLUDED.amount_donated,
+    new_users = b.new_users + EXCLUDED.new_users;
+
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- ============================================
+-- Step 4: 삭제 시 재계산
+-- ============================================
+-- 기부/사용자 삭제는 관리 작업(테스트 데이터 정리 등)에서만 발생하므로
+-- 증분 대신 문장 단위로 한 번 재계산
+CREATE OR REPLACE FUNCTION refresh_leaderboard_stats_on_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+  PERFORM refresh_leaderboard_stats();
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS trigger_refresh_stats_on_donation_delete ON donations;
+CREATE TRIGGER trigger_refresh_stats_on_donation_delete
+  AFTER DELETE OR TRUNCATE ON donations
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION refresh_leaderboard_stats_on_delete();
+
+DROP TRIGGER IF EXISTS trigger_refresh_stats_on_user_delete ON users;
+CREATE TRIGGER trigger_refresh_stats_on_user_delete
+  AFTER DELETE OR TRUNCATE ON users
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION refresh_leaderboard_stats_on_delete();
+
+-- ============================================
+-- Function: get_leaderboard_stats (재정의)
+-- Description: 카운터 테이블 단일 행 조회 (기부량과 무관하게 O(1))
+-- ============================================
+CREATE OR REPLACE FUNCTION get_leaderboard_stats()
+RETURNS TABLE (
+  total_users BIGINT,
+  total_donations_count BIGINT,
+  total_amount_donated BIGINT,
+  average_donation INTEGER
+) AS $$
+  SELECT
+    s.total_users,
+    s.total_donations_count,
+    s.total_amount_donated,
+    CASE
+      WHEN s.total_donations_count > 0
+        THEN ROUND(s.total_amount_donated::NUMERIC / s.total_donations_count)::INTEGER
+      ELSE 0
+    END
+  FROM leaderboard_stats s
+  WHERE s.id;
+$$ LANGUAGE sql STABLE;
+
+-- ============================================
+-- Function: get_donation_trend
+-- Description: 최근 N개 구간(시간/일)의 기부 추이
+-- 기부가 없는 구간도 0으로 채워 항상 p_limit개를 시간 오름차순으로 반환
+-- (구간 하나당 기본 키 단일 조회)
+-- p_bucket은 date_trunc에 그대로 전달되므로 먼저 검증 (잘못된 값이면 명확한 오류)
+-- ============================================
+CREATE OR REPLACE FUNCTION get_donation_trend(
+  p_bucket VARCHAR(4) DEFAULT 'hour',
+  p_limit INTEGER DEFAULT 24
+)
+RETURNS TABLE (
+  bucket_start TIMESTAMP WITH TIME ZONE,
+  donations_count BIGINT,
+  amount_donated BIGINT,
+  new_users BIGINT
+) AS $$
+#variable_conflict use_column
+BEGIN
+  IF p_bucket IS NULL OR p_bucket NOT IN ('hour', 'day') THEN
+    RAISE EXCEPTION 'get_donation_trend: p_bucket은 hour 또는 day만 지원합니다 (입력: %)', p_bucket;
+  END IF;
+
+  RETURN QUERY
+  SELECT
+    s.bucket_start,
+    COALESCE(b.donations_count, 0),
+    COALESCE(b.amount_donated, 0),
+    COALESCE(b.new_users, 0)
+  FROM generate_series(
+    date_trunc(p_bucket, NOW(), 'UTC') - (LEAST(GREATEST(p_limit, 1), 168) - 1) * ('1 ' || p_bucket)::INTERVAL,
+    date_trunc(p_bucket, NOW(), 'UTC'),
+    ('1 ' || p_bucket)::INTERVAL
+  ) AS s(bucket_start)
+  LEFT JOIN donation_stats_buckets b
+    ON b.bucket_type = p_bucket
+   AND b.bucket_start = s.bucket_start
+  ORDER BY s.bucket_start;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Comments
+-- ============================================
+COMMENT ON TABLE leaderboard_stats IS '리더보드 전체 누적 통계 (단일 행, 기부 트리거로 증분)';
+COMMENT ON TABLE donation_stats_buckets IS '시간/일 단위 기부 통계 (UTC 구간, 기부 트리거로 증분)';
+COMMENT ON FUNCTION refresh_leaderboard_stats() IS '원본 테이블로부터 통계 카운터 전체 재계산';
+COMMENT ON FUNCTION update_user_donation_stats() IS '기부 발생 시 users 통계 UPSERT + 전체/구간 통계 카운터 증분';
+COMMENT ON FUNCTION get_leaderboard_stats() IS '리더보드 전체 통계 조회 (카운터 단일 행)';
+COMMENT ON FUNCTION get_donation_trend(VARCHAR, INTEGER) IS '최근 N개 구간의 기부 추이 (시간/일 단위)';
+
+COMMIT;
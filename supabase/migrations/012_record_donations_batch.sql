@@ -0,0 +1,86 @@
+-- ============================================
+-- Migration: 012_record_donations_batch
+-- Description: 오프라인 대기열(outbox)의 기부를 한 번에 저장하는 배치 RPC
+-- Reason: 네트워크가 복구되면 쌓여 있던 기부를 건별 왕복 없이 한 번의 호출로 전송하고,
+--         일부 항목이 실패해도 나머지는 저장되도록 항목별 결과를 반환
+-- Created: 2025-11-16
+-- ============================================
+
+-- ============================================
+-- Function: record_donations
+-- Description: record_donation을 항목마다 서브트랜잭션으로 실행
+--
+-- p_donations: [{ nickname, receipt_token, platform, transaction_id, amount }, ...]
+-- - 영수증 기준 멱등이므로 같은 항목을 다시 보내도 is_duplicate = TRUE로 응답
+-- - 항목 실패 시 해당 행만 error_code / error_message가 채워지고 나머지는 정상 저장
+-- - 결과는 입력 순서대로 반환
+-- ============================================
+CREATE OR REPLACE FUNCTION record_donations(p_donations JSONB)
+RETURNS TABLE (
+  receipt_token TEXT,
+  donation_id UUID,
+  donation_created_at TIMESTAMP WITH TIME ZONE,
+  is_duplicate BOOLEAN,
+  is_first_donation BOOLEAN,
+  user_data JSONB,
+  rank BIGINT,
+  error_code TEXT,
+  error_message TEXT
+) AS $$
+#variable_conflict use_column
+DECLARE
+  MAX_DONATIONS CONSTANT INTEGER := 50;
+  v_item JSONB;
+  v_result RECORD;
+BEGIN
+  IF jsonb_typeof(p_donations) IS DISTINCT FROM 'array' THEN
+    RAISE EXCEPTION 'record_donations: p_donations는 배열이어야 합니다';
+  END IF;
+
+  IF jsonb_array_length(p_donations) > MAX_DONATIONS THEN
+    RAISE EXCEPTION 'record_donations: 최대 %개까지 저장할 수 있습니다', MAX_DONATIONS;
+  END IF;
+
+  FOR v_item IN SELECT e.value FROM jsonb_array_elements(p_donations) AS e LOOP
+    receipt_token := v_item->>'receipt_token';
+    donation_id := NULL;
+    donation_created_at := NULL;
+    is_duplicate := NULL;
+    is_first_donation := NULL;
+    user_data := NULL;
+    rank := NULL;
+    error_code := NULL;
+    error_message := NULL;
+
+    BEGIN
+      SELECT * INTO v_result
+      FROM record_donation(
+        (v_item->>'nickname')::VARCHAR,
+        v_item->>'receipt_token',
+        COALESCE(v_item->>'platform', 'google_play')::VARCHAR,
+        v_item->>'transaction_id',
+        COALESCE((v_item->>'amount')::INTEGER, 1000)
+      );
+
+      donation_id := v_result.donation_id;
+      donation_created_at := v_result.donation_created_at;
+      is_duplicate := v_result.is_duplicate;
+      is_first_donation := v_result.is_first_donation;
+      user_data := v_result.user_data;
+      rank := v_result.rank;
+    EXCEPTION WHEN OTHERS THEN
+      error_code := SQLSTATE;
+      error_message := SQLERRM;
+    END;
+
+    RETURN NEXT;
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION record_donations(JSONB) TO anon, authenticated;
+
+-- ============================================
+-- Comments
+-- ============================================
+COMMENT ON FUNCTION record_donations(JSONB) IS '여러 기부를 영수증 기준 멱등 저장 (항목별 결과/오류 반환)';